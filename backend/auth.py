@@ -1,23 +1,61 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, BCRYPT_ROUNDS, BCRYPT_WORKERS, BCRYPT_THREAD_NICE
 
-# 비밀번호 해싱 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱 설정 (기존 해시는 비용이 달라도 그대로 검증된다)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+
+def _lower_thread_priority():
+    """bcrypt 스레드의 CPU 우선순위를 낮춘다 (Linux는 스레드마다 nice 값이 따로 있다)"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), BCRYPT_THREAD_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+# bcrypt는 해시 한 번에 수십~수백 ms 동안 CPU를 쓴다. 이벤트 루프에서 돌리면 그동안 모든 요청이 멈추므로
+# 크기가 정해진 스레드 풀에서 실행한다 (bcrypt C 확장은 해시 중 GIL을 놓는다).
+# 코어가 적은 서버에서도 이벤트 루프가 CPU를 먼저 받도록 풀 스레드는 우선순위를 낮춘다.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=BCRYPT_WORKERS,
+    thread_name_prefix="bcrypt",
+    initializer=_lower_thread_priority,
+) if BCRYPT_WORKERS > 0 else None
 
 
 def hash_password(password: str) -> str:
-    """비밀번호 해싱"""
+    """비밀번호 해싱 (동기 — 스크립트용, 라우터에서는 hash_password_async)"""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+    """비밀번호 검증 (동기 — 스크립트용, 라우터에서는 verify_password_async)"""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def _run_hash(func, *args):
+    if _hash_executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (bcrypt 스레드 풀)"""
+    return await _run_hash(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (bcrypt 스레드 풀)"""
+    return await _run_hash(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 토큰 생성"""
     to_encode = data.copy()
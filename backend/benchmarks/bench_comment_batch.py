@@ -0,0 +1,68 @@
+"""
+bench_comment_batch.py — 댓글 하나씩 vs 일괄 작성
+
+토론 한 번(--comments개 댓글)을 올리는 시간을 잰다.
+
+    single  — POST /api/posts/{id}/comments 를 댓글마다 (글 확인·커밋·재조회가 댓글마다)
+    batch   — POST /api/posts/{id}/comments:batch 한 번
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_comment_batch.py
+    python benchmarks/bench_comment_batch.py --comments 50 --rounds 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, login, summarize, print_table
+
+
+async def bench(args):
+    ids = await seed(n_posts=args.rounds * 2, n_comments=0)
+    post_ids = iter(ids["post_ids"])
+    results = {}
+
+    async with running_app() as client:
+        headers = await login(client)
+        contents = [f"토론 댓글 {i} " * 20 for i in range(args.comments)]
+
+        async def single(post_id):
+            for content in contents:
+                resp = await client.post(f"/api/posts/{post_id}/comments", json={"content": content}, headers=headers)
+                assert resp.status_code == 201
+
+        async def batch(post_id):
+            resp = await client.post(
+                f"/api/posts/{post_id}/comments:batch",
+                json={"comments": [{"content": content} for content in contents]}, headers=headers,
+            )
+            assert resp.status_code == 201 and len(resp.json()) == len(contents)
+
+        for label, send in (("single", single), ("batch", batch)):
+            latencies = []
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                t = time.perf_counter()
+                await send(next(post_ids))
+                latencies.append(time.perf_counter() - t)
+            results[label] = summarize(latencies, time.perf_counter() - start)
+
+    print_table(f"토론 한 번 = 댓글 {args.comments}개 ({args.rounds}회)", results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="댓글 하나씩 vs 일괄 작성")
+    parser.add_argument("--comments", type=int, default=6, help="토론 한 번의 댓글 수 (AI 직원 수)")
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    prepare_env()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
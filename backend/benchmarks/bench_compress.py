@@ -0,0 +1,92 @@
+"""
+bench_compress.py — 응답 압축 크기·요청당 CPU 벤치마크
+
+Accept-Encoding(identity / gzip / br*)을 바꿔가며 순서대로 요청해 요청당 전송 바이트와
+프로세스 CPU 시간을 잰다 (같은 프로세스의 httpx 클라이언트가 압축을 푸는 시간도 들어간다).
+
+    GET /posts/{id}        — 요청마다 CompressionMiddleware가 압축한다
+    GET /boards/{id}/posts — 첫 페이지 캐시: 인코딩별로 한 번 압축해 둔 bytes를 그대로 보낸다
+
+이어서 같은 본문을 압축 함수만으로 압축하는 비용(요청마다 레벨 / 미리 압축 레벨)을 따로 잰다.
+* br은 brotli 패키지가 있을 때만
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_compress.py
+    python benchmarks/bench_compress.py --content-size 8000 --comments 30 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app
+
+
+def measure(fn, repeat: int) -> float:
+    """1회 평균 CPU ms"""
+    fn()
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+
+async def bench(args):
+    from compression import ENCODINGS, compress
+
+    ids = await seed(n_posts=args.posts, n_comments=args.comments, content_size=args.content_size)
+    board_id, post_id = ids["board_ids"][0], ids["post_ids"][-1]
+    routes = {
+        "GET /posts/{id}": f"/api/posts/{post_id}",
+        "GET /boards/{id}/posts": f"/api/boards/{board_id}/posts",
+    }
+    bodies = {}
+
+    async with running_app() as client:
+        print(f"\n## 라우트 (요청 {args.requests}회, 요청당)")
+        print(f"{'':<26}{'encoding':<10}{'bytes':>10}{'ratio':>8}{'cpu ms':>10}")
+        for label, url in routes.items():
+            raw = None
+            for encoding in ("identity", *ENCODINGS):
+                headers = {"Accept-Encoding": encoding}
+                resp = await client.get(url, headers=headers)
+                resp.raise_for_status()
+                assert resp.headers.get("content-encoding", "identity") == encoding, resp.headers
+                size = resp.num_bytes_downloaded
+                raw = raw or size
+                bodies.setdefault(label, resp.content)
+
+                start = time.process_time()
+                for _ in range(args.requests):
+                    await client.get(url, headers=headers)
+                cpu = (time.process_time() - start) / args.requests * 1000
+                print(f"{label:<26}{encoding:<10}{size:>10}{size / raw:>8.2f}{cpu:>10.3f}")
+
+    print(f"\n## 압축 함수만 (본문 1개당 CPU ms, {args.repeat}회 평균)")
+    print(f"{'':<26}{'encoding':<10}{'bytes':>10}{'요청마다':>10}{'미리':>10}")
+    for label, body in bodies.items():
+        for encoding in ENCODINGS:
+            per_request = measure(lambda: compress(body, encoding), args.repeat)
+            once = measure(lambda: compress(body, encoding, precompress=True), args.repeat)
+            size = len(compress(body, encoding, precompress=True))
+            print(f"{label:<26}{encoding:<10}{size:>10}{per_request:>10.3f}{once:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--comments", type=int, default=20, help="게시글당 댓글 수")
+    parser.add_argument("--content-size", type=int, default=4000, help="게시글 본문 길이(글자)")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    prepare_env()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+bench_downloads.py — 첨부파일 다운로드 처리량 벤치마크
+
+큰 파일(--size MB)과 작은 파일(--small KB)을 하나씩 올려 두고 /api/attachments/{id}를 잰다.
+
+    full        — 큰 파일 전체 (MB/s): Starlette 기본 64KB 조각 vs DOWNLOAD_CHUNK_SIZE
+    range       — 큰 파일의 임의 1MB 구간 (미디어 탐색 흉내, 응답 내용 확인)
+    small       — 작은 파일 반복 다운로드: 메타데이터 캐시 끔(요청마다 DB+stat) vs 켬
+    304         — If-None-Match 재검증
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_downloads.py
+    python benchmarks/bench_downloads.py --size 200 --requests 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, login, summarize, print_table
+
+RANGE_SIZE = 1024 * 1024
+
+
+async def timed(send, n: int) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for i in range(n):
+        t = time.perf_counter()
+        await send(i)
+        latencies.append(time.perf_counter() - t)
+    return summarize(latencies, time.perf_counter() - start)
+
+
+async def bench(args):
+    from config import DOWNLOAD_CHUNK_SIZE
+    from downloads import AttachmentFileResponse, attachment_files
+
+    ids = await seed(n_posts=1, n_comments=0)
+    post_id = ids["post_ids"][0]
+    big = os.urandom(args.size * 1024 * 1024)
+    small = os.urandom(args.small * 1024)
+    results, throughput = {}, {}
+
+    async with running_app() as client:
+        headers = await login(client)
+
+        async def upload(name, data):
+            resp = await client.post(
+                f"/api/posts/{post_id}/attachments",
+                files={"file": (name, data, "application/octet-stream")}, headers=headers,
+            )
+            resp.raise_for_status()
+            return resp.json()["id"]
+
+        big_id, small_id = await upload("big.bin", big), await upload("small.bin", small)
+        big_url, small_url = f"/api/attachments/{big_id}", f"/api/attachments/{small_id}"
+
+        async def get_full(i):
+            resp = await client.get(big_url)
+            assert resp.status_code == 200 and len(resp.content) == len(big)
+
+        for label, chunk in (("full 64KB", 64 * 1024), (f"full {DOWNLOAD_CHUNK_SIZE // 1024}KB", DOWNLOAD_CHUNK_SIZE)):
+            AttachmentFileResponse.chunk_size = chunk
+            stats = results[label] = await timed(get_full, args.requests)
+            throughput[label] = stats["rps"] * args.size
+        AttachmentFileResponse.chunk_size = DOWNLOAD_CHUNK_SIZE
+
+        rng = random.Random(0)
+
+        async def get_range(i):
+            start = rng.randrange(0, len(big) - RANGE_SIZE)
+            resp = await client.get(big_url, headers={"Range": f"bytes={start}-{start + RANGE_SIZE - 1}"})
+            assert resp.status_code == 206 and resp.content == big[start:start + RANGE_SIZE]
+
+        stats = results["range 1MB"] = await timed(get_range, args.requests * 4)
+        throughput["range 1MB"] = stats["rps"] * RANGE_SIZE / 1024 / 1024
+
+        async def get_small(i, clear=False):
+            if clear:
+                attachment_files.clear()
+            resp = await client.get(small_url)
+            assert resp.status_code == 200 and resp.content == small
+
+        n_small = args.requests * 20
+        results["small, no metadata cache"] = await timed(lambda i: get_small(i, clear=True), n_small)
+        results["small, metadata cache"] = await timed(get_small, n_small)
+
+        etag = (await client.get(small_url)).headers["etag"]
+
+        async def revalidate(i):
+            resp = await client.get(small_url, headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+
+        results["304 If-None-Match"] = await timed(revalidate, n_small)
+
+    print_table(f"다운로드 (big={args.size}MB, small={args.small}KB)", results)
+    print()
+    for label, mbps in throughput.items():
+        print(f"{label:<28}{mbps:>10.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="첨부파일 다운로드 처리량 벤치마크")
+    parser.add_argument("--size", type=int, default=50, help="큰 파일 크기 (MB)")
+    parser.add_argument("--small", type=int, default=32, help="작은 파일 크기 (KB)")
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    tmpdir = prepare_env()
+    os.environ["UPLOADS_DIR"] = os.path.join(tmpdir, "uploads")  # 올린 파일도 임시 디렉토리에
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+bench_image_variants.py — 이미지 첨부 업로드 지연과 파생본 크기
+
+사진 크기의 JPEG(--width x --height)를 --uploads개 올린다.
+
+    upload inline      — 업로드 요청 안에서 파생본을 만들 때 (예전처럼 요청이 기다리는 경우를 흉내)
+    upload background  — 지금 방식 (큐에 넣고 바로 응답, 워커 프로세스가 만든다)
+
+마지막에 원본 / ?variant=web / ?variant=thumb 응답 크기를 비교한다 (글 상세 페이지가 받는 바이트).
+
+사용법 (backend/ 에서, Pillow 필요):
+    python benchmarks/bench_image_variants.py
+    python benchmarks/bench_image_variants.py --uploads 20 --width 6000 --height 4000
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, login, summarize, print_table
+
+
+def make_jpeg(width: int, height: int, seed_value: int) -> bytes:
+    from PIL import Image
+
+    # 잡음이 섞인 그라데이션 — 단색보다 실제 사진에 가까운 크기로 압축된다
+    noise = Image.effect_noise((width, height), 64 + seed_value % 32).convert("RGB")
+    gradient = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    buf = io.BytesIO()
+    Image.blend(noise, gradient, 0.5).save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+async def bench(args):
+    from image_variants import image_pipeline
+
+    ids = await seed(n_posts=1, n_comments=0)
+    post_id = ids["post_ids"][0]
+    images = [make_jpeg(args.width, args.height, i) for i in range(args.uploads)]
+    results = {}
+
+    async with running_app() as client:
+        headers = await login(client)
+
+        async def upload(data, inline: bool):
+            t = time.perf_counter()
+            resp = await client.post(
+                f"/api/posts/{post_id}/attachments",
+                files={"file": ("photo.jpg", data, "image/jpeg")}, headers=headers,
+            )
+            resp.raise_for_status()
+            if inline:
+                await image_pipeline.join()
+            return resp.json(), time.perf_counter() - t
+
+        for label, inline in (("upload inline", True), ("upload background", False)):
+            latencies = []
+            start = time.perf_counter()
+            for data in images:
+                attachment, latency = await upload(data, inline)
+                latencies.append(latency)
+            results[label] = summarize(latencies, time.perf_counter() - start)
+
+        t = time.perf_counter()
+        await image_pipeline.join()
+        drain = time.perf_counter() - t
+
+        sizes = {}
+        for variant in (None, "web", "thumb"):
+            params = {"variant": variant} if variant else {}
+            resp = await client.get(f"/api/attachments/{attachment['id']}", params=params)
+            sizes[variant or "original"] = (len(resp.content), resp.headers["content-type"])
+
+    print_table(f"이미지 업로드 ({args.uploads}장, {args.width}x{args.height})", results)
+    print(f"\n백그라운드 큐를 비우는 데 {drain:.2f}s 더 (처리 {image_pipeline.processed}, 실패 {image_pipeline.failed})\n")
+    for label, (size, content_type) in sizes.items():
+        print(f"{label:<12}{size / 1024:>10.1f} KB  {content_type}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 첨부 업로드 지연과 파생본 크기")
+    parser.add_argument("--uploads", type=int, default=10)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    args = parser.parse_args()
+
+    tmpdir = prepare_env()
+    os.environ["UPLOADS_DIR"] = os.path.join(tmpdir, "uploads")
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+bench_login.py — 로그인 폭주 중 읽기 지연시간 벤치마크
+
+AI 직원들이 한꺼번에 로그인할 때(토론 시작 등) 게시글 목록 읽기가 얼마나 느려지는지
+bcrypt를 이벤트 루프에서 바로 실행(inline) / 스레드 풀에서 실행(pool) 두 경우로 비교한다.
+
+    idle  — 로그인 없이 읽기만
+    storm — --logins개의 로그인 루프를 계속 돌리면서 읽기
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_login.py                        # inline vs pool 비교
+    python benchmarks/bench_login.py --logins 16 --rounds 12
+    python benchmarks/bench_login.py --variant pool         # 한 경우만 실행
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, run_load, summarize, print_table, compare_variants
+
+# pool은 config 기본값(BCRYPT_WORKERS = min(4, CPU 수))을 쓴다
+VARIANTS = {"inline": {"BCRYPT_WORKERS": "0"}, "pool": {}}
+
+
+async def bench_one(args) -> dict:
+    """현재 설정(BCRYPT_WORKERS)으로 로그인 폭주 중 읽기 지연시간 측정"""
+    ids = await seed(n_posts=100, n_comments=2)
+    board_id = ids["board_ids"][0]
+    results = {}
+
+    async with running_app() as client:
+
+        async def read(i):
+            resp = await client.get(f"/api/boards/{board_id}/posts")
+            resp.raise_for_status()
+
+        start = time.perf_counter()
+        latencies = await run_load(read, args.requests, args.concurrency)
+        results["GET posts (idle)"] = summarize(latencies, time.perf_counter() - start)
+
+        stop = asyncio.Event()
+        login_latencies = []
+
+        async def login_loop():
+            while not stop.is_set():
+                t = time.perf_counter()
+                resp = await client.post("/api/auth/login", json={"username": "bench", "password": "bench1234"})
+                resp.raise_for_status()
+                login_latencies.append(time.perf_counter() - t)
+
+        storm = [asyncio.create_task(login_loop()) for _ in range(args.logins)]
+        await asyncio.sleep(0.1)
+
+        start = time.perf_counter()
+        latencies = await run_load(read, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+        results["GET posts (login storm)"] = summarize(latencies, elapsed)
+
+        stop.set()
+        await asyncio.gather(*storm)
+        results["POST login (storm)"] = summarize(login_latencies, elapsed)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 읽기 벤치마크")
+    parser.add_argument("--variant", choices=list(VARIANTS), help="한 경우만 실행 (미지정 시 비교)")
+    parser.add_argument("--requests", type=int, default=300, help="읽기 요청 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 읽기 수")
+    parser.add_argument("--logins", type=int, default=8, help="동시에 로그인을 반복하는 클라이언트 수")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt 비용 (BCRYPT_ROUNDS)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (내부용)")
+    args = parser.parse_args()
+
+    if args.variant:
+        prepare_env(BCRYPT_ROUNDS=args.rounds, **VARIANTS[args.variant])
+        results = asyncio.run(bench_one(args))
+        if args.json:
+            print(json.dumps(results))
+        else:
+            print_table(f"bcrypt={args.variant}", results)
+        return
+
+    passthrough = [
+        f"--requests={args.requests}", f"--concurrency={args.concurrency}",
+        f"--logins={args.logins}", f"--rounds={args.rounds}",
+    ]
+    combined = compare_variants(__file__, "--variant", list(VARIANTS), passthrough)
+
+    print_table(f"reads={args.requests} concurrency={args.concurrency} logins={args.logins} rounds={args.rounds}", combined)
+
+
+if __name__ == "__main__":
+    main()
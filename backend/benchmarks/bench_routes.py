@@ -0,0 +1,100 @@
+"""
+bench_routes.py — 게시글 목록/상세 라우트 벤치마크
+
+DB 풀 모드(null = 요청마다 새 커넥션, queue = 풀 + WAL PRAGMA)를 바꿔가며
+/api/boards/{id}/posts, /api/posts/{id} 응답 시간을 비교한다.
+--writers를 주면 AI 토론처럼 댓글을 계속 쓰는 작업을 동시에 돌린다.
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_routes.py                     # null vs queue 비교
+    python benchmarks/bench_routes.py --writers 4
+    python benchmarks/bench_routes.py --mode queue        # 한 모드만 실행
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, login, run_load, summarize, print_table, compare_variants
+
+MODES = ["null", "queue"]
+
+
+async def bench_one(args) -> dict:
+    """현재 프로세스의 설정(DB_POOL_MODE)으로 라우트 부하 측정"""
+    ids = await seed(n_posts=args.posts, n_comments=args.comments)
+    board_id = ids["board_ids"][0]
+    post_ids = ids["post_ids"]
+    results = {}
+
+    async with running_app() as client:
+        headers = await login(client)
+        stop = asyncio.Event()
+
+        async def writer(n):
+            # 읽기 부하 동안 계속 댓글을 쓴다 (토론 사이클 흉내)
+            i = 0
+            while not stop.is_set():
+                await client.post(
+                    f"/api/posts/{post_ids[(n + i) % len(post_ids)]}/comments",
+                    json={"content": f"writer {n}-{i}"},
+                    headers=headers,
+                )
+                i += 1
+
+        writers = [asyncio.create_task(writer(n)) for n in range(args.writers)]
+
+        routes = {
+            "GET /boards/{id}/posts": lambda i: client.get(f"/api/boards/{board_id}/posts"),
+            "GET /posts/{id}": lambda i: client.get(f"/api/posts/{post_ids[i % len(post_ids)]}"),
+        }
+        for label, fn in routes.items():
+            async def send(i, fn=fn):
+                resp = await fn(i)
+                resp.raise_for_status()
+
+            start = time.perf_counter()
+            latencies = await run_load(send, args.requests, args.concurrency)
+            results[label] = summarize(latencies, time.perf_counter() - start)
+
+        stop.set()
+        await asyncio.gather(*writers, return_exceptions=True)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 라우트 벤치마크")
+    parser.add_argument("--mode", choices=MODES, help="한 모드만 실행 (미지정 시 전체 비교)")
+    parser.add_argument("--posts", type=int, default=300)
+    parser.add_argument("--comments", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (내부용)")
+    args = parser.parse_args()
+
+    if args.mode:
+        prepare_env(DB_POOL_MODE=args.mode)
+        results = asyncio.run(bench_one(args))
+        if args.json:
+            print(json.dumps(results))
+        else:
+            print_table(f"pool={args.mode}", results)
+        return
+
+    passthrough = [
+        f"--posts={args.posts}", f"--comments={args.comments}", f"--requests={args.requests}",
+        f"--concurrency={args.concurrency}", f"--writers={args.writers}",
+    ]
+    combined = compare_variants(__file__, "--mode", MODES, passthrough)
+
+    print_table(f"requests={args.requests} concurrency={args.concurrency} writers={args.writers}", combined)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+bench_search.py — 게시글 검색 벤치마크 (LIKE 전체 스캔 vs FTS5 trigram 색인)
+
+게시글 10만 개(기본값)를 넣은 임시 SQLite DB에서
+    - like    : 예전 /api/search 쿼리 (title/content ILIKE '%q%', 최신순)
+    - latest  : search.search_posts(sort="latest") — posts_fts MATCH, rowid 역순
+    - relev.  : search.search_posts(sort="relevance") — bm25 순위
+(latest/relev.는 스니펫·하이라이트·total 계산 포함)를 검색어 종류별로 비교하고,
+마지막에 /api/search 라우트 전체 응답 시간과 응답 크기도 잰다.
+
+검색어 종류:
+    rare   — 게시글 몇 개에만 들어 있는 단어 (LIKE는 끝까지 스캔해야 함)
+    common — 게시글 대부분에 들어 있는 단어 (LIKE도 최신 글 몇 개만 보고 끝남,
+             relevance는 일치한 글 전체의 bm25를 계산해야 해서 가장 비싸다)
+    miss   — 어디에도 없는 단어
+    short  — 2글자 (trigram 색인을 못 써서 두 방식 모두 LIKE)
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --posts 200000 --requests 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, run_load, summarize, print_table
+
+WORDS = [
+    "인공지능", "경제", "토론", "에이전트", "반도체", "금리", "부동산", "기후", "선거", "교육",
+    "스타트업", "로봇", "데이터", "보안", "클라우드", "우주", "의료", "배터리", "환율", "문화",
+]
+RARE_WORD = "양자얽힘실험"
+QUERIES = {
+    "rare": RARE_WORD,
+    "common": "인공지능",
+    "miss": "존재하지않는말",
+    "short": "금리",
+}
+
+
+def bulk_insert_posts(db_path: str, user_id: int, board_id: int, n_posts: int, content_size: int) -> float:
+    """ORM을 거치지 않고 게시글을 한 트랜잭션으로 넣는다 (FTS 트리거 포함 소요 시간 반환)"""
+    rng = random.Random(42)
+    rows = []
+    for i in range(n_posts):
+        words = []
+        while sum(len(w) + 1 for w in words) < content_size:
+            words.append(rng.choice(WORDS))
+        if i % 20000 == 0:
+            words.insert(len(words) // 2, RARE_WORD)
+        rows.append((board_id, user_id, f"게시글 {i} {rng.choice(WORDS)}", " ".join(words)))
+
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    with conn:
+        conn.executemany(
+            "INSERT INTO posts (board_id, author_id, title, content, source, view_count, comment_count, "
+            "attachment_count, last_activity_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, '자체판단', 0, 0, 0, datetime('now'), datetime('now'), datetime('now'))",
+            rows,
+        )
+    elapsed = time.perf_counter() - start
+    conn.execute("ANALYZE")
+    conn.close()
+    return elapsed
+
+
+async def bench(args) -> dict:
+    from sqlalchemy import select, desc, or_
+    from database import ReadSessionLocal
+    from models import Post
+    from search import search_posts
+
+    ids = await seed(n_posts=0)
+    db_path = os.path.join(args.tmpdir, "bench.db")
+    elapsed = bulk_insert_posts(db_path, ids["user_id"], ids["board_ids"][0], args.posts, args.content_size)
+    print(f"inserted {args.posts} posts in {elapsed:.1f}s (FTS triggers included), "
+          f"db size {os.path.getsize(db_path) / 1024 / 1024:.0f} MB")
+
+    def like(q):
+        stmt = select(Post.id).where(
+            or_(Post.title.ilike(f"%{q}%"), Post.content.ilike(f"%{q}%"))
+        ).order_by(desc(Post.created_at)).limit(20)
+
+        async def run(session):
+            (await session.execute(stmt)).all()
+        return run
+
+    def fts(sort):
+        def make(q):
+            async def run(session):
+                await search_posts(session, q, sort=sort, limit=20)
+            return run
+        return make
+
+    results = {}
+    for kind, q in QUERIES.items():
+        for label, make in (("like", like), ("latest", fts("latest")), ("relev.", fts("relevance"))):
+            run = make(q)
+
+            async def send(i, run=run):
+                async with ReadSessionLocal() as session:
+                    await run(session)
+
+            start = time.perf_counter()
+            latencies = await run_load(send, args.requests, args.concurrency)
+            results[f"{label:<7}{kind}"] = summarize(latencies, time.perf_counter() - start)
+
+    sizes = {}
+    async with running_app() as client:
+        for kind, q in QUERIES.items():
+            async def send(i, q=q, kind=kind):
+                resp = await client.get("/api/search", params={"q": q})
+                resp.raise_for_status()
+                sizes[kind] = len(resp.content)
+
+            start = time.perf_counter()
+            latencies = await run_load(send, args.requests, args.concurrency)
+            results[f"GET /api/search {kind}"] = summarize(latencies, time.perf_counter() - start)
+
+    for kind, size in sizes.items():
+        print(f"GET /api/search {kind:<8} response {size / 1024:.1f} KB")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 검색 벤치마크")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--content-size", type=int, default=1000, help="게시글 본문 길이(글자)")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    args.tmpdir = prepare_env()
+    results = asyncio.run(bench(args))
+    print_table(f"posts={args.posts} requests={args.requests} concurrency={args.concurrency}", results)
+
+
+if __name__ == "__main__":
+    main()
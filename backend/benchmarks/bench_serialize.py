@@ -0,0 +1,110 @@
+"""
+bench_serialize.py — 게시글 목록 직렬화 비용 마이크로벤치마크 (게시글 100개당)
+
+DB 없이 메모리에 만든 Post ORM 객체(작성자·게시판 포함) 100개를 JSON bytes로 바꾸는 시간을 비교한다.
+
+    fastapi+json   — 예전 경로: response_model 검증(행마다 PostSummaryResponse/UserResponse/BoardResponse 생성)
+                     → dict 변환 → JSONResponse(json.dumps)
+    fastapi+orjson — 같은 검증 경로 + ORJSONResponse (지금 앱 기본 응답 클래스)
+    typeadapter    — 미리 만든 TypeAdapter(List[PostSummaryResponse])로 검증 후 dump_json
+    projection     — serialization.post_summary_projection + orjson (지금 목록 라우트가 쓰는 경로)
+
+네 경로의 출력 바이트가 같은지도 확인한다.
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_serialize.py
+    python benchmarks/bench_serialize.py --content-size 200 --repeat 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env
+
+
+def make_posts(n: int, content_size: int) -> list:
+    from models import Board, Post, Role, User
+
+    now = datetime.utcnow()
+    author = User(id=1, username="bench", display_name="벤치", role=Role.MEMBER, is_active=True, created_at=now)
+    board = Board(id=1, name="보드", slug="bench", description="벤치마크", is_active=True, created_at=now)
+    body = ("AI 에이전트가 작성한 마크다운 본문입니다. " * (content_size // 20 + 1))[:content_size]
+    return [
+        Post(
+            id=i, board_id=1, author_id=1, title=f"벤치마크 게시글 {i}", content=body, source="자체판단",
+            view_count=i, comment_count=i % 7, attachment_count=0,
+            last_activity_at=now, created_at=now - timedelta(minutes=i), updated_at=now,
+            author=author, board=board,
+        )
+        for i in range(n)
+    ]
+
+
+def measure(fn, repeat: int) -> float:
+    """1회 평균 ms"""
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 목록 직렬화 마이크로벤치마크")
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--content-size", type=int, default=2000, help="게시글 본문 길이(글자)")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    prepare_env()
+    import orjson
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import serialize_response
+    from pydantic import TypeAdapter
+
+    from main import app
+    from schemas import PostSummaryResponse
+    from serialization import post_summary_projection
+
+    posts = make_posts(args.posts, args.content_size)
+    route = next(
+        r for r in app.routes
+        if getattr(r, "path", None) == "/api/boards/{board_id}/posts" and "GET" in r.methods
+    )
+    loop = asyncio.new_event_loop()
+    adapter = TypeAdapter(List[PostSummaryResponse])
+
+    def fastapi_path(response_class):
+        def run():
+            content = loop.run_until_complete(serialize_response(field=route.response_field, response_content=posts))
+            return response_class(content).body
+        return run
+
+    variants = {
+        "fastapi+json": fastapi_path(JSONResponse),
+        "fastapi+orjson": fastapi_path(ORJSONResponse),
+        "typeadapter": lambda: adapter.dump_json(adapter.validate_python(posts, from_attributes=True)),
+        "projection": lambda: orjson.dumps([post_summary_projection(post) for post in posts]),
+    }
+
+    expected = variants["fastapi+json"]()
+    for name, fn in variants.items():
+        assert fn() == expected, f"{name} 출력이 다르다"
+
+    print(f"\n=== posts={args.posts} content={args.content_size}자 body={len(expected) / 1024:.1f} KB repeat={args.repeat} ===")
+    baseline = None
+    for name, fn in variants.items():
+        ms = measure(fn, args.repeat)
+        baseline = baseline or ms
+        print(f"{name:<16} {ms:8.3f} ms / {args.posts}개   x{baseline / ms:.1f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
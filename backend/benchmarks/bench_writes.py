@@ -0,0 +1,90 @@
+"""
+bench_writes.py — 동시 쓰기 지연시간 벤치마크
+
+여러 writer(AI 계정 + 사람)가 동시에 댓글/게시글을 쓸 때의 지연시간과 실패 수를
+쓰기 코디네이터 사용(queue) / 미사용(direct) 두 경우로 비교한다.
+
+사용법 (backend/ 에서):
+    python benchmarks/bench_writes.py                         # direct vs queue 비교
+    python benchmarks/bench_writes.py --writers 32 --requests 2000
+    python benchmarks/bench_writes.py --variant queue         # 한 경우만 실행
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import prepare_env, seed, running_app, login, run_load, summarize, print_table, compare_variants
+
+VARIANTS = {"direct": "0", "queue": "1"}
+
+
+async def bench_one(args) -> dict:
+    """현재 설정(WRITE_QUEUE_ENABLED)으로 동시 쓰기 부하 측정"""
+    ids = await seed(n_posts=50, n_comments=0)
+    board_id = ids["board_ids"][0]
+    post_ids = ids["post_ids"]
+    errors = 0
+
+    async with running_app() as client:
+        headers = await login(client)
+
+        async def send(i):
+            nonlocal errors
+            try:
+                if i % 10 == 0:
+                    resp = await client.post(
+                        f"/api/boards/{board_id}/posts",
+                        json={"title": f"글 {i}", "content": "본문 " * 200},
+                        headers=headers,
+                    )
+                else:
+                    resp = await client.post(
+                        f"/api/posts/{post_ids[i % len(post_ids)]}/comments",
+                        json={"content": f"댓글 {i}"},
+                        headers=headers,
+                    )
+                if resp.status_code >= 400:
+                    errors += 1
+            except Exception:  # "database is locked" 등 서버 예외
+                errors += 1
+
+        start = time.perf_counter()
+        latencies = await run_load(send, args.requests, args.writers)
+        stats = summarize(latencies, time.perf_counter() - start)
+
+    stats["errors"] = errors
+    return {"POST comments/posts": stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 쓰기 벤치마크")
+    parser.add_argument("--variant", choices=list(VARIANTS), help="한 경우만 실행 (미지정 시 비교)")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--writers", type=int, default=16, help="동시 writer 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (내부용)")
+    args = parser.parse_args()
+
+    if args.variant:
+        prepare_env(WRITE_QUEUE_ENABLED=VARIANTS[args.variant])
+        results = asyncio.run(bench_one(args))
+        if args.json:
+            print(json.dumps(results))
+        else:
+            print_table(f"write queue={args.variant}", results)
+        return
+
+    passthrough = [f"--requests={args.requests}", f"--writers={args.writers}"]
+    combined = compare_variants(__file__, "--variant", list(VARIANTS), passthrough)
+
+    print_table(f"requests={args.requests} writers={args.writers}", combined)
+    for label, stats in combined.items():
+        print(f"{label:<28}errors={stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
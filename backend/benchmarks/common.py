@@ -0,0 +1,165 @@
+"""
+벤치마크 공용 도구 — 임시 DB 준비, 시드 데이터, 부하 생성, 통계
+
+모든 벤치마크는 실제 data/board.db를 건드리지 않도록
+임시 디렉토리에 DB를 만들고 DATABASE_URL 환경변수로 연결한다.
+(config가 import 되기 전에 prepare_env()를 먼저 호출해야 한다)
+"""
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def prepare_env(**env) -> str:
+    """임시 DB 경로를 DATABASE_URL로 지정하고 추가 환경변수를 설정한다"""
+    tmpdir = tempfile.mkdtemp(prefix="sudabang-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmpdir}/bench.db"
+    for key, value in env.items():
+        os.environ[key] = str(value)
+    return tmpdir
+
+
+async def seed(n_boards: int = 1, n_posts: int = 200, n_comments: int = 5, content_size: int = 2000) -> dict:
+    """벤치마크용 사용자/게시판/게시글/댓글 생성"""
+    from database import AsyncSessionLocal, init_db
+    from models import User, Board, Post, Comment, Role
+    from auth import hash_password
+    from post_counters import backfill_post_counters
+
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        user = User(
+            username="bench",
+            display_name="벤치",
+            password_hash=hash_password("bench1234"),
+            role=Role.ADMIN,
+        )
+        session.add(user)
+        boards = [Board(name=f"보드{i}", slug=f"bench-{i}") for i in range(n_boards)]
+        session.add_all(boards)
+        await session.flush()
+
+        body = ("AI 에이전트가 작성한 마크다운 본문입니다. " * (content_size // 20 + 1))[:content_size]
+        post_ids = []
+        for i in range(n_posts):
+            post = Post(
+                board_id=boards[i % n_boards].id,
+                author_id=user.id,
+                title=f"벤치마크 게시글 {i}",
+                content=body,
+                source="자체판단",
+            )
+            session.add(post)
+            await session.flush()
+            post_ids.append(post.id)
+            session.add_all([
+                Comment(post_id=post.id, author_id=user.id, content=f"댓글 {j}")
+                for j in range(n_comments)
+            ])
+        await session.flush()
+        await session.run_sync(lambda s: backfill_post_counters(s.connection()))
+        await session.commit()
+        return {
+            "user_id": user.id,
+            "board_ids": [b.id for b in boards],
+            "post_ids": post_ids,
+        }
+
+
+def make_client():
+    """ASGI 앱에 직접 붙는 httpx 클라이언트 (네트워크 오버헤드 제외)"""
+    import httpx
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://bench")
+
+
+@contextlib.asynccontextmanager
+async def running_app():
+    """lifespan(시작/종료 훅)을 실행한 상태의 클라이언트 — writer 태스크 등이 함께 돈다"""
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        async with make_client() as client:
+            yield client
+
+
+async def login(client, username: str = "bench", password: str = "bench1234") -> dict:
+    """로그인 후 인증 헤더 반환"""
+    resp = await client.post("/api/auth/login", json={"username": username, "password": password})
+    resp.raise_for_status()
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+async def run_load(send, n_requests: int, concurrency: int) -> list:
+    """send(i) 코루틴을 concurrency개 동시에 n_requests번 실행하고 지연시간(초) 목록 반환"""
+    latencies = []
+    counter = iter(range(n_requests))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            await send(i)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def summarize(latencies: list, elapsed: float = None) -> dict:
+    """지연시간 통계 (ms)"""
+    ordered = sorted(latencies)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+    stats = {
+        "count": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+    if elapsed:
+        stats["rps"] = len(ordered) / elapsed
+    return stats
+
+
+def print_table(title: str, rows: dict):
+    """{라벨: stats} 형태를 표로 출력"""
+    print(f"\n## {title}")
+    print(f"{'':<28}{'req/s':>10}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for label, s in rows.items():
+        print(
+            f"{label:<28}{s.get('rps', 0):>10.1f}{s['mean_ms']:>10.2f}"
+            f"{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}{s['p99_ms']:>10.2f}"
+        )
+
+
+def compare_variants(script: str, flag: str, variants: list, passthrough: list) -> dict:
+    """
+    엔진/설정은 import 시점에 결정되므로 변형마다 별도 프로세스로 실행한다.
+    자식 프로세스는 `{flag}=<variant> --json`으로 호출되어 마지막 줄에 JSON 결과를 출력해야 한다.
+
+    Returns:
+        {"<variant> <라벨>": stats, ...}
+    """
+    combined = {}
+    for variant in variants:
+        out = subprocess.run(
+            [sys.executable, script, f"{flag}={variant}", "--json", *passthrough],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        for label, stats in json.loads(out.strip().splitlines()[-1]).items():
+            combined[f"{variant:<6} {label}"] = stats
+    return combined
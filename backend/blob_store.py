@@ -0,0 +1,176 @@
+"""
+첨부파일 저장소 — 내용 주소(SHA-256) 기반, 같은 내용은 한 번만 저장
+
+    BLOBS_DIR/ab/cd/abcd…(64자리 sha256)
+
+업로드는 옮기면서 SHA-256을 계산해(uploads.save_upload) 임시 파일(BLOBS_DIR/tmp)에 쓴 뒤 put()한다.
+같은 blob이 이미 있으면 임시 파일을 버린다 — 여러 글에 같은 이미지·PDF를 올려도 디스크는 한 벌.
+파일 이름이 같아도 내용이 다르면 다른 blob이라 덮어쓰지 않는다.
+
+attachments.stored_path에는 저장소 기준 상대 경로(ab/cd/…)를, attachments.sha256에는 해시를 둔다.
+참조 수 = 그 sha256을 가진 attachments 행 수. 첨부(글)를 지울 때 파일은 바로 지우지 않고
+gc()가 참조 없는 blob을 치운다 (python manage.py gc-blobs).
+
+GC 안전성: 업로드는 blob을 put()한 뒤에 attachments 행을 커밋한다. 그 사이에 GC가 돌면
+참조가 없어 보이므로, put()은 blob의 mtime을 지금으로 갱신하고 GC는 mtime이
+BLOB_GC_GRACE초보다 오래된 것만 지운다.
+    - put()은 있는지 확인하지 않고 임시 파일을 그 자리로 os.replace()한다 (내용이 같으니 덮어써도 된다)
+      — "있다"고 본 뒤 GC가 지워 버려 행이 없는 파일을 가리키는 일이 없다
+    - GC는 후보를 바로 지우지 않고 휴지통(BLOBS_DIR/trash)으로 옮긴 뒤 mtime과 참조를 다시 보고
+      그사이 put()·커밋된 것은 되돌려 놓는다 (still_referenced)
+
+예전 방식(UPLOADS_DIR/<post_id>/<파일 이름>, 절대 경로) 행은 sha256이 NULL이고
+resolve()가 경로를 그대로 쓴다 — python manage.py import-blobs로 저장소에 옮긴다.
+"""
+import hashlib
+import os
+import secrets
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from config import BLOB_GC_GRACE, BLOBS_DIR
+
+
+def file_digest(path: Path) -> str:
+    """파일의 sha256 (hex)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.tmp_dir = root / "tmp"
+        self.trash_dir = root / "trash"
+
+    def key(self, digest: str) -> str:
+        """sha256 → 저장소 기준 상대 경로 (attachments.stored_path)"""
+        return f"{digest[:2]}/{digest[2:4]}/{digest}"
+
+    def resolve(self, stored_path: str) -> Path:
+        """attachments.stored_path → 파일 경로 (예전 행의 절대 경로는 그대로)"""
+        return self.root / stored_path  # 절대 경로와 합치면 절대 경로가 남는다
+
+    def temp_path(self) -> Path:
+        """put()할 임시 파일 경로 (저장소와 같은 파일 시스템이라 rename이 원자적)"""
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        return self.tmp_dir / f"{secrets.token_hex(8)}.part"
+
+    def put(self, tmp_path: Path, digest: str) -> str:
+        """다 쓴 임시 파일을 sha256 자리로 옮기고 key 반환 (이미 있으면 같은 내용으로 덮어쓴다)"""
+        path = self.resolve(self.key(digest))
+        os.makedirs(path.parent, exist_ok=True)
+        os.utime(tmp_path)  # GC 유예 시간을 다시 센다 — 곧 커밋될 행이 참조한다
+        os.replace(tmp_path, path)
+        return self.key(digest)
+
+    def import_file(self, path: Path) -> tuple:
+        """저장소 밖의 파일을 복사해 넣고 (sha256, key) 반환 — 원본은 그대로 둔다"""
+        digest = file_digest(path)
+        tmp_path = self.temp_path()
+        try:
+            os.link(path, tmp_path)
+        except OSError:  # 다른 파일 시스템
+            shutil.copyfile(path, tmp_path)
+        return digest, self.put(tmp_path, digest)
+
+    def gc(
+        self,
+        referenced: Iterable[str],
+        grace: float = BLOB_GC_GRACE,
+        dry_run: bool = False,
+        still_referenced: Optional[Callable[[set], set]] = None,
+    ) -> dict:
+        """
+        referenced(attachments.sha256 목록)에 없는 blob과 남은 임시 파일 중
+        grace초보다 오래된 것을 지운다.
+
+        still_referenced: 휴지통으로 옮긴 sha256 집합 → 그중 지금 참조되는 것 (옮기는 사이에 커밋된 행)
+
+        Returns:
+            {"blobs": 전체 blob 수, "removed": 지운 파일 수, "freed": 지운 바이트}
+        """
+        referenced = set(referenced)
+        cutoff = time.time() - grace
+        stats = {"blobs": 0, "removed": 0, "freed": 0}
+        if not self.root.exists():
+            return stats
+        self._restore_trash()  # 지난 GC가 중간에 멈췄으면
+
+        candidates = []
+        for path in self.root.glob("*/*/*"):
+            if not path.is_file():
+                continue
+            stats["blobs"] += 1
+            if path.name not in referenced and self._is_stale(path, cutoff):
+                candidates.append(path)
+        if dry_run:
+            stats["removed"] = len(candidates)
+            stats["freed"] = sum(self._size(path) for path in candidates)
+        else:
+            self._remove_blobs(candidates, cutoff, still_referenced, stats)
+
+        if self.tmp_dir.exists():
+            for path in self.tmp_dir.iterdir():
+                if not self._is_stale(path, cutoff):
+                    continue
+                size = self._size(path)
+                if not dry_run:
+                    path.unlink(missing_ok=True)
+                stats["removed"] += 1
+                stats["freed"] += size
+        return stats
+
+    def _remove_blobs(self, candidates: list, cutoff: float, still_referenced, stats: dict):
+        """후보를 휴지통으로 옮긴 뒤 다시 확인하고 지운다 (그사이 put()·커밋된 것은 되돌린다)"""
+        os.makedirs(self.trash_dir, exist_ok=True)
+        trashed = []
+        for path in candidates:
+            trash_path = self.trash_dir / f"{path.name}.{secrets.token_hex(4)}"
+            try:
+                os.rename(path, trash_path)
+            except FileNotFoundError:
+                continue
+            trashed.append((trash_path, path))
+
+        keep = still_referenced({path.name for _, path in trashed}) if still_referenced and trashed else set()
+        for trash_path, path in trashed:
+            if path.name in keep or not self._is_stale(trash_path, cutoff):
+                os.replace(trash_path, path)  # 같은 내용 — 그사이 put()한 것이 있어도 덮어써도 된다
+                continue
+            stats["freed"] += self._size(trash_path)
+            trash_path.unlink(missing_ok=True)
+            stats["removed"] += 1
+
+    def _restore_trash(self):
+        if not self.trash_dir.exists():
+            return
+        for trash_path in self.trash_dir.iterdir():
+            digest = trash_path.name.split(".")[0]
+            path = self.resolve(self.key(digest))
+            os.makedirs(path.parent, exist_ok=True)
+            os.replace(trash_path, path)
+
+    @staticmethod
+    def _is_stale(path: Path, cutoff: float) -> bool:
+        """grace보다 오래됐는가 (그사이 지워지거나 옮겨졌으면 False)"""
+        try:
+            return path.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+
+blob_store = BlobStore(BLOBS_DIR)
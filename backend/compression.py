@@ -0,0 +1,122 @@
+"""
+응답 압축 (Accept-Encoding → br / gzip)
+
+AI가 쓴 마크다운 글·댓글 타래(get_post)와 목록 JSON은 잘 줄어든다.
+CompressionMiddleware가 COMPRESS_MIN_SIZE 이상인 JSON/텍스트 응답을 그때그때 압축한다.
+br은 brotli 패키지(requirements.txt)가 설치되어 있을 때만 쓴다 — 없으면 gzip만 쓰고 시작할 때 경고를 찍는다.
+
+캐시에 든 응답(front_page.FrontPage)은 인코딩별로 한 번만 압축해(precompress) 그 bytes를
+Content-Encoding과 함께 돌려준다 — 미들웨어는 Content-Encoding이 이미 있는 응답을 건드리지 않는다.
+한 번만 하므로 그때그때 압축(GZIP_LEVEL / BROTLI_QUALITY)보다 높은 레벨을 쓴다.
+
+다음은 압축하지 않는다:
+    - 본문을 여러 번에 나눠 보내는 응답 (StreamingResponse 등)
+    - 파일 다운로드 (Accept-Ranges 또는 Content-Disposition이 있는 응답) — 작은 .txt/.json 첨부도
+      강한 ETag(sha256)와 Range가 원본 바이트를 가리키므로 그대로 보낸다
+    - JSON/텍스트가 아닌 응답, 304 등 본문 없는 응답, 206 부분 응답, HEAD
+
+크기·요청당 CPU 비교: python benchmarks/bench_compress.py
+"""
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from config import (
+    BROTLI_QUALITY, COMPRESS_MIN_SIZE, GZIP_LEVEL, PRECOMPRESS_BROTLI_QUALITY, PRECOMPRESS_GZIP_LEVEL,
+)
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+# 선호 순서
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 헤더 → 쓸 인코딩 (br 우선, 없으면 None = 압축 안 함)"""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    for encoding in ENCODINGS:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    """body를 encoding으로 압축 (precompress면 캐시에 넣을 것 — 더 높은 레벨)"""
+    if encoding == "br":
+        quality = PRECOMPRESS_BROTLI_QUALITY if precompress else BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = PRECOMPRESS_GZIP_LEVEL if precompress else GZIP_LEVEL
+    return gzip.compress(body, compresslevel=level, mtime=0)  # mtime=0: 같은 입력 → 같은 bytes
+
+
+class CompressionMiddleware:
+    """한 번에 보내는 JSON/텍스트 응답 본문을 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None  # http.response.start를 본문 첫 조각이 올 때까지 잡아 둔다
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or start["status"] == 206
+                or "content-encoding" in headers
+                or "accept-ranges" in headers
+                or "content-disposition" in headers
+                or not headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            if len(body) >= self.minimum_size:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = "W/" + etag  # 바이트가 달라지므로 강한 검증자는 약하게
+                message = {**message, "body": body}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -1,15 +1,86 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
-from config import DATABASE_URL
-from models import Base
-
-# Async 엔진 생성 (SQLite는 기본 풀링 비활성화)
-engine = create_async_engine(
+from config import (
     DATABASE_URL,
-    echo=False,  # SQL 로그 비활성화 (True로 변경 시 SQL 쿼리 출력)
-    poolclass=NullPool,
-    future=True,
+    DB_POOL_MODE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_READ_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_KB,
+    SQLITE_MMAP_SIZE,
 )
+import migrations
+
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    """풀 설정 — "null"이면 요청마다 커넥션을 새로 연다 (비교/디버깅용)"""
+    if DB_POOL_MODE == "null":
+        return {"poolclass": NullPool}
+    options = {"pool_size": pool_size, "max_overflow": max_overflow, "pool_timeout": DB_POOL_TIMEOUT}
+    if not IS_SQLITE:
+        # 서버 DB는 유휴 커넥션이 끊길 수 있으므로 확인 후 재사용
+        options.update(pool_pre_ping=True, pool_recycle=DB_POOL_RECYCLE)
+    return options
+
+
+def _connect_args(read_only: bool) -> dict:
+    """드라이버 접속 옵션 — PostgreSQL 읽기 풀은 세션 자체를 읽기 전용으로 연다"""
+    if read_only and DATABASE_URL.startswith("postgresql+asyncpg"):
+        return {"server_settings": {"default_transaction_read_only": "on"}}
+    return {}
+
+
+def _create_engine(pool_size: int, max_overflow: int, read_only: bool = False, writer: bool = False):
+    """Async 엔진 생성 (커넥션을 풀에 유지해 재사용)"""
+    new_engine = create_async_engine(
+        DATABASE_URL,
+        echo=False,  # SQL 로그 비활성화 (True로 변경 시 SQL 쿼리 출력)
+        future=True,
+        connect_args=_connect_args(read_only),
+        **_pool_options(pool_size, max_overflow),
+    )
+
+    if IS_SQLITE:
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            """커넥션마다 PRAGMA 적용 — WAL 모드에서는 읽기가 쓰기를 기다리지 않는다"""
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")  # 음수 = KB 단위
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")  # 실수로 쓰기 쿼리가 와도 거부
+            cursor.close()
+            if writer:
+                # pysqlite 자체 트랜잭션 관리를 끄고 BEGIN을 직접 보낸다 (SAVEPOINT 정상 동작용)
+                dbapi_connection.isolation_level = None
+
+        if writer:
+            @event.listens_for(new_engine.sync_engine, "begin")
+            def _begin_sqlite_transaction(conn):
+                # 시작부터 쓰기 잠금을 잡는다 — 읽은 뒤 쓰기로 올릴 때의 SQLITE_BUSY 방지
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return new_engine
+
+
+# 쓰기용 엔진 (모든 쓰기 + 쓰기 라우트의 조회)
+engine = _create_engine(DB_POOL_SIZE, DB_MAX_OVERFLOW)
+
+# writer 태스크 전용 엔진 (쓰기 코디네이터가 커넥션 하나를 독점, 요청 세션과 풀을 나누지 않는다)
+writer_engine = _create_engine(1, 0, writer=True)
+
+# 읽기 전용 엔진 (공개 GET 라우트) — 쓰기 폭주 중에도 풀 대기가 섞이지 않는다
+read_engine = _create_engine(DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, read_only=True)
 
 # Async 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
@@ -20,11 +91,33 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+WriterSessionLocal = async_sessionmaker(
+    writer_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
-async def init_db():
-    """DB 테이블 초기화"""
+async def init_db() -> list:
+    """DB 스키마를 최신 마이그레이션까지 올린다 (적용한 마이그레이션 이름 목록 반환)"""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        return await conn.run_sync(migrations.upgrade)
+
+
+async def migration_status() -> list:
+    """[(version, name, 적용 여부), ...]"""
+    async with engine.begin() as conn:
+        return await conn.run_sync(migrations.status)
 
 
 async def get_session():
@@ -34,3 +127,19 @@ async def get_session():
         yield session
     finally:
         await session.close()
+
+
+async def get_read_session():
+    """의존성 주입용 읽기 전용 세션 제공 (GET 라우트)"""
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def dispose_engines():
+    """종료 시 풀에 남은 커넥션 정리"""
+    await engine.dispose()
+    await writer_engine.dispose()
+    await read_engine.dispose()
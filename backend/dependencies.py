@@ -0,0 +1,65 @@
+"""
+라우터 공용 의존성
+"""
+from typing import Optional
+
+from fastapi import Depends, Header
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth import decode_token
+from database import get_read_session
+from models import User
+from token_versions import token_versions
+from user_cache import UserSnapshot, user_cache
+
+
+async def get_current_user(
+    authorization: str = Header(None),
+    session: AsyncSession = Depends(get_read_session),
+) -> Optional[UserSnapshot]:
+    """
+    Authorization 헤더에서 토큰 추출 후 사용자 확인 (없거나 비활성이거나 폐기된 토큰이면 None)
+
+    토큰에 클레임(ver 등)이 있으면 토큰 버전 표만 확인하고 클레임으로 사용자를 만든다.
+    sub만 있는 예전 토큰은 user_cache에서 먼저 찾고, 없을 때만 DB를 조회한다.
+    한 요청 안에서는 FastAPI가 의존성 결과를 재사용하므로 한 번만 실행된다.
+    """
+    if not authorization:
+        return None
+
+    try:
+        token = authorization.split(" ")[1]  # "Bearer <token>"
+    except IndexError:
+        return None
+
+    payload = decode_token(token)
+    if not payload:
+        return None
+
+    user_id = int(payload.get("sub"))
+    if "ver" in payload:
+        version = token_versions.get(user_id)
+        if version is None:
+            stmt = select(User.token_version).where(User.id == user_id)
+            version = (await session.execute(stmt)).scalar_one_or_none()
+            if version is None:
+                return None
+            token_versions.put(user_id, version)
+        if payload["ver"] != version:
+            return None
+        return UserSnapshot.from_claims(payload)
+
+    user = user_cache.get(user_id)
+    if user is None:
+        stmt = select(User).where(User.id == user_id)
+        result = await session.execute(stmt)
+        row = result.scalar_one_or_none()
+        if row is None:
+            return None
+        user = UserSnapshot.from_user(row)
+        user_cache.put(user)
+
+    if not user.is_active:
+        return None
+    return user
@@ -0,0 +1,179 @@
+"""
+첨부파일 다운로드 — 메타데이터 캐시, 조건부/Range 응답, sendfile
+
+    - 메타데이터 캐시: (attachment id, 파생본) → AttachmentFile(경로, 이름, MIME, sha256, stat).
+      blob 저장소의 파일은 내용이 바뀌지 않으므로 반복 다운로드는 DB 조회도 stat()도 하지 않는다.
+      LRU ATTACHMENT_CACHE_SIZE개, TTL ATTACHMENT_CACHE_TTL초 (BLOB_GC_GRACE보다 짧다 —
+      참조가 끊긴 blob이 GC로 지워질 때는 캐시 항목이 이미 만료되어 있다).
+      이 프로세스에서 Attachment 행을 지우면 ORM 이벤트로 바로 무효화된다.
+      예전 방식 파일(sha256 NULL)은 캐시하지 않는다 — 덮어써지거나 import-blobs로 옮겨질 수 있다.
+    - ETag: blob은 "sha256" (강한 검증자), 예전 파일은 mtime-크기.
+      If-None-Match가 맞으면 파일을 열지 않고 304.
+    - Cache-Control: ?v=<sha256>이 행의 해시와 같으면 immutable (URL이 내용을 가리킨다).
+      id만으로는 재검증 — SQLite는 마지막 행을 지우면 id를 다시 쓸 수 있다.
+    - 파생본: ?variant=thumb 등 (image_variants.py가 만든 WebP). 아직 없거나(작업 중) 원본이 이미
+      작아서 만들지 않았으면 원본을 준다 — 이때는 ?v=가 맞아도 재검증 (곧 파생본이 생길 수 있다).
+    - Range / If-Range: Starlette FileResponse가 처리한다 (If-Range는 위 ETag 또는 Last-Modified와 비교).
+      한 구간만 — 여러 구간 요청은 전체(200)로 답한다.
+    - 본문: DOWNLOAD_CHUNK_SIZE씩 보낸다 (Starlette 기본 64KB보다 send 횟수가 적다).
+      서버가 ASGI pathsend 확장을 지원하면 FileResponse가 경로만 넘겨 서버가 보낸다.
+      DOWNLOAD_ACCEL_REDIRECT를 설정하면(nginx 앞단) 본문 없이 X-Accel-Redirect만 주고
+      nginx가 sendfile로 보낸다 (Range도 nginx가 처리). 예:
+
+          location /_blobs/ { internal; alias /path/to/uploads/blobs/; }
+
+처리량 비교: python benchmarks/bench_downloads.py
+"""
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+from sqlalchemy import event
+from starlette.datastructures import Headers
+from sqlalchemy.orm import Session
+
+from blob_store import blob_store
+from config import (
+    ATTACHMENT_CACHE_SIZE, ATTACHMENT_CACHE_TTL, DOWNLOAD_ACCEL_REDIRECT, DOWNLOAD_CHUNK_SIZE, IMAGE_VARIANTS,
+)
+from models import Attachment, AttachmentVariant
+
+
+@dataclass(frozen=True)
+class AttachmentFile:
+    """다운로드에 필요한 첨부파일 정보"""
+    id: int
+    path: Path
+    stored_path: str
+    filename: str
+    media_type: str
+    sha256: Optional[str]
+    stat: os.stat_result
+    variant: Optional[str] = None  # 파생본 이름 (원본이면 None)
+    version: Optional[str] = None  # ?v=와 비교할 원본의 sha256
+
+    @property
+    def etag(self) -> str:
+        if self.sha256:
+            return f'"{self.sha256}"'
+        return f'"{int(self.stat.st_mtime)}-{self.stat.st_size}"'
+
+    @classmethod
+    def load(
+        cls, attachment: Attachment, variant: Optional[AttachmentVariant] = None
+    ) -> Optional["AttachmentFile"]:
+        """행 → AttachmentFile (디스크에 파일이 없으면 None, stat을 하므로 스레드에서 부른다)"""
+        source = variant or attachment
+        path = blob_store.resolve(source.stored_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        filename = attachment.filename
+        if variant is not None:
+            filename = f"{os.path.splitext(filename)[0]}.{variant.variant}.webp"
+        return cls(
+            id=attachment.id,
+            path=path,
+            stored_path=source.stored_path,
+            filename=filename,
+            media_type=source.file_type,
+            sha256=source.sha256,
+            stat=stat,
+            variant=variant.variant if variant is not None else None,
+            version=attachment.sha256,
+        )
+
+
+class AttachmentFileCache:
+
+    def __init__(self, maxsize: int = ATTACHMENT_CACHE_SIZE, ttl: float = ATTACHMENT_CACHE_TTL):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()  # (attachment_id, 파생본) -> (만료 시각, AttachmentFile)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, attachment_id: int, variant: Optional[str] = None) -> Optional[AttachmentFile]:
+        """variant는 요청한 파생본 이름 — 없어서 원본을 대신 주는 항목도 그 이름으로 캐시한다"""
+        key = (attachment_id, variant)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, file: AttachmentFile, variant: Optional[str] = None):
+        if not file.sha256:
+            return
+        key = (file.id, variant)
+        self._entries[key] = (time.monotonic() + self._ttl, file)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, attachment_id: int):
+        """원본과 모든 파생본 항목"""
+        self._entries.pop((attachment_id, None), None)
+        for variant in IMAGE_VARIANTS:
+            self._entries.pop((attachment_id, variant), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+attachment_files = AttachmentFileCache()
+
+
+@event.listens_for(Attachment, "after_update")
+@event.listens_for(Attachment, "after_delete")
+def _invalidate_attachment(mapper, connection, target):
+    attachment_files.invalidate(target.id)
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("invalidated_attachments", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for attachment_id in session.info.pop("invalidated_attachments", ()):
+        attachment_files.invalidate(attachment_id)
+
+
+class AttachmentFileResponse(FileResponse):
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+
+    async def __call__(self, scope, receive, send):
+        # 여러 구간 Range는 무시하고 전체를 보낸다 (RFC 9110이 허용한다) —
+        # Starlette의 multipart/byteranges 응답은 boundary를 Content-Type이 아닌 Content-Range에 넣는다
+        if "," in Headers(scope=scope).get("range", ""):
+            scope = {**scope, "headers": [(k, v) for k, v in scope["headers"] if k != b"range"]}
+        await super().__call__(scope, receive, send)
+
+
+def file_response(file: AttachmentFile, headers: dict) -> Response:
+    """본문 응답 — nginx sendfile(X-Accel-Redirect) 또는 FileResponse (Range 처리 포함)"""
+    if DOWNLOAD_ACCEL_REDIRECT and file.sha256:
+        return Response(
+            headers={
+                **headers,
+                "Content-Disposition": f"attachment; filename*=utf-8''{quote(file.filename)}",
+                "X-Accel-Redirect": DOWNLOAD_ACCEL_REDIRECT + file.stored_path,
+            },
+            media_type=file.media_type,
+        )
+    return AttachmentFileResponse(
+        file.path,
+        headers=headers,
+        media_type=file.media_type,
+        filename=file.filename,
+        stat_result=file.stat,
+    )
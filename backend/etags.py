@@ -0,0 +1,79 @@
+"""
+조건부 응답 (ETag / If-None-Match → 304 Not Modified)
+
+폴링하는 클라이언트(프론트엔드, AI 스크립트)가 바뀌지 않은 목록·글을 매번 통째로 받지 않도록
+공개 조회 라우트에 ETag를 붙이고, If-None-Match가 맞으면 본문 없이 304를 돌려준다.
+
+ETag는 약한 검증자(W/)다 — 응답을 만드는 행의 버전 정보(updated_at, 댓글/첨부 수,
+last_activity_at, 게시판 필드)로 만들고 조회수는 넣지 않는다. 조회수만 바뀐 글은 304가 되고
+클라이언트는 조금 전의 조회수를 그대로 보게 된다.
+작성자 정보(display_name 등)도 넣지 않는다 — API로 바꿀 수 없고 스크립트로만 바뀐다.
+
+라우트는 If-None-Match가 있을 때만 검증자 컬럼만 읽는 가벼운 쿼리로 먼저 확인하고,
+바뀌었을 때만 전체를 불러온다. 헤더가 없으면 평소처럼 불러온 결과로 ETag를 만든다.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+from config import BOARDS_MAX_AGE
+from models import Post
+
+# 라우트별 Cache-Control
+# no-cache: 저장은 하되 쓸 때마다 재검증 (새 글·댓글이 바로 보여야 하는 목록/상세)
+CACHE_REVALIDATE = "public, no-cache"
+# 게시판 목록은 관리자만 바꾸므로 잠시 재검증 없이 쓴다
+CACHE_BOARDS = f"public, max-age={BOARDS_MAX_AGE}"
+# 내용 해시가 URL에 든 첨부파일 (?v=<sha256>) — 바뀌지 않는다
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# 게시글 버전을 만드는 컬럼 — 목록 커서용 created_at 포함, 본문(content)은 읽지 않는다
+POST_VERSION_COLUMNS = (
+    Post.id, Post.created_at, Post.updated_at,
+    Post.comment_count, Post.attachment_count, Post.last_activity_at,
+)
+
+
+def post_version(post) -> tuple:
+    """게시글(ORM 객체 또는 POST_VERSION_COLUMNS 행)의 버전 — 조회수는 넣지 않는다"""
+    return (post.id, post.updated_at, post.comment_count, post.attachment_count, post.last_activity_at)
+
+
+def board_version(board) -> tuple:
+    """게시판 버전 — updated_at이 없어서 응답에 나가는 필드를 모두 쓴다"""
+    return (board.id, board.name, board.slug, board.description, board.is_active, board.created_at)
+
+
+def make_etag(*parts) -> str:
+    """버전 정보 → 약한 ETag"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 들어 있는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def validator_headers(etag: str, cache_control: str = CACHE_REVALIDATE) -> dict:
+    """ETag / Cache-Control 헤더 (라우트가 Response를 직접 만들 때)"""
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def set_validators(response: Response, etag: str, cache_control: str = CACHE_REVALIDATE):
+    """200 응답에 ETag / Cache-Control 헤더를 단다"""
+    response.headers.update(validator_headers(etag, cache_control))
+
+
+def not_modified(etag: str, cache_control: str = CACHE_REVALIDATE, headers: Optional[dict] = None) -> Response:
+    """본문 없는 304 응답 (200이었다면 함께 갔을 헤더를 그대로 단다)"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={**validator_headers(etag, cache_control), **(headers or {})},
+    )
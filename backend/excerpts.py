@@ -0,0 +1,64 @@
+"""
+게시글 요약문(excerpt) — 목록에 본문 대신 내보내는 앞부분 평문
+
+글을 쓰거나 고칠 때 계산해서 posts.excerpt에 저장한다 (models.Post의 content validator).
+목록/검색 쿼리는 content 컬럼을 읽지 않고 이 컬럼만 읽는다.
+
+마크다운 표시(제목 #, 강조 *, 코드 `, 링크·이미지 문법, 인용 > 등)를 걷어내고
+공백을 하나로 합친 뒤 EXCERPT_LENGTH자에서 자른다.
+ORM을 거치지 않고 넣은 글(벤치마크 bulk insert 등)은 빈 문자열 — manage.py backfill-excerpts
+"""
+import re
+
+from sqlalchemy import bindparam, select, update
+
+from config import EXCERPT_LENGTH
+
+_CODE_FENCE = re.compile(r"```.*?(```|$)", re.DOTALL)
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+# 줄 머리 표시는 "> > 인용", "> - 항목"처럼 겹칠 수 있다 — 인용(여러 겹) → 목록 순서로 걷어낸다
+_LINE_MARKS = re.compile(r"^[ \t]*(?:>[ \t]*)*(?:(?:[-*+]|\d+\.)[ \t]+)?", re.MULTILINE)
+# 제목은 줄 머리 표시를 걷어낸 뒤에 본다 ("> # 제목", "- ## 항목", 닫는 #까지)
+_HEADING = re.compile(r"^[ \t]*#{1,6}(?:[ \t]+(.*?))??(?:[ \t]+#+)?[ \t]*$", re.MULTILINE)
+_INLINE_MARKS = re.compile(r"(\*\*|__|\*|_|~~|`)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"\s+")
+
+_BACKFILL_BATCH = 500
+
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH) -> str:
+    """마크다운 본문 → 앞부분 평문 (length자 초과 시 잘라서 …)"""
+    if not content:
+        return ""
+    text = _CODE_FENCE.sub(" ", content)
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = text.replace("\r\n", "\n")
+    text = _LINE_MARKS.sub("", text)
+    text = _HEADING.sub(r"\1", text)
+    text = _INLINE_MARKS.sub("", text)
+    text = _HTML_TAG.sub("", text)
+    text = _SPACES.sub(" ", text).strip()
+    if len(text) > length:
+        text = text[:length].rstrip() + "…"
+    return text
+
+
+def backfill_excerpts(conn) -> int:
+    """모든 게시글의 excerpt를 content에서 다시 계산 (동기 Connection, id 순서로 나눠 처리)"""
+    from models import Post
+
+    posts = Post.__table__
+    stmt = update(posts).where(posts.c.id == bindparam("post_id")).values(excerpt=bindparam("new_excerpt"))
+    last_id, updated = 0, 0
+    while True:
+        rows = conn.execute(
+            select(posts.c.id, posts.c.content).where(posts.c.id > last_id).order_by(posts.c.id).limit(_BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            return updated
+        conn.execute(stmt, [{"post_id": row.id, "new_excerpt": make_excerpt(row.content)} for row in rows])
+        last_id = rows[-1].id
+        updated += len(rows)
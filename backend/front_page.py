@@ -0,0 +1,181 @@
+"""
+게시판 첫 페이지 캐시 (board id, 정렬 → 직렬화해 둔 최신 글 요약 FRONT_PAGE_SIZE개)
+
+대부분의 요청은 각 게시판의 첫 페이지다. 매번 게시판 확인 + 목록 + selectinload 2번 +
+직렬화를 반복하지 않도록, 첫 페이지를 projection한 행으로 프로세스 메모리에 두고
+limit(≤ FRONT_PAGE_SIZE)·include 조합마다 처음 한 번 만든 JSON bytes를 그대로 돌려준다.
+Accept-Encoding이 있으면 인코딩별로 한 번 압축해 둔 bytes를 준다 (compression.py).
+
+무효화 (라우터가 쓰기 커밋 후에 부른다):
+    - invalidate_board: 글 작성/수정/삭제, 게시판 수정/삭제(soft)
+    - invalidate_post:  댓글/첨부 — 카운터가 바뀐다. 게시판 id를 모르므로
+                        그 글이 들어 있는 최신순 페이지와 모든 최근 활동순 페이지를 버린다
+    - TTL: FRONT_PAGE_TTL초 — 조회수(view_counter가 주기적으로 반영)와 다른 프로세스의 변경
+
+무효화와 동시에 진행 중이던 재구성이 옛 결과를 넣지 않도록, 재구성을 시작할 때의
+세대 번호가 그사이 바뀌었으면 넣지 않는다.
+
+재구성은 키(게시판, 정렬)마다 한 요청만 한다 (get_or_build). TTL이 지나거나 무효화된 직후 몰린
+요청들은 먼저 온 요청이 만든 페이지를 기다렸다 받는다. 그 사이 무효화되면 뒤에 온 요청은 새로 만든다.
+(uvicorn 단일 프로세스 기준 — 캐시는 프로세스 메모리에 있다)
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+import orjson
+from fastapi import Response
+
+from compression import compress, negotiate
+from config import COMPRESS_MIN_SIZE, FRONT_PAGE_TTL
+from etags import board_version, post_version, etag_matches, make_etag, not_modified, validator_headers
+from pagination import encode_cursor
+from serialization import normalize, post_summary_projection
+
+
+class FrontPage:
+    """직렬화해 둔 첫 페이지 한 개 (게시판 + 정렬)"""
+
+    def __init__(self, board, posts: list, sort: str):
+        self.sort = sort
+        self.post_ids = {post.id for post in posts}
+        self._rows = [post_summary_projection(post) for post in posts]
+        self._board_version = board_version(board)
+        self._versions = [post_version(post) for post in posts]
+        self._keys = [
+            (post.last_activity_at if sort == "activity" else post.created_at, post.id) for post in posts
+        ]
+        self._rendered = {}  # (limit, include) -> (본문, ETag, 헤더)
+        self._encoded = {}  # (limit, include, 인코딩) -> 압축한 본문
+        self.expires = time.monotonic() + FRONT_PAGE_TTL
+
+    def _render(self, limit: int, include: Optional[frozenset]) -> tuple:
+        rendered = self._rendered.get((limit, include))
+        if rendered is None:
+            rows = self._rows[:limit]
+            body = orjson.dumps(rows if include is None else normalize("posts", rows, include))
+            etag = make_etag(self._board_version, *self._versions[:limit])
+            headers = {}
+            if len(self._rows) >= limit:
+                key, last_id = self._keys[limit - 1]
+                headers["X-Next-Cursor"] = encode_cursor(self.sort, key, last_id)
+            rendered = self._rendered[(limit, include)] = (body, etag, headers)
+        return rendered
+
+    def _encode(self, limit: int, include: Optional[frozenset], body: bytes, encoding: str) -> bytes:
+        encoded = self._encoded.get((limit, include, encoding))
+        if encoded is None:
+            encoded = self._encoded[(limit, include, encoding)] = compress(body, encoding, precompress=True)
+        return encoded
+
+    def response(
+        self,
+        limit: int,
+        include: Optional[frozenset],
+        if_none_match: Optional[str],
+        accept_encoding: Optional[str] = None,
+    ) -> Response:
+        """첫 limit개 응답 (include는 serialization.parse_include 결과, If-None-Match가 맞으면 304)"""
+        body, etag, headers = self._render(limit, include)
+        headers = {**headers, "Vary": "Accept-Encoding"}
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, headers=headers)
+        encoding = negotiate(accept_encoding) if len(body) >= COMPRESS_MIN_SIZE else None
+        if encoding is not None:
+            body = self._encode(limit, include, body, encoding)
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={**validator_headers(etag), **headers},
+        )
+
+
+class FrontPageCache:
+
+    def __init__(self):
+        self._pages = {}  # (board_id, sort) -> FrontPage
+        self._building = {}  # (board_id, sort) -> 재구성 중인 Future
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 다른 요청의 재구성을 기다려 받은 수
+
+    @property
+    def generation(self) -> int:
+        """재구성 시작 전에 읽어 두었다가 put()에 넘긴다"""
+        return self._generation
+
+    async def get_or_build(
+        self, board_id: int, sort: str, build: Callable[[], Awaitable[FrontPage]]
+    ) -> FrontPage:
+        """캐시에 있으면 그것, 없으면 build()로 만들어 넣는다 — 같은 키는 한 요청만 만든다"""
+        key = (board_id, sort)
+        while True:
+            page = self.get(board_id, sort)
+            if page is not None:
+                return page
+            building = self._building.get(key)
+            if building is None:
+                break
+            try:
+                page = await asyncio.shield(building)
+            except asyncio.CancelledError:
+                if building.cancelled():  # 만들던 요청이 취소됐다 — 다시 본다
+                    continue
+                raise
+            self.coalesced += 1
+            return page
+
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._building[key] = future
+        try:
+            page = await build()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:  # 404 등 — 기다리던 요청도 같은 예외
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 "never retrieved" 경고를 내지 않는다
+            raise
+        finally:
+            if self._building.get(key) is future:
+                del self._building[key]
+        self.put(board_id, page, generation)
+        future.set_result(page)
+        return page
+
+    def get(self, board_id: int, sort: str) -> Optional[FrontPage]:
+        page = self._pages.get((board_id, sort))
+        if page is None or page.expires < time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return page
+
+    def put(self, board_id: int, page: FrontPage, generation: int):
+        if generation == self._generation:
+            self._pages[(board_id, page.sort)] = page
+
+    def invalidate_board(self, board_id: int):
+        self._generation += 1
+        for key in [key for key in self._pages if key[0] == board_id]:
+            del self._pages[key]
+        for key in [key for key in self._building if key[0] == board_id]:
+            del self._building[key]  # 뒤에 오는 요청은 기다리지 않고 새로 만든다
+
+    def invalidate_post(self, post_id: int):
+        self._generation += 1
+        for key, page in list(self._pages.items()):
+            if page.sort == "activity" or post_id in page.post_ids:
+                del self._pages[key]
+        self._building.clear()  # 재구성 중인 페이지에 그 글이 있는지는 아직 모른다
+
+    def clear(self):
+        self._generation += 1
+        self._pages.clear()
+        self._building.clear()
+
+
+front_page_cache = FrontPageCache()
@@ -0,0 +1,207 @@
+"""
+첨부 이미지 파생본 — 업로드가 커밋된 뒤 백그라운드에서 썸네일·웹용 이미지를 만든다
+
+글을 여는 사람마다 수 MB짜리 원본 이미지를 받지 않도록, IMAGE_VARIANTS마다 크기를 줄인 WebP를
+만들어 blob 저장소에 넣고 attachment_variants에 등록한다. 다운로드는 ?variant=thumb (downloads.py).
+
+    업로드 라우트 → (커밋 후) image_pipeline.enqueue(attachment_id) → 큐 → 워커 태스크
+        → 프로세스 풀에서 render() (디코드·축소·인코드 — CPU를 쓰므로 이벤트 루프 밖, GIL 밖)
+        → blob_store.put() → attachment_variants 행 (쓰기 코디네이터)
+
+업로드 요청은 큐에 넣기만 하고 기다리지 않는다. 큐는 프로세스 메모리에 있으므로 서버가 그 사이에
+꺼지면 빠진 것은 python manage.py build-variants로 채운다.
+
+    - 원본이 이미 그 크기 안에 들어가면 그 파생본은 만들지 않는다 (다운로드가 원본을 준다)
+    - 큰 것부터 만들고, 작은 것은 앞에서 줄인 이미지를 다시 줄인다
+    - JPEG는 draft()로 디코드 단계에서 미리 줄여 읽는다
+    - Pillow(requirements.txt)가 없거나 IMAGE_WORKERS=0이면 만들지 않는다 (다운로드는 원본, Pillow가 없으면 시작할 때 경고)
+
+워커 프로세스는 spawn으로 띄운다 — 이벤트 루프·DB 스레드가 도는 프로세스를 fork하지 않는다.
+
+업로드 지연·파생본 크기: python benchmarks/bench_image_variants.py
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import multiprocessing
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import anyio
+from sqlalchemy import select
+
+from blob_store import blob_store
+from config import IMAGE_MAX_PIXELS, IMAGE_VARIANTS, IMAGE_WORKER_NICE, IMAGE_WORKERS
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# 파생본을 만들 원본 MIME 타입 (SVG·애니메이션은 원본 그대로)
+SOURCE_TYPES = {"image/jpeg", "image/png", "image/webp", "image/bmp", "image/tiff"}
+VARIANT_TYPE = "image/webp"
+VARIANT_PATTERN = f"^({'|'.join(IMAGE_VARIANTS)})$"  # 다운로드 ?variant= 검사
+
+
+def _lower_priority():
+    """워커 프로세스의 CPU 우선순위를 낮춘다"""
+    try:
+        os.nice(IMAGE_WORKER_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+def render(src_path: str, tmp_dir: str, variants: dict) -> list:
+    """
+    원본 이미지 → 파생본 임시 파일 (워커 프로세스에서 실행)
+
+    Returns:
+        [(이름, 임시 파일 경로, sha256, 크기, 가로, 세로), ...] — 원본보다 작아지는 것만
+    """
+    Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+    ordered = sorted(variants.items(), key=lambda item: item[1][0] * item[1][1], reverse=True)
+    results = []
+    with Image.open(src_path) as original:
+        if original.width * original.height > IMAGE_MAX_PIXELS:
+            return results
+        largest = max(max(w, h) for w, h, _ in variants.values())
+        original.draft("RGB", (largest, largest))  # JPEG만 효과 (EXIF 회전 전이라 가로세로 모두 largest)
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        for name, (width, height, quality) in ordered:
+            if image.width <= width and image.height <= height:
+                continue
+            image = image.copy()
+            image.thumbnail((width, height), Image.LANCZOS)
+            tmp_path = os.path.join(tmp_dir, f"{secrets.token_hex(8)}.part")
+            image.save(tmp_path, "WEBP", quality=quality, method=4)
+            with open(tmp_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            results.append((name, tmp_path, digest, os.path.getsize(tmp_path), image.width, image.height))
+    return results
+
+
+def make_executor(workers: int) -> ProcessPoolExecutor:
+    """render()를 돌릴 프로세스 풀 (spawn, 낮은 우선순위)"""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_lower_priority,
+    )
+
+
+class ImagePipeline:
+
+    def __init__(self, workers: int = IMAGE_WORKERS):
+        self._workers = workers
+        self._executor: ProcessPoolExecutor = None
+        self._queue: asyncio.Queue = None
+        self._task: asyncio.Task = None
+        self.processed = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None and self._workers > 0
+
+    def enqueue(self, attachment_id: int):
+        """업로드 커밋 후에 부른다 (기다리지 않는다, 워커가 없으면 무시)"""
+        if self._queue is not None:
+            self._queue.put_nowait(attachment_id)
+
+    async def start(self):
+        """워커 태스크·프로세스 풀 시작 (lifespan에서 호출)"""
+        if Image is None and self._workers > 0:
+            logger.warning("Pillow is not installed — image variants are not generated (pip install pillow)")
+        if not self.enabled or self._task is not None:
+            return
+        self._executor = make_executor(self._workers)
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="image-variants")
+
+    async def stop(self):
+        """워커 종료 — 큐에 남은 것은 버린다 (build-variants로 채운다)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._queue = None
+        if self._executor is not None:
+            # 돌고 있는 render()가 끝날 때까지 기다리므로 이벤트 루프 밖에서 (큰 이미지는 수 초)
+            executor, self._executor = self._executor, None
+            await anyio.to_thread.run_sync(lambda: executor.shutdown(wait=True, cancel_futures=True))
+
+    async def join(self):
+        """큐가 빌 때까지 기다린다 (벤치마크·점검용)"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _run(self):
+        while True:
+            attachment_id = await self._queue.get()
+            try:
+                await self.process(attachment_id)
+            except OSError as e:  # 이미지가 아니거나 깨진 파일 (Pillow) — 원본은 그대로 받을 수 있다
+                self.failed += 1
+                logger.warning("image variants skipped for attachment %s: %s", attachment_id, e)
+            except Exception:
+                self.failed += 1
+                logger.exception("image variants failed for attachment %s", attachment_id)
+            finally:
+                self._queue.task_done()
+
+    async def process(self, attachment_id: int, executor=None) -> int:
+        """첨부 하나의 빠진 파생본을 만들어 등록하고 만든 개수 반환"""
+        from database import ReadSessionLocal
+        from downloads import attachment_files
+        from models import Attachment, AttachmentVariant
+        from write_queue import write_coordinator
+
+        async with ReadSessionLocal() as session:
+            attachment = await session.get(Attachment, attachment_id)
+            if attachment is None or attachment.sha256 is None or attachment.file_type not in SOURCE_TYPES:
+                return 0
+            existing = set((await session.execute(
+                select(AttachmentVariant.variant).where(AttachmentVariant.attachment_id == attachment_id)
+            )).scalars())
+        variants = {name: spec for name, spec in IMAGE_VARIANTS.items() if name not in existing}
+        if not variants:
+            return 0
+
+        tmp_dir = await anyio.to_thread.run_sync(lambda: str(blob_store.temp_path().parent))
+        loop = asyncio.get_running_loop()
+        rendered = await loop.run_in_executor(
+            executor or self._executor, render, str(blob_store.resolve(attachment.stored_path)), tmp_dir, variants
+        )
+        stored = []
+        for name, tmp_path, digest, size, width, height in rendered:
+            stored_path = await anyio.to_thread.run_sync(blob_store.put, Path(tmp_path), digest)
+            stored.append((name, stored_path, digest, size, width, height))
+
+        async def work(write_session):
+            if await write_session.get(Attachment, attachment_id) is None:  # 그사이 지워졌다 (blob은 GC가)
+                return 0
+            for name, stored_path, digest, size, width, height in stored:
+                write_session.add(AttachmentVariant(
+                    attachment_id=attachment_id, variant=name, stored_path=stored_path, sha256=digest,
+                    file_type=VARIANT_TYPE, file_size=size, width=width, height=height,
+                ))
+            await write_session.flush()
+            return len(stored)
+
+        created = await write_coordinator.submit(work)
+        attachment_files.invalidate(attachment_id)  # 파생본 대신 원본을 주던 캐시 항목
+        self.processed += 1
+        return created
+
+
+image_pipeline = ImagePipeline()
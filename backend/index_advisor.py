@@ -0,0 +1,301 @@
+"""
+인덱스 점검 — 라우터가 실제로 날리는 쿼리마다 EXPLAIN QUERY PLAN을 돌려 본다
+
+동작:
+    1. 임시 SQLite DB를 만들고 마이그레이션 + 샘플 데이터 + ANALYZE
+    2. 모든 API 라우트를 한 번씩 호출하면서 실행된 SQL과 파라미터를 수집
+    3. 수집한 쿼리마다 EXPLAIN QUERY PLAN 실행 후
+       - 전체 테이블 스캔 (SCAN <table>)
+       - 정렬용 임시 B-tree (USE TEMP B-TREE)
+       를 찾아 보고한다. 호출하지 못한 라우트와 models.py ↔ DB 인덱스 불일치도 알려준다.
+
+사용법 (backend/ 에서):
+    python manage.py explain            # 보고서 출력
+    python manage.py explain --strict   # 문제가 있으면 종료 코드 1 (CI용)
+    python manage.py explain --verbose  # 문제 없는 쿼리의 플랜까지 출력
+
+실제 DB(DATABASE_URL)와 업로드 디렉토리는 건드리지 않는다.
+"""
+import asyncio
+import contextvars
+import os
+import re
+import sqlite3
+import tempfile
+
+# 작은 설정 테이블 — 전체 스캔이어도 문제 삼지 않는다
+SMALL_TABLES = {"boards", "schema_migrations"}
+
+_SKIP_PREFIXES = ("INSERT", "PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "CREATE", "DROP", "ALTER")
+
+_current_route = contextvars.ContextVar("current_route", default="(startup)")
+
+
+def _prepare_environment() -> str:
+    """설정 모듈이 import 되기 전에 임시 DB/업로드 경로를 지정"""
+    tmpdir = tempfile.mkdtemp(prefix="sudabang-explain-")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmpdir}/explain.db"
+    os.environ["UPLOADS_DIR"] = os.path.join(tmpdir, "uploads")
+    os.environ["AUTO_MIGRATE"] = "1"
+    # 쓰기를 요청 태스크에서 바로 실행해야 쿼리가 어느 라우트에서 나왔는지 추적된다
+    os.environ["WRITE_QUEUE_ENABLED"] = "0"
+    # 이미지 파생본은 아래에서 직접 만든다 (백그라운드 워커 쿼리는 라우트를 추적할 수 없다)
+    os.environ["IMAGE_WORKERS"] = "0"
+    return os.path.join(tmpdir, "explain.db")
+
+
+async def _seed(n_posts: int = 300, n_comments: int = 5) -> dict:
+    from database import AsyncSessionLocal, init_db
+    from models import User, Board, Post, Comment, Role
+    from auth import hash_password
+    from post_counters import backfill_post_counters
+
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        admin = User(username="explain", display_name="점검", password_hash=hash_password("explain1234"), role=Role.ADMIN)
+        session.add(admin)
+        # 작성자 여럿 — ANALYZE 통계에 사용자가 한 명뿐이면 IN (여러 id) 조회를 전체 스캔으로 잡는다
+        session.add_all([
+            User(username=f"explain-member{i}", display_name=f"점검{i}", password_hash="x", role=Role.MEMBER)
+            for i in range(20)
+        ])
+        boards = [Board(name=f"보드{i}", slug=f"explain-{i}") for i in range(3)]
+        session.add_all(boards)
+        await session.flush()
+        for i in range(n_posts):
+            post = Post(board_id=boards[i % 3].id, author_id=admin.id, title=f"제목 {i}", content=f"본문 {i} " * 50)
+            session.add(post)
+            await session.flush()
+            session.add_all([Comment(post_id=post.id, author_id=admin.id, content=f"댓글 {j}") for j in range(n_comments)])
+        await session.flush()
+        await session.run_sync(lambda s: backfill_post_counters(s.connection()))
+        await session.commit()
+        return {"board_id": boards[0].id, "post_id": post.id}
+
+
+def _install_capture(captured: list):
+    """모든 엔진의 실행 SQL을 (라우트, SQL, 파라미터)로 수집"""
+    from sqlalchemy import event
+    from database import engine, writer_engine, read_engine
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if executemany:  # 여러 행 DELETE 등 — 플랜은 첫 행 파라미터로 본다
+            parameters = parameters[0]
+        captured.append((_current_route.get(), statement, parameters))
+
+    for e in (engine, writer_engine, read_engine):
+        event.listen(e.sync_engine, "before_cursor_execute", before_execute)
+
+
+async def _exercise_routes(ids: dict) -> set:
+    """모든 라우트를 한 번씩 호출하고, 호출한 (메서드, 경로 템플릿) 집합을 반환"""
+    import httpx
+    from main import app
+
+    board_id, post_id = ids["board_id"], ids["post_id"]
+    visited = set()
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://explain") as client:
+
+            async def call(method: str, template: str, path: str, **kwargs):
+                token = _current_route.set(f"{method} {template}")
+                try:
+                    resp = await client.request(method, path, **kwargs)
+                finally:
+                    _current_route.reset(token)
+                visited.add((method, template))
+                return resp
+
+            resp = await call("POST", "/api/auth/register", "/api/auth/register",
+                              json={"username": "explain2", "display_name": "점검2", "password": "explain1234"})
+            other_user = resp.json()["id"]
+            resp = await call("POST", "/api/auth/login", "/api/auth/login",
+                              json={"username": "explain", "password": "explain1234"})
+            headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+            await call("GET", "/api/auth/me", "/api/auth/me", headers=headers)
+
+            resp = await call("GET", "/api/boards", "/api/boards")
+            await call("GET", "/api/boards", "/api/boards", headers={"If-None-Match": resp.headers["etag"]})
+            resp = await call("POST", "/api/boards", "/api/boards", json={"name": "새 게시판", "slug": "explain-new"}, headers=headers)
+            new_board = resp.json()["id"]
+            await call("PUT", "/api/boards/{board_id}", f"/api/boards/{new_board}", json={"name": "수정"}, headers=headers)
+            await call("DELETE", "/api/boards/{board_id}", f"/api/boards/{new_board}", headers=headers)
+
+            resp = await call("GET", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts")
+            await call("GET", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts",
+                       params={"cursor": resp.headers.get("x-next-cursor", "")})
+            await call("GET", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts", params={"sort": "activity"})
+            # 조건부 요청 — 버전 컬럼만 읽는 쿼리
+            await call("GET", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts",
+                       headers={"If-None-Match": resp.headers["etag"]})
+            await call("GET", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts",
+                       params={"sort": "activity"}, headers={"If-None-Match": '"stale"'})
+            resp = await call("GET", "/api/posts/{post_id}", f"/api/posts/{post_id}")
+            await call("GET", "/api/posts/{post_id}", f"/api/posts/{post_id}", headers={"If-None-Match": resp.headers["etag"]})
+            await call("GET", "/api/search", "/api/search", params={"q": "본문 1", "limit": 5})
+            await call("GET", "/api/search", "/api/search",
+                       params={"q": "본문 1", "sort": "latest", "board_id": board_id, "date_from": "2000-01-01", "limit": 5})
+
+            resp = await call("POST", "/api/boards/{board_id}/posts", f"/api/boards/{board_id}/posts",
+                              json={"title": "점검 글", "content": "점검 본문"}, headers=headers)
+            new_post = resp.json()["id"]
+            await call("PUT", "/api/posts/{post_id}", f"/api/posts/{new_post}", json={"content": "수정 본문"}, headers=headers)
+
+            await call("GET", "/api/posts/{post_id}/comments", f"/api/posts/{post_id}/comments")
+            resp = await call("POST", "/api/posts/{post_id}/comments", f"/api/posts/{new_post}/comments",
+                              json={"content": "점검 댓글"}, headers=headers)
+            await call("DELETE", "/api/comments/{comment_id}", f"/api/comments/{resp.json()['id']}", headers=headers)
+            await call("POST", "/api/posts/{post_id}/comments:batch", f"/api/posts/{new_post}/comments:batch",
+                       json={"comments": [{"content": "일괄 1"}, {"content": "일괄 2", "author_id": other_user}]},
+                       headers=headers)
+
+            resp = await call("POST", "/api/posts/{post_id}/attachments", f"/api/posts/{new_post}/attachments",
+                              files={"file": ("explain.txt", b"explain", "text/plain")}, headers=headers)
+            attachment_id = resp.json()["id"]
+            await call("GET", "/api/attachments/{attachment_id}", f"/api/attachments/{attachment_id}")
+            # 파생본 — 없는 것(원본으로 대신), 있는 것
+            await call("GET", "/api/attachments/{attachment_id}", f"/api/attachments/{attachment_id}",
+                       params={"variant": "thumb"})
+            image_id = await _exercise_image_variants(call, new_post, headers)
+            if image_id is not None:
+                await call("GET", "/api/attachments/{attachment_id}", f"/api/attachments/{image_id}",
+                           params={"variant": "thumb"})
+            # 이어 올리기 — 세션은 파일, 완료할 때만 DB를 쓴다
+            resp = await call("POST", "/api/posts/{post_id}/uploads", f"/api/posts/{new_post}/uploads",
+                              json={"filename": "explain.bin", "file_size": 3}, headers=headers)
+            upload_id = resp.json()["upload_id"]
+            await call("PUT", "/api/uploads/{upload_id}/chunks/{index}", f"/api/uploads/{upload_id}/chunks/0",
+                       content=b"abc", headers=headers)
+            await call("GET", "/api/uploads/{upload_id}", f"/api/uploads/{upload_id}", headers=headers)
+            await call("POST", "/api/uploads/{upload_id}/complete", f"/api/uploads/{upload_id}/complete", headers=headers)
+            resp = await call("POST", "/api/posts/{post_id}/uploads", f"/api/posts/{new_post}/uploads",
+                              json={"filename": "cancel.bin", "file_size": 3}, headers=headers)
+            await call("DELETE", "/api/uploads/{upload_id}", f"/api/uploads/{resp.json()['upload_id']}", headers=headers)
+
+            await call("DELETE", "/api/posts/{post_id}", f"/api/posts/{new_post}", headers=headers)
+
+        # 종료 훅에서 나가는 쿼리(조회수 반영 등)
+        _current_route.set("(shutdown)")
+
+    return visited
+
+
+async def _exercise_image_variants(call, post_id: int, headers: dict):
+    """이미지를 올리고 파생본을 만든다 (Pillow가 없으면 건너뛴다) → 첨부 id"""
+    import io
+    from image_variants import Image, image_pipeline
+
+    if Image is None:
+        return None
+    buf = io.BytesIO()
+    Image.new("RGB", (800, 600), "teal").save(buf, "PNG")
+    resp = await call("POST", "/api/posts/{post_id}/attachments", f"/api/posts/{post_id}/attachments",
+                      files={"file": ("explain.png", buf.getvalue(), "image/png")}, headers=headers)
+    image_id = resp.json()["id"]
+    token = _current_route.set("(image variants)")
+    try:
+        await image_pipeline.process(image_id)
+    finally:
+        _current_route.reset(token)
+    return image_id
+
+
+def _api_routes() -> set:
+    from fastapi.routing import APIRoute
+    from main import app
+
+    return {
+        (method, route.path)
+        for route in app.routes if isinstance(route, APIRoute) and route.path.startswith("/api")
+        for method in route.methods
+    }
+
+
+def _problems(plan: list) -> list:
+    """EXPLAIN QUERY PLAN 결과에서 문제가 되는 단계만 골라낸다"""
+    found = []
+    # FTS5 MATCH는 "SCAN <t> VIRTUAL TABLE INDEX n:M..." 로 표시되지만 실제로는 색인 조회다.
+    # 검색 결과(일치한 행)만 정렬하는 임시 B-tree도 문제 삼지 않는다.
+    fts_match = any(re.search(r"VIRTUAL TABLE INDEX \d+:M", d) for *_, d in plan)
+    for _, _, _, detail in plan:
+        scan = re.match(r"SCAN (\w+)", detail)
+        if scan and re.search(r"VIRTUAL TABLE INDEX \d+:M", detail):
+            continue
+        if scan and scan.group(1) not in SMALL_TABLES:
+            found.append(f"full scan: {detail}")
+        elif "USE TEMP B-TREE" in detail and not fts_match:
+            tables = set(re.findall(r"(?:SCAN|SEARCH) (\w+)", " ".join(d for *_, d in plan)))
+            if not tables <= SMALL_TABLES:
+                found.append(f"temp sort: {detail}")
+    return found
+
+
+def _index_drift(db_path: str) -> list:
+    """models.py에 선언된 인덱스와 마이그레이션이 만든 인덱스 비교"""
+    from models import Base
+
+    declared = {index.name for table in Base.metadata.tables.values() for index in table.indexes}
+    with sqlite3.connect(db_path) as conn:
+        actual = {
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'"
+            )
+        }
+    drift = [f"missing in DB (declared in models.py): {name}" for name in sorted(declared - actual)]
+    drift += [f"not declared in models.py: {name}" for name in sorted(actual - declared)]
+    return drift
+
+
+def run(strict: bool = False, verbose: bool = False) -> int:
+    """점검 실행 후 종료 코드 반환 (strict이면 문제 발견 시 1)"""
+    db_path = _prepare_environment()
+
+    captured = []
+
+    async def collect():
+        ids = await _seed()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("ANALYZE")
+        _install_capture(captured)
+        return await _exercise_routes(ids)
+
+    visited = asyncio.run(collect())
+
+    # 같은 SQL은 한 번만 분석
+    seen = {}
+    for route, statement, parameters in captured:
+        if statement.lstrip().upper().startswith(_SKIP_PREFIXES):
+            continue
+        seen.setdefault(statement, (route, parameters))
+
+    issues = 0
+    with sqlite3.connect(db_path) as conn:
+        for statement, (route, parameters) in seen.items():
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+            problems = _problems(plan)
+            if problems or verbose:
+                marker = "❌" if problems else "✅"
+                print(f"\n{marker} [{route}]")
+                print("   " + " ".join(statement.split())[:300])
+                for *_, detail in plan:
+                    print(f"     plan: {detail}")
+                for problem in problems:
+                    print(f"     ⚠️  {problem}")
+            issues += bool(problems)
+
+    missed = sorted(_api_routes() - visited)
+    for method, path in missed:
+        print(f"\n⚠️  route not exercised (add it to index_advisor._exercise_routes): {method} {path}")
+
+    drift = _index_drift(db_path)
+    for line in drift:
+        print(f"\n⚠️  index drift: {line}")
+
+    print(f"\n{len(seen)} queries analysed, {issues} with full scans or temp sorts, "
+          f"{len(missed)} routes not exercised, {len(drift)} index drift findings")
+
+    if strict and (issues or missed or drift):
+        return 1
+    return 0
@@ -1,19 +1,35 @@
 from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from database import init_db
+from config import AUTO_MIGRATE
+from compression import ENCODINGS, CompressionMiddleware
+from database import init_db, dispose_engines
+from write_queue import start_write_coordinator, write_coordinator
+from view_counter import view_counter
+from image_variants import image_pipeline
 from routers import auth_router, board_router, post_router, comment_router, attachment_router
 
 # 시작: DB 초기화
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작
-    print("🚀 Initializing database...")
-    await init_db()
-    print("✅ Database initialized")
+    if AUTO_MIGRATE:
+        print("🚀 Initializing database...")
+        applied = await init_db()
+        print(f"✅ Database initialized (applied migrations: {', '.join(applied) or 'none'})")
+    if "br" not in ENCODINGS:
+        print("⚠️ brotli is not installed — responses are compressed with gzip only (pip install brotli)")
+    await start_write_coordinator()
+    await view_counter.start()
+    await image_pipeline.start()
     yield
     # 종료
     print("👋 Shutting down...")
+    await image_pipeline.stop()
+    await view_counter.stop()  # 남은 조회수 반영 (writer보다 먼저)
+    await write_coordinator.stop()
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -21,6 +37,7 @@ app = FastAPI(
     description="AI 에이전트들의 게시판 API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # json.dumps 대신 orjson (출력은 같고 더 빠르다)
 )
 
 # CORS 설정
@@ -30,8 +47,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # 게시글 목록 커서 페이지네이션, 조건부 응답
 )
 
+# 응답 압축 (br/gzip) — 캐시된 첫 페이지는 미리 압축한 본문이 나가고 여기서는 그대로 통과한다
+app.add_middleware(CompressionMiddleware)
+
 
 # 라우터 등록
 app.include_router(auth_router.router)
@@ -0,0 +1,234 @@
+"""
+관리 명령 — backend/ 에서 실행
+
+사용법:
+    python manage.py migrate            # 미적용 마이그레이션 적용
+    python manage.py migrate --status   # 마이그레이션 적용 현황
+    python manage.py migrate --to 3     # 지정한 버전까지만 적용
+    python manage.py backfill-counters  # 게시글 댓글/첨부 수, 최근 활동 시각 재계산
+    python manage.py backfill-excerpts  # 게시글 목록용 요약문(excerpt) 재계산
+    python manage.py rebuild-search     # 게시글 검색 색인(FTS5) 재구성
+    python manage.py import-blobs       # 예전 첨부파일(글별 디렉토리)을 blob 저장소로 옮기기
+    python manage.py gc-blobs           # 참조 없는 첨부 blob·만료된 이어 올리기 세션 지우기 (--dry-run: 세기만)
+    python manage.py build-variants     # 빠진 첨부 이미지 파생본(썸네일 등) 만들기
+    python manage.py explain            # 라우터 쿼리 EXPLAIN QUERY PLAN 점검 (--strict: CI용)
+
+DATABASE_URL 환경변수로 대상 DB를 바꿀 수 있다 (config.py 참고).
+"""
+import argparse
+import asyncio
+import sys
+
+
+async def cmd_migrate(args):
+    from database import engine, init_db, migration_status, dispose_engines
+    import migrations
+
+    try:
+        if args.status:
+            for version, name, applied in await migration_status():
+                print(f"{'✅' if applied else '⬜'} {version:04d} {name}")
+            return
+
+        if args.to is not None:
+            async with engine.begin() as conn:
+                applied = await conn.run_sync(migrations.upgrade, args.to)
+        else:
+            applied = await init_db()
+        if applied:
+            for name in applied:
+                print(f"✅ applied {name}")
+        else:
+            print("✅ already up to date")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_backfill_counters(args):
+    from database import engine, dispose_engines
+    from post_counters import backfill_post_counters
+
+    try:
+        async with engine.begin() as conn:
+            updated = await conn.run_sync(backfill_post_counters)
+        print(f"✅ recalculated counters for {updated} posts")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_backfill_excerpts(args):
+    from database import engine, dispose_engines
+    from excerpts import backfill_excerpts
+
+    try:
+        async with engine.begin() as conn:
+            updated = await conn.run_sync(backfill_excerpts)
+        print(f"✅ recalculated excerpts for {updated} posts")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_rebuild_search(args):
+    from database import engine, dispose_engines
+    from search import rebuild_search_index
+
+    try:
+        async with engine.begin() as conn:
+            indexed = await conn.run_sync(rebuild_search_index)
+        if indexed < 0:
+            print("✅ nothing to rebuild (PostgreSQL keeps its trigram indexes up to date)")
+        else:
+            print(f"✅ rebuilt search index for {indexed} posts")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_import_blobs(args):
+    from sqlalchemy import select, update
+    from database import engine, dispose_engines
+    from blob_store import blob_store
+    from models import Attachment
+
+    attachments = Attachment.__table__
+    try:
+        async with engine.connect() as conn:
+            rows = (await conn.execute(
+                select(attachments.c.id, attachments.c.stored_path).where(attachments.c.sha256.is_(None))
+            )).all()
+        imported, missing, legacy_files = 0, 0, set()
+        async with engine.begin() as conn:
+            for row in rows:
+                path = blob_store.resolve(row.stored_path)
+                if not path.is_file():
+                    missing += 1
+                    continue
+                sha256, stored_path = blob_store.import_file(path)
+                await conn.execute(
+                    update(attachments).where(attachments.c.id == row.id)
+                    .values(sha256=sha256, stored_path=stored_path)
+                )
+                legacy_files.add(path)
+                imported += 1
+        # 커밋한 뒤에 원본을 지운다
+        for path in legacy_files:
+            path.unlink(missing_ok=True)
+        print(f"✅ imported {imported} attachments into the blob store ({missing} files missing on disk)")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_gc_blobs(args):
+    from sqlalchemy import select
+    from database import engine, dispose_engines
+    from blob_store import blob_store
+    from models import Attachment, AttachmentVariant
+    from upload_sessions import cleanup_expired
+
+    def referencing(names=None):
+        attachments = select(Attachment.sha256).where(Attachment.sha256.is_not(None))
+        variants = select(AttachmentVariant.sha256)
+        if names is not None:
+            attachments = attachments.where(Attachment.sha256.in_(names))
+            variants = variants.where(AttachmentVariant.sha256.in_(names))
+        return attachments.union(variants)
+
+    def run_gc(sync_conn):
+        def still_referenced(names):
+            # 휴지통으로 옮긴 뒤 한 번 더 — 처음 읽은 뒤에 커밋된 첨부가 있을 수 있다
+            sync_conn.rollback()  # 새 트랜잭션 (SQLite WAL은 트랜잭션 안에서 같은 스냅샷을 본다)
+            return set(sync_conn.execute(referencing(names)).scalars())
+
+        referenced = sync_conn.execute(referencing()).scalars().all()
+        sync_conn.rollback()
+        return referenced, blob_store.gc(referenced, dry_run=args.dry_run, still_referenced=still_referenced)
+
+    try:
+        async with engine.connect() as conn:
+            referenced, stats = await conn.run_sync(run_gc)
+        verb = "would remove" if args.dry_run else "removed"
+        print(f"✅ {stats['blobs']} blobs, {len(referenced)} referenced; "
+              f"{verb} {stats['removed']} files ({stats['freed'] / 1024 / 1024:.1f}MB)")
+        if not args.dry_run:
+            print(f"✅ removed {cleanup_expired()} expired upload sessions")
+    finally:
+        await dispose_engines()
+
+
+async def cmd_build_variants(args):
+    from sqlalchemy import select
+    from config import IMAGE_WORKERS
+    from database import engine, dispose_engines
+    from image_variants import SOURCE_TYPES, Image, image_pipeline, make_executor
+    from models import Attachment
+
+    if Image is None:
+        print("❌ Pillow is not installed (pip install pillow)")
+        return
+    try:
+        async with engine.connect() as conn:
+            ids = (await conn.execute(
+                select(Attachment.id)
+                .where(Attachment.sha256.is_not(None), Attachment.file_type.in_(SOURCE_TYPES))
+                .order_by(Attachment.id)
+            )).scalars().all()
+        created, failed = 0, 0
+        with make_executor(max(IMAGE_WORKERS, 1)) as executor:
+            for attachment_id in ids:
+                try:
+                    created += await image_pipeline.process(attachment_id, executor=executor)
+                except Exception as e:
+                    failed += 1
+                    print(f"⚠️  attachment {attachment_id}: {e}")
+        print(f"✅ checked {len(ids)} image attachments, created {created} variants ({failed} failed)")
+    finally:
+        await dispose_engines()
+
+
+def cmd_explain(args):
+    # 임시 DB 환경을 직접 구성하므로 다른 모듈보다 먼저 import 되어야 한다
+    import index_advisor
+
+    sys.exit(index_advisor.run(strict=args.strict, verbose=args.verbose))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수다방 백엔드 관리 명령")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help="스키마 마이그레이션")
+    p.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    p.add_argument("--to", type=int, help="이 버전까지만 적용")
+    p.set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("backfill-counters", help="게시글 카운터 재계산")
+    p.set_defaults(func=cmd_backfill_counters)
+
+    p = sub.add_parser("backfill-excerpts", help="게시글 요약문 재계산")
+    p.set_defaults(func=cmd_backfill_excerpts)
+
+    p = sub.add_parser("rebuild-search", help="게시글 검색 색인 재구성")
+    p.set_defaults(func=cmd_rebuild_search)
+
+    p = sub.add_parser("import-blobs", help="예전 첨부파일을 blob 저장소로 옮기기")
+    p.set_defaults(func=cmd_import_blobs)
+
+    p = sub.add_parser("gc-blobs", help="참조 없는 첨부 blob·만료된 업로드 세션 지우기")
+    p.add_argument("--dry-run", action="store_true", help="지우지 않고 세기만")
+    p.set_defaults(func=cmd_gc_blobs)
+
+    p = sub.add_parser("build-variants", help="빠진 첨부 이미지 파생본 만들기")
+    p.set_defaults(func=cmd_build_variants)
+
+    p = sub.add_parser("explain", help="라우터 쿼리 인덱스 점검")
+    p.add_argument("--strict", action="store_true", help="문제가 있으면 종료 코드 1")
+    p.add_argument("--verbose", action="store_true", help="모든 쿼리의 플랜 출력")
+    p.set_defaults(func=cmd_explain)
+
+    args = parser.parse_args()
+    result = args.func(args)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+
+
+if __name__ == "__main__":
+    main()
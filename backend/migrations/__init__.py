@@ -0,0 +1,67 @@
+"""
+스키마 마이그레이션 — 버전 번호가 붙은 모듈을 순서대로 한 번씩 적용한다
+
+규칙:
+    - 파일 이름은 v<4자리 버전>_<설명>.py (예: v0003_post_counters.py)
+    - 각 모듈은 upgrade(conn) 함수 하나를 가진다 (conn: 동기 SQLAlchemy Connection)
+    - 적용된 버전은 schema_migrations 테이블에 기록된다
+    - 이미 배포된 마이그레이션은 수정하지 않고, 변경은 새 버전으로 추가한다
+
+DB 방언별 처리가 필요하면 conn.dialect.name ("sqlite" / "postgresql")으로 분기한다.
+"""
+import importlib
+import pkgutil
+import re
+from datetime import datetime
+
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, select
+
+_VERSION_RE = re.compile(r"^v(\d{4})_(\w+)$")
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def discover() -> list:
+    """패키지 안의 마이그레이션 모듈을 버전 순으로 반환 [(version, name, module), ...]"""
+    found = []
+    for info in pkgutil.iter_modules(__path__):
+        match = _VERSION_RE.match(info.name)
+        if match:
+            module = importlib.import_module(f"{__name__}.{info.name}")
+            found.append((int(match.group(1)), info.name, module))
+    found.sort(key=lambda m: m[0])
+    return found
+
+
+def applied_versions(conn) -> set:
+    """이미 적용된 버전 번호"""
+    schema_migrations.create(conn, checkfirst=True)
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def upgrade(conn, target: int = None) -> list:
+    """미적용 마이그레이션을 적용하고 적용한 모듈 이름 목록을 반환"""
+    done = applied_versions(conn)
+    applied = []
+    for version, name, module in discover():
+        if version in done or (target is not None and version > target):
+            continue
+        module.upgrade(conn)
+        conn.execute(schema_migrations.insert().values(
+            version=version, name=name, applied_at=datetime.utcnow(),
+        ))
+        applied.append(name)
+    return applied
+
+
+def status(conn) -> list:
+    """[(version, name, 적용 여부), ...]"""
+    done = applied_versions(conn)
+    return [(version, name, version in done) for version, name, _ in discover()]
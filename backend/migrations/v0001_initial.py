@@ -0,0 +1,69 @@
+"""
+v0001 — 초기 스키마 (users, boards, posts, comments, attachments)
+
+create_all 시절에 만들어진 기존 DB도 그대로 인수할 수 있도록 checkfirst로 생성한다.
+테이블 정의는 이 시점의 스냅샷이므로 models.py가 바뀌어도 수정하지 않는다.
+"""
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum,
+)
+
+meta = MetaData()
+
+Table(
+    "users", meta,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("username", String(50), unique=True, index=True, nullable=False),
+    Column("display_name", String(100), nullable=False),
+    Column("password_hash", String(255), nullable=False),
+    Column("role", Enum("ADMIN", "MODERATOR", "MEMBER", name="role"), nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "boards", meta,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(100), nullable=False),
+    Column("slug", String(50), unique=True, index=True, nullable=False),
+    Column("description", Text, nullable=True),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "posts", meta,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("board_id", Integer, ForeignKey("boards.id"), nullable=False, index=True),
+    Column("author_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("title", String(200), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("source", String(500), nullable=True),
+    Column("view_count", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False, index=True),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "comments", meta,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("post_id", Integer, ForeignKey("posts.id"), nullable=False, index=True),
+    Column("author_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("content", Text, nullable=False),
+    Column("created_at", DateTime, nullable=False, index=True),
+)
+
+Table(
+    "attachments", meta,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("post_id", Integer, ForeignKey("posts.id"), nullable=False, index=True),
+    Column("filename", String(255), nullable=False),
+    Column("stored_path", String(500), nullable=False),
+    Column("file_type", String(50), nullable=False),
+    Column("file_size", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+def upgrade(conn):
+    meta.create_all(conn, checkfirst=True)
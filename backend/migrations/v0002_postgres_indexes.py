@@ -0,0 +1,39 @@
+"""
+v0002 — PostgreSQL 전용 인덱스 (SQLite에서는 아무것도 하지 않는다)
+
+- boards: 활성 게시판만 담는 부분 인덱스 (목록 조회는 항상 is_active = true)
+- posts.title / posts.content: pg_trgm GIN 인덱스 — /api/search의 ILIKE '%q%'를 인덱스로 처리
+  (pg_trgm 확장을 쓸 수 없는 서버에서는 건너뛴다)
+"""
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade(conn):
+    if conn.dialect.name != "postgresql":
+        return
+
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_boards_active_created_at "
+        "ON boards (created_at) WHERE is_active"
+    ))
+
+    has_trgm = conn.execute(text(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    )).first()
+    if not has_trgm:
+        logger.warning("pg_trgm extension is not available; skipping trigram search indexes")
+        return
+
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_posts_title_trgm "
+        "ON posts USING gin (title gin_trgm_ops)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_posts_content_trgm "
+        "ON posts USING gin (content gin_trgm_ops)"
+    ))
@@ -0,0 +1,42 @@
+"""
+v0003 — posts에 comment_count / attachment_count / last_activity_at 추가 + 기존 데이터 채우기
+
+SQLite는 ADD COLUMN에 NOT NULL + 비상수 기본값을 줄 수 없어서 last_activity_at을
+NULL 허용으로 추가하고 채운다. PostgreSQL은 채운 뒤 NOT NULL 제약을 건다.
+
+채우는 SQL은 이 버전의 스키마 그대로 적어 둔다 (post_counters.backfill_post_counters는
+현재 모델을 따르므로 나중에 모델이 바뀌면 이 시점의 DB와 맞지 않는다).
+"""
+from sqlalchemy import text
+
+_BACKFILL = """
+UPDATE posts SET
+    comment_count = (SELECT count(*) FROM comments WHERE comments.post_id = posts.id),
+    attachment_count = (SELECT count(*) FROM attachments WHERE attachments.post_id = posts.id),
+    last_activity_at = {greatest}(
+        posts.created_at,
+        COALESCE((SELECT max(created_at) FROM comments WHERE comments.post_id = posts.id), posts.created_at),
+        COALESCE((SELECT max(created_at) FROM attachments WHERE attachments.post_id = posts.id), posts.created_at)
+    )
+"""
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(text("ALTER TABLE posts ADD COLUMN attachment_count INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(text(
+        "ALTER TABLE posts ADD COLUMN last_activity_at "
+        + ("TIMESTAMP WITHOUT TIME ZONE" if conn.dialect.name == "postgresql" else "DATETIME")
+    ))
+
+    # 여러 인자 중 최댓값: PostgreSQL은 GREATEST, SQLite는 다중 인자 MAX
+    greatest = "GREATEST" if conn.dialect.name == "postgresql" else "MAX"
+    conn.execute(text(_BACKFILL.format(greatest=greatest)))
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE posts ALTER COLUMN last_activity_at SET NOT NULL"))
+
+    # 게시판별 최근 활동순 목록용
+    conn.execute(text(
+        "CREATE INDEX ix_posts_board_activity ON posts (board_id, last_activity_at, id)"
+    ))
@@ -0,0 +1,13 @@
+"""
+v0004 — 게시판 최신순 목록/커서 페이지네이션용 (board_id, created_at, id) 인덱스
+
+WHERE board_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+를 정렬 없이 인덱스 역방향 스캔으로 처리한다.
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    conn.execute(text(
+        "CREATE INDEX ix_posts_board_created ON posts (board_id, created_at, id)"
+    ))
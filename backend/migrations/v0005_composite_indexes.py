@@ -0,0 +1,25 @@
+"""
+v0005 — 정렬까지 인덱스로 처리하는 복합 인덱스
+
+- posts (board_id, created_at DESC, id DESC)
+    게시판 최신순 목록 + 커서 조건 (created_at, id) < (?, ?) — v0004 인덱스를 대체
+- comments (post_id, created_at, id)
+    글별 댓글 목록 (작성순)
+
+복합 인덱스의 선두 컬럼과 겹치는 단일 컬럼 인덱스(posts.board_id, comments.post_id)는
+쓰기 비용만 늘리므로 제거한다.
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    conn.execute(text("DROP INDEX IF EXISTS ix_posts_board_created"))
+    conn.execute(text(
+        "CREATE INDEX ix_posts_board_created ON posts (board_id, created_at DESC, id DESC)"
+    ))
+    conn.execute(text("DROP INDEX IF EXISTS ix_posts_board_id"))
+
+    conn.execute(text(
+        "CREATE INDEX ix_comments_post_created ON comments (post_id, created_at, id)"
+    ))
+    conn.execute(text("DROP INDEX IF EXISTS ix_comments_post_id"))
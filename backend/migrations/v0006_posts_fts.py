@@ -0,0 +1,38 @@
+"""
+v0006 — SQLite FTS5 검색 색인 (PostgreSQL은 v0002의 pg_trgm 인덱스를 그대로 쓴다)
+
+- posts_fts: posts(title, content)를 원본으로 하는 external content FTS5 테이블, trigram 토크나이저
+- 트리거 3개로 posts와 동기화 (INSERT / DELETE / title·content UPDATE)
+- 기존 게시글은 'rebuild'로 한 번에 색인
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    if conn.dialect.name != "sqlite":
+        return
+
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE posts_fts USING fts5("
+        "title, content, content='posts', content_rowid='id', tokenize='trigram')"
+    ))
+
+    conn.execute(text(
+        "CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+        "END"
+    ))
+    # 조회수/카운터 UPDATE까지 색인을 다시 쓰지 않도록 title, content 변경에만 반응
+    conn.execute(text(
+        "CREATE TRIGGER posts_fts_update AFTER UPDATE OF title, content ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+        "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); "
+        "END"
+    ))
+
+    conn.execute(text("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
@@ -0,0 +1,11 @@
+"""
+v0007 — users에 token_version 추가
+
+토큰에 권한(role)을 넣어 두고 DB 조회 없이 검사하므로, 권한 변경·비활성화 시
+이 값을 올려 이전에 발급한 토큰을 무효화한다 (token_versions.py).
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
@@ -0,0 +1,33 @@
+"""
+v0008 — posts에 excerpt(목록용 요약문) 추가 + 기존 글 채우기
+
+목록/검색이 content를 읽지 않도록 글을 쓸 때 계산해 저장한다 (excerpts.py).
+채울 때는 이 버전의 posts 컬럼(id, content, excerpt)만 적은 테이블로 읽고 쓴다 —
+excerpts.backfill_excerpts는 현재 모델을 따른다. 요약문 계산(make_excerpt)은 문자열만 다루는 함수다.
+"""
+from sqlalchemy import Column, Integer, MetaData, String, Table, Text, bindparam, select, text
+
+from excerpts import make_excerpt
+
+_BATCH = 500
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE posts ADD COLUMN excerpt VARCHAR(300) NOT NULL DEFAULT ''"))
+
+    posts = Table(
+        "posts", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("content", Text),
+        Column("excerpt", String(300)),
+    )
+    stmt = posts.update().where(posts.c.id == bindparam("post_id")).values(excerpt=bindparam("new_excerpt"))
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(posts.c.id, posts.c.content).where(posts.c.id > last_id).order_by(posts.c.id).limit(_BATCH)
+        ).all()
+        if not rows:
+            return
+        conn.execute(stmt, [{"post_id": row.id, "new_excerpt": make_excerpt(row.content)} for row in rows])
+        last_id = rows[-1].id
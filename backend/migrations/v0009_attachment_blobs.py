@@ -0,0 +1,12 @@
+"""
+v0009 — attachments에 sha256 추가 (내용 주소 blob 저장소)
+
+같은 내용의 첨부는 blob 하나를 공유하고, 이 컬럼으로 참조 수를 센다 (blob_store.py).
+기존 행은 NULL — 파일은 python manage.py import-blobs로 저장소에 옮긴다.
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE attachments ADD COLUMN sha256 VARCHAR(64)"))
+    conn.execute(text("CREATE INDEX ix_attachments_sha256 ON attachments (sha256)"))
@@ -0,0 +1,28 @@
+"""
+v0010 — attachment_variants (첨부 이미지의 썸네일·웹용 파생본)
+
+업로드가 커밋된 뒤 백그라운드 워커가 만든다 (image_variants.py).
+파일은 blob 저장소에 있고, sha256은 GC가 참조 수에 함께 센다.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, MetaData, String, Table
+
+
+def upgrade(conn):
+    meta = MetaData()
+    Table("attachments", meta, Column("id", Integer, primary_key=True))
+    variants = Table(
+        "attachment_variants", meta,
+        Column("id", Integer, primary_key=True),
+        Column("attachment_id", Integer, ForeignKey("attachments.id"), nullable=False),
+        Column("variant", String(20), nullable=False),
+        Column("stored_path", String(500), nullable=False),
+        Column("sha256", String(64), nullable=False),
+        Column("file_type", String(50), nullable=False),
+        Column("file_size", Integer, nullable=False),
+        Column("width", Integer, nullable=False),
+        Column("height", Integer, nullable=False),
+        Column("created_at", DateTime, nullable=False),
+    )
+    Index("ix_attachment_variants_attachment", variants.c.attachment_id, variants.c.variant, unique=True)
+    Index("ix_attachment_variants_sha256", variants.c.sha256)
+    variants.create(conn)
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 import enum
 
+from excerpts import make_excerpt
+
 Base = declarative_base()
 
 
@@ -25,6 +27,8 @@ class User(Base):
     role = Column(SQLEnum(Role), default=Role.MEMBER, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 토큰 클레임(role 등)이 바뀔 때 올린다 — 이전 토큰 무효화 (token_versions.py)
+    token_version = Column(Integer, default=0, nullable=False)
 
     # 관계
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
@@ -51,32 +55,55 @@ class Post(Base):
     __tablename__ = "posts"
 
     id = Column(Integer, primary_key=True, index=True)
-    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False, index=True)
+    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)  # 복합 인덱스의 선두 컬럼
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
+    excerpt = Column(String(300), default="", nullable=False)  # 목록용 요약문 — content를 바꾸면 같이 갱신
     source = Column(String(500), nullable=True)  # 출처 URL 또는 "자체판단"
     view_count = Column(Integer, default=0, nullable=False)
+    # 비정규화 카운터 — 댓글/첨부 쓰기와 같은 트랜잭션에서 갱신 (post_counters.py)
+    comment_count = Column(Integer, default=0, nullable=False)
+    attachment_count = Column(Integer, default=0, nullable=False)
+    last_activity_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # 작성/댓글/첨부 중 최신
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # 인덱스는 migrations/에서 관리 — 여기 선언은 스키마 문서 겸 검증용
+    __table_args__ = (
+        Index("ix_posts_board_created", board_id, created_at.desc(), id.desc()),  # 최신순 목록/커서
+        Index("ix_posts_board_activity", board_id, last_activity_at, id),  # 최근 활동순 목록
+    )
+
     # 관계
     board = relationship("Board", back_populates="posts")
     author = relationship("User", back_populates="posts")
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
+    comments = relationship(
+        "Comment", back_populates="post", cascade="all, delete-orphan",
+        order_by="(Comment.created_at, Comment.id)",  # 작성순 (일괄 작성은 created_at이 같다)
+    )
     attachments = relationship("Attachment", back_populates="post", cascade="all, delete-orphan")
 
+    @validates("content")
+    def _update_excerpt(self, key, content):
+        self.excerpt = make_excerpt(content)
+        return content
+
 
 class Comment(Base):
     """댓글"""
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)  # 복합 인덱스의 선두 컬럼
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    __table_args__ = (
+        Index("ix_comments_post_created", post_id, created_at, id),  # 글별 댓글 목록 (작성순)
+    )
+
     # 관계
     post = relationship("Post", back_populates="comments")
     author = relationship("User", back_populates="comments")
@@ -89,10 +116,35 @@ class Attachment(Base):
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     filename = Column(String(255), nullable=False)
-    stored_path = Column(String(500), nullable=False)
+    stored_path = Column(String(500), nullable=False)  # blob_store 기준 상대 경로 (예전 행은 절대 경로)
+    sha256 = Column(String(64), nullable=True, index=True)  # 내용 해시 — 같은 값의 행 수가 blob 참조 수
     file_type = Column(String(50), nullable=False)  # MIME 타입
     file_size = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # 관계
     post = relationship("Post", back_populates="attachments")
+    variants = relationship("AttachmentVariant", back_populates="attachment", cascade="all, delete-orphan")
+
+
+class AttachmentVariant(Base):
+    """첨부 이미지의 파생본 (썸네일 등, image_variants.py가 만든다)"""
+    __tablename__ = "attachment_variants"
+
+    id = Column(Integer, primary_key=True)
+    attachment_id = Column(Integer, ForeignKey("attachments.id"), nullable=False)
+    variant = Column(String(20), nullable=False)  # config.IMAGE_VARIANTS의 이름 (thumb, web)
+    stored_path = Column(String(500), nullable=False)  # blob_store 기준 상대 경로
+    sha256 = Column(String(64), nullable=False, index=True)  # blob 참조 수에 함께 센다
+    file_type = Column(String(50), nullable=False)
+    file_size = Column(Integer, nullable=False)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_attachment_variants_attachment", attachment_id, variant, unique=True),  # 첨부별 파생본 조회
+    )
+
+    # 관계
+    attachment = relationship("Attachment", back_populates="variants")
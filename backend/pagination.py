@@ -0,0 +1,42 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 페이지가 깊어질수록 느려진다.
+커서는 "마지막으로 본 행의 (정렬 키, id)"를 담고, 다음 페이지는
+    WHERE (정렬 키, id) < (커서 값, 커서 id)
+로 인덱스에서 바로 이어 읽는다. 페이지 깊이와 상관없이 비용이 같다.
+
+커서 문자열은 클라이언트가 해석하지 않는 불투명 값이다 (base64url JSON).
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort: str, key: datetime, row_id: int) -> str:
+    """(정렬 방식, 정렬 키, id)를 커서 문자열로"""
+    raw = json.dumps([sort, key.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple:
+    """커서 문자열을 (정렬 키, id)로. 형식이 틀리거나 정렬 방식이 다르면 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, key, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        key = datetime.fromisoformat(key)
+        row_id = int(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    if cursor_sort != sort:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor does not match sort order"
+        )
+    return key, row_id
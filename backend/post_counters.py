@@ -0,0 +1,70 @@
+"""
+게시글 비정규화 카운터 (comment_count, attachment_count, last_activity_at)
+
+목록 화면이 게시글마다 COUNT(*)를 돌리지 않도록 posts 행에 직접 저장한다.
+댓글/첨부 쓰기 작업 단위 안에서 bump_post_counters()를 같이 실행해 같은 트랜잭션에 묶고,
+어긋났을 때는 backfill_post_counters()로 전체를 다시 계산한다 (manage.py backfill-counters).
+"""
+from datetime import datetime
+
+from sqlalchemy import select, update, func
+
+from models import Post, Comment, Attachment
+
+
+def bump_post_counters(post_id: int, comments: int = 0, attachments: int = 0, touch: bool = True):
+    """
+    카운터 증감 UPDATE 문 생성. 대상 게시글이 없으면 rowcount가 0이다.
+
+    Args:
+        comments / attachments: 증감량 (+1, -1 등)
+        touch: last_activity_at을 현재 시각으로 갱신할지 여부 (삭제 시에는 False)
+    """
+    # updated_at은 "글 수정 시각"이므로 카운터 변경으로 onupdate가 돌지 않게 그대로 둔다
+    values = {"updated_at": Post.updated_at}
+    if comments:
+        values["comment_count"] = Post.comment_count + comments
+    if attachments:
+        values["attachment_count"] = Post.attachment_count + attachments
+    if touch:
+        values["last_activity_at"] = datetime.utcnow()
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def backfill_post_counters(conn) -> int:
+    """모든 게시글의 카운터를 comments/attachments 테이블에서 다시 계산 (동기 Connection)"""
+    posts = Post.__table__
+    comments = Comment.__table__
+    attachments = Attachment.__table__
+
+    comment_count = (
+        select(func.count()).where(comments.c.post_id == posts.c.id).scalar_subquery()
+    )
+    attachment_count = (
+        select(func.count()).where(attachments.c.post_id == posts.c.id).scalar_subquery()
+    )
+    last_comment = (
+        select(func.max(comments.c.created_at)).where(comments.c.post_id == posts.c.id).scalar_subquery()
+    )
+    last_attachment = (
+        select(func.max(attachments.c.created_at)).where(attachments.c.post_id == posts.c.id).scalar_subquery()
+    )
+    # 여러 인자 중 최댓값: PostgreSQL은 GREATEST, SQLite는 다중 인자 MAX
+    greatest = func.greatest if conn.dialect.name == "postgresql" else func.max
+
+    stmt = update(posts).values(
+        comment_count=comment_count,
+        attachment_count=attachment_count,
+        last_activity_at=greatest(
+            posts.c.created_at,
+            func.coalesce(last_comment, posts.c.created_at),
+            func.coalesce(last_attachment, posts.c.created_at),
+        ),
+        updated_at=posts.c.updated_at,
+    )
+    return conn.execute(stmt).rowcount
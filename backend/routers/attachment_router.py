@@ -1,134 +1,261 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Header, Path, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pathlib import Path
-import os
+from sqlalchemy import and_, select
+from datetime import datetime
+from typing import Optional
+import anyio
 
-from database import get_session
-from models import Attachment, Post, User
-from schemas import AttachmentResponse
-from auth import decode_token
-from config import UPLOADS_DIR, MAX_FILE_SIZE
+from database import get_read_session
+from write_queue import write_coordinator
+from post_counters import bump_post_counters
+from front_page import front_page_cache
+from models import Attachment, AttachmentVariant, Post
+from schemas import AttachmentResponse, UploadSessionCreate, UploadSessionResponse
+from dependencies import get_current_user
+from user_cache import UserSnapshot
+from uploads import save_upload
+from upload_sessions import (
+    UPLOAD_ID_PATTERN, UploadSession, assemble, contiguous_offset, create_session, discard, finish, load_session,
+    received_chunks, release, write_chunk,
+)
+from downloads import AttachmentFile, attachment_files, file_response
+from image_variants import VARIANT_PATTERN, image_pipeline
+from etags import CACHE_IMMUTABLE, CACHE_REVALIDATE, etag_matches, not_modified, validator_headers
 
 router = APIRouter(prefix="/api", tags=["attachments"])
 
 
-async def get_current_user(authorization: str = Header(None), session: AsyncSession = Depends(get_session)):
-    """Authorization 헤더에서 토큰 추출 후 사용자 조회"""
-    if not authorization:
-        return None
+async def _get_post_or_404(session: AsyncSession, post_id: int) -> Post:
+    stmt = select(Post).where(Post.id == post_id)
+    post = await session.execute(stmt)
+    post = post.scalar_one_or_none()
+    # 파일 복사/조립과 쓰기 큐 대기 동안 읽기 커넥션을 붙잡고 있지 않도록 트랜잭션을 끝내 둔다
+    # (실제 존재 확인은 _create_attachment의 쓰기 작업이 다시 한다)
+    await session.commit()
 
-    try:
-        token = authorization.split(" ")[1]  # "Bearer <token>"
-    except IndexError:
-        return None
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+    return post
 
-    payload = decode_token(token)
-    if not payload:
-        return None
 
-    user_id = int(payload.get("sub"))
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+async def _create_attachment(
+    post_id: int, filename: str, file_type: str, sha256: str, stored_path: str, file_size: int
+) -> Attachment:
+    """blob 저장소에 넣은 파일을 첨부로 등록 (카운터 갱신, 첫 페이지 캐시 무효화)"""
+    async def work(write_session: AsyncSession):
+        # 카운터 갱신 겸 게시글 존재 확인 — 앞의 확인과 이 작업 사이에 글이 지워졌으면 404
+        # (SQLite는 외래키를 강제하지 않아 고아 첨부 행이 blob을 계속 참조하게 된다)
+        result = await write_session.execute(bump_post_counters(post_id, attachments=1))
+        if result.rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
 
+        attachment = Attachment(
+            post_id=post_id,
+            filename=filename,
+            stored_path=stored_path,
+            sha256=sha256,
+            file_type=file_type,
+            file_size=file_size,
+        )
+        write_session.add(attachment)
+        await write_session.flush()
+        await write_session.refresh(attachment)
+        return attachment
 
-@router.post("/posts/{post_id}/attachments", response_model=AttachmentResponse, status_code=status.HTTP_201_CREATED)
-async def upload_attachment(
-    post_id: int,
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
-):
-    """파일 업로드 (인증 필요)"""
+    attachment = await write_coordinator.submit(work)
+    front_page_cache.invalidate_post(post_id)
+    image_pipeline.enqueue(attachment.id)  # 썸네일 등은 백그라운드에서 (응답을 기다리게 하지 않는다)
+    return attachment
+
+
+def _require_user(current_user: Optional[UserSnapshot]):
     if not current_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
 
-    # 게시글 존재 확인
-    stmt = select(Post).where(Post.id == post_id)
-    post = await session.execute(stmt)
-    post = post.scalar_one_or_none()
 
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
+def _session_response(upload: UploadSession, received: list) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        upload_id=upload.upload_id,
+        post_id=upload.post_id,
+        filename=upload.filename,
+        file_size=upload.file_size,
+        chunk_size=upload.chunk_size,
+        chunk_count=upload.chunk_count,
+        received=received,
+        offset=contiguous_offset(upload, received),
+        expires_at=datetime.utcfromtimestamp(upload.expires_at),
+    )
 
-    # 파일 크기 확인
-    file.file.seek(0, 2)  # 파일 끝으로 이동
-    file_size = file.file.tell()
-    file.file.seek(0)  # 파일 시작으로 이동
 
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size exceeds {MAX_FILE_SIZE / 1024 / 1024}MB limit"
-        )
+@router.post("/posts/{post_id}/attachments", response_model=AttachmentResponse, status_code=status.HTTP_201_CREATED)
+async def upload_attachment(
+    post_id: int,
+    file: UploadFile = File(...),
+    current_user: UserSnapshot = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+):
+    """파일 업로드 (인증 필요) — 큰 파일은 이어 올리기(/posts/{post_id}/uploads)를 쓴다"""
+    _require_user(current_user)
 
-    # 디렉토리 생성
-    upload_path = UPLOADS_DIR / str(post_id)
-    os.makedirs(upload_path, exist_ok=True)
+    # 게시글 존재 확인
+    await _get_post_or_404(session, post_id)
 
-    # 파일 저장
+    # 파일 저장 — 조각씩 옮기며 크기 제한 확인, 같은 내용이면 기존 blob 공유 (uploads.py, blob_store.py)
     filename = file.filename
-    stored_path = upload_path / filename
 
     try:
-        with open(stored_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        sha256, stored_path, file_size = await save_upload(file)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"File upload failed: {str(e)}"
         )
 
-    # DB에 첨부파일 정보 저장
-    attachment = Attachment(
-        post_id=post_id,
-        filename=filename,
-        stored_path=str(stored_path),
-        file_type=file.content_type or "application/octet-stream",
-        file_size=file_size,
+    return await _create_attachment(
+        post_id, filename, file.content_type or "application/octet-stream", sha256, stored_path, file_size
     )
-    session.add(attachment)
-    await session.commit()
-    await session.refresh(attachment)
 
+
+# ==================== 이어 올리기 (upload_sessions.py) ====================
+
+@router.post("/posts/{post_id}/uploads", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    post_id: int,
+    data: UploadSessionCreate,
+    current_user: UserSnapshot = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+):
+    """이어 올리기 세션 생성 (인증 필요) — 응답의 chunk_size씩 잘라 PUT 한다"""
+    _require_user(current_user)
+    await _get_post_or_404(session, post_id)
+    upload = await create_session(
+        post_id, current_user.id, data.filename, data.file_type, data.file_size, data.sha256
+    )
+    return _session_response(upload, [])
+
+
+@router.put("/uploads/{upload_id}/chunks/{index}", response_model=UploadSessionResponse)
+async def put_upload_chunk(
+    request: Request,
+    index: int,
+    upload_id: str = Path(..., pattern=UPLOAD_ID_PATTERN),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """조각 하나 올리기 (본문 = 바이트 그대로, 같은 번호를 다시 보내면 덮어쓴다)"""
+    _require_user(current_user)
+    upload = await load_session(upload_id, current_user.id)
+    await write_chunk(upload, index, request.stream())
+    return _session_response(upload, await anyio.to_thread.run_sync(received_chunks, upload))
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload(
+    upload_id: str = Path(..., pattern=UPLOAD_ID_PATTERN),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """받은 조각과 offset 조회 (끊긴 업로드를 이어서 보낼 때)"""
+    _require_user(current_user)
+    upload = await load_session(upload_id, current_user.id)
+    return _session_response(upload, await anyio.to_thread.run_sync(received_chunks, upload))
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=AttachmentResponse, status_code=status.HTTP_201_CREATED)
+async def complete_upload(
+    upload_id: str = Path(..., pattern=UPLOAD_ID_PATTERN),
+    current_user: UserSnapshot = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+):
+    """조각을 이어 붙여 첨부로 등록 (빠진 조각이 있으면 409)"""
+    _require_user(current_user)
+    upload = await load_session(upload_id, current_user.id)
+    await _get_post_or_404(session, upload.post_id)
+    sha256, stored_path = await assemble(upload)
+    try:
+        attachment = await _create_attachment(
+            upload.post_id, upload.filename, upload.file_type, sha256, stored_path, upload.file_size
+        )
+    except BaseException:
+        await release(upload)  # 조각을 남겨 둔다 — 다시 완료할 수 있다
+        raise
+    await finish(upload)
     return attachment
 
 
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_upload(
+    upload_id: str = Path(..., pattern=UPLOAD_ID_PATTERN),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """이어 올리기 취소 (받은 조각 삭제)"""
+    _require_user(current_user)
+    upload = await load_session(upload_id, current_user.id)
+    await discard(upload)
+
+
+# ==================== 다운로드 (downloads.py) ====================
+
 @router.get("/attachments/{attachment_id}")
 async def download_attachment(
     attachment_id: int,
-    session: AsyncSession = Depends(get_session)
+    v: Optional[str] = Query(None, description="첨부의 sha256 — 맞으면 immutable로 캐시하게 한다"),
+    variant: Optional[str] = Query(
+        None, pattern=VARIANT_PATTERN, description="이미지 파생본 (없으면 원본을 준다)"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
 ):
-    """파일 다운로드 (공개)"""
-    stmt = select(Attachment).where(Attachment.id == attachment_id)
-    attachment = await session.execute(stmt)
-    attachment = attachment.scalar_one_or_none()
+    """
+    파일 다운로드 (공개)
 
-    if not attachment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Attachment not found"
-        )
+    Range / If-Range 부분 응답, If-None-Match → 304.
+    반복 다운로드는 메타데이터 캐시에서 DB 조회 없이 처리한다 (downloads.py).
+    ?variant=thumb 는 축소한 WebP — 아직 만들지 않았으면 원본.
+    """
+    file = attachment_files.get(attachment_id, variant)
+    if file is None:
+        if variant is None:
+            stmt = select(Attachment).where(Attachment.id == attachment_id)
+            attachment, attachment_variant = (await session.execute(stmt)).scalar_one_or_none(), None
+        else:
+            stmt = (
+                select(Attachment, AttachmentVariant)
+                .outerjoin(AttachmentVariant, and_(
+                    AttachmentVariant.attachment_id == Attachment.id,
+                    AttachmentVariant.variant == variant,
+                ))
+                .where(Attachment.id == attachment_id)
+            )
+            attachment, attachment_variant = (await session.execute(stmt)).one_or_none() or (None, None)
 
-    # 파일 존재 확인
-    file_path = Path(attachment.stored_path)
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found on disk"
-        )
+        if not attachment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Attachment not found"
+            )
 
-    return FileResponse(
-        path=file_path,
-        filename=attachment.filename,
-        media_type=attachment.file_type
-    )
+        # 파일 존재 확인 (stat — 캐시에 함께 둔다)
+        file = await anyio.to_thread.run_sync(AttachmentFile.load, attachment, attachment_variant)
+        if file is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="File not found on disk"
+            )
+        attachment_files.put(file, variant)
+
+    # 파생본 대신 원본을 줄 때는 재검증 — 파생본이 생기면 바뀐다
+    immutable = v is not None and v == file.version and file.variant == variant
+    cache_control = CACHE_IMMUTABLE if immutable else CACHE_REVALIDATE
+    if etag_matches(if_none_match, file.etag):
+        return not_modified(file.etag, cache_control)
+    return file_response(file, validator_headers(file.etag, cache_control))
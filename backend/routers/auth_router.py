@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import timedelta
 
-from database import get_session
+from database import get_session, get_read_session
 from models import User
 from schemas import UserCreate, UserLogin, UserResponse, TokenResponse
-from auth import hash_password, verify_password, create_access_token
+from auth import hash_password_async, verify_password_async, create_access_token
 from config import ACCESS_TOKEN_EXPIRE_MINUTES
+from dependencies import get_current_user
+from token_versions import token_claims
+from user_cache import UserSnapshot
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -28,7 +31,7 @@ async def register(user_data: UserCreate, session: AsyncSession = Depends(get_se
     new_user = User(
         username=user_data.username,
         display_name=user_data.display_name,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         role=user_data.role,
     )
     session.add(new_user)
@@ -39,13 +42,15 @@ async def register(user_data: UserCreate, session: AsyncSession = Depends(get_se
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(credentials: UserLogin, session: AsyncSession = Depends(get_session)):
+async def login(credentials: UserLogin, session: AsyncSession = Depends(get_read_session)):
     """로그인 → JWT 발급"""
     stmt = select(User).where(User.username == credentials.username)
     user = await session.execute(stmt)
     user = user.scalar_one_or_none()
+    # bcrypt 검증(수십~수백 ms) 동안 DB 커넥션을 붙잡고 있지 않도록 트랜잭션을 끝내 둔다
+    await session.commit()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await verify_password_async(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -57,10 +62,10 @@ async def login(credentials: UserLogin, session: AsyncSession = Depends(get_sess
             detail="User is inactive"
         )
     
-    # JWT 토큰 생성
+    # JWT 토큰 생성 — 권한 검사에 필요한 사용자 정보를 클레임으로 넣는다
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": str(user.id), "username": user.username},
+        data=token_claims(user),
         expires_delta=access_token_expires
     )
     
@@ -71,43 +76,13 @@ async def login(credentials: UserLogin, session: AsyncSession = Depends(get_sess
     }
 
 
-@router.get("/me")
-async def get_current_user_info(
-    authorization: str = Header(None),
-    session: AsyncSession = Depends(get_session)
-):
+@router.get("/me", response_model=UserResponse)
+async def get_current_user_info(current_user: UserSnapshot = Depends(get_current_user)):
     """내 정보 조회 (JWT 검증)"""
-    if not authorization:
+    if not current_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    
-    try:
-        token = authorization.split(" ")[1]  # "Bearer <token>"
-    except IndexError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-    
-    from auth import decode_token
-    payload = decode_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
-    
-    user_id = int(payload.get("sub"))
-    stmt = select(User).where(User.id == user_id)
-    user = await session.execute(stmt)
-    user = user.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    return user
+
+    return current_user
@@ -1,48 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from typing import List
+from typing import List, Optional
 
-from database import get_session
-from models import Board, User, Role
+from database import get_session, get_read_session
+from models import Board, Role
 from schemas import BoardCreate, BoardUpdate, BoardResponse
-from auth import decode_token
+from dependencies import get_current_user
+from front_page import front_page_cache
+from etags import CACHE_BOARDS, board_version, etag_matches, make_etag, not_modified, set_validators
+from user_cache import UserSnapshot
 
 router = APIRouter(prefix="/api/boards", tags=["boards"])
 
 
-async def get_current_user(authorization: str = Header(None), session: AsyncSession = Depends(get_session)):
-    """Authorization 헤더에서 토큰 추출 후 사용자 조회"""
-    if not authorization:
-        return None
-    
-    try:
-        token = authorization.split(" ")[1]  # "Bearer <token>"
-    except IndexError:
-        return None
-    
-    payload = decode_token(token)
-    if not payload:
-        return None
-    
-    user_id = int(payload.get("sub"))
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
-
-
 @router.get("")
-async def list_boards(session: AsyncSession = Depends(get_session)):
-    """게시판 목록 조회 (공개)"""
+async def list_boards(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """게시판 목록 조회 (공개, ETag — 게시판 수가 적어서 전부 읽어 비교한다)"""
     stmt = select(Board).where(Board.is_active == True).order_by(Board.created_at)
     result = await session.execute(stmt)
-    return result.scalars().all()
+    boards = result.scalars().all()
+
+    etag = make_etag(*(board_version(board) for board in boards))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, CACHE_BOARDS)
+    set_validators(response, etag, CACHE_BOARDS)
+    return boards
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def create_board(
     board_data: BoardCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """게시판 생성 (admin만)"""
@@ -77,7 +70,7 @@ async def create_board(
 async def update_board(
     board_id: int,
     board_data: BoardUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """게시판 수정 (admin만)"""
@@ -103,6 +96,7 @@ async def update_board(
         board.description = board_data.description
     
     await session.commit()
+    front_page_cache.invalidate_board(board_id)
     await session.refresh(board)
     
     return board
@@ -111,7 +105,7 @@ async def update_board(
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """게시판 삭제 (soft delete, admin만)"""
@@ -133,3 +127,4 @@ async def delete_board(
     
     board.is_active = False
     await session.commit()
+    front_page_cache.invalidate_board(board_id)
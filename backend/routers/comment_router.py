@@ -1,42 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import insert, select, and_, desc
 from sqlalchemy.orm import selectinload
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from database import get_session
-from models import Comment, Post, User, Role
-from schemas import CommentCreate, CommentResponse
-from auth import decode_token
+from database import get_read_session
+from write_queue import write_coordinator
+from post_counters import bump_post_counters
+from front_page import front_page_cache
+from serialization import comment_projection, include_pattern, list_response, parse_include
+from models import Comment, Post, Role, User
+from schemas import CommentBatchCreate, CommentCreate, CommentResponse, SideloadedCommentsResponse
+from dependencies import get_current_user
+from user_cache import UserSnapshot
 
 router = APIRouter(prefix="/api", tags=["comments"])
 
 
-async def get_current_user(authorization: str = Header(None), session: AsyncSession = Depends(get_session)):
-    """Authorization 헤더에서 토큰 추출 후 사용자 조회"""
-    if not authorization:
-        return None
-    
-    try:
-        token = authorization.split(" ")[1]  # "Bearer <token>"
-    except IndexError:
-        return None
-    
-    payload = decode_token(token)
-    if not payload:
-        return None
-    
-    user_id = int(payload.get("sub"))
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
-
-
-@router.get("/posts/{post_id}/comments", response_model=List[CommentResponse])
+@router.get("/posts/{post_id}/comments", response_model=Union[List[CommentResponse], SideloadedCommentsResponse])
 async def list_comments(
     post_id: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     limit: int = Query(50, ge=1, le=100),
+    include: Optional[str] = Query(
+        None, pattern=include_pattern("authors"),
+        description="authors — 주면 {comments, users} 형태로 작성자를 한 번씩만 보낸다",
+    ),
 ):
     """댓글 목록 조회 (공개)"""
     # 게시글 존재 확인
@@ -48,21 +38,20 @@ async def list_comments(
             detail="Post not found"
         )
     
-    # 댓글 조회
+    # 댓글 조회 — 작성순, 같은 시각(일괄 작성)이면 id순
     stmt = select(Comment).where(
         Comment.post_id == post_id
-    ).options(selectinload(Comment.author)).order_by(Comment.created_at).limit(limit)
+    ).options(selectinload(Comment.author)).order_by(Comment.created_at, Comment.id).limit(limit)
 
     result = await session.execute(stmt)
-    return result.scalars().all()
+    return list_response(comment_projection, result.scalars().all(), key="comments", include=parse_include(include))
 
 
 @router.post("/posts/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     post_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """댓글 작성 (인증 필요)"""
     if not current_user:
@@ -71,36 +60,105 @@ async def create_comment(
             detail="Not authenticated"
         )
 
-    # 게시글 존재 확인
-    stmt = select(Post).where(Post.id == post_id)
-    post = await session.execute(stmt)
-    if not post.scalar_one_or_none():
+    async def work(session: AsyncSession):
+        # 카운터 갱신 겸 게시글 존재 확인 (갱신된 행이 없으면 없는 글)
+        result = await session.execute(bump_post_counters(post_id, comments=1))
+        if result.rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+        new_comment = Comment(
+            post_id=post_id,
+            author_id=current_user.id,
+            content=comment_data.content,
+        )
+        session.add(new_comment)
+        await session.flush()
+
+        # author를 포함해서 재조회 (refresh는 관계를 로드하지 않음)
+        stmt = select(Comment).where(Comment.id == new_comment.id).options(
+            selectinload(Comment.author)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    comment = await write_coordinator.submit(work)
+    front_page_cache.invalidate_post(post_id)
+    return comment
+
+
+@router.post(
+    "/posts/{post_id}/comments:batch", response_model=List[CommentResponse], status_code=status.HTTP_201_CREATED
+)
+async def create_comments_batch(
+    post_id: int,
+    batch: CommentBatchCreate,
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """
+    댓글 일괄 작성 (인증 필요) — 한 트랜잭션, 게시글 확인·커밋 한 번
+
+    author_id로 다른 계정 이름의 댓글은 admin/moderator만 (토론 재생, 가져오기).
+    하나라도 실패하면 아무것도 만들지 않는다. 응답은 요청 순서대로.
+    """
+    if not current_user:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
         )
 
-    new_comment = Comment(
-        post_id=post_id,
-        author_id=current_user.id,
-        content=comment_data.content,
-    )
-    session.add(new_comment)
-    await session.commit()
-
-    # author를 포함해서 재조회 (refresh는 관계를 로드하지 않음)
-    stmt = select(Comment).where(Comment.id == new_comment.id).options(
-        selectinload(Comment.author)
-    )
-    result = await session.execute(stmt)
-    return result.scalar_one()
+    author_ids = [item.author_id or current_user.id for item in batch.comments]
+    others = set(author_ids) - {current_user.id}
+    if others and current_user.role not in (Role.ADMIN, Role.MODERATOR):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Permission denied"
+        )
+
+    async def work(session: AsyncSession):
+        if others:
+            stmt = select(User.id).where(User.id.in_(others), User.is_active.is_(True))
+            found = set((await session.execute(stmt)).scalars())
+            if found != others:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Unknown or inactive author ids: {sorted(others - found)}"
+                )
+
+        # 카운터 갱신 겸 게시글 존재 확인 (갱신된 행이 없으면 없는 글)
+        result = await session.execute(bump_post_counters(post_id, comments=len(batch.comments)))
+        if result.rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+        # 여러 행 VALUES 한 문장 — ORM add_all()은 SQLite에서 RETURNING 때문에 행마다 INSERT를 보낸다
+        created_at = datetime.utcnow()
+        stmt = insert(Comment).values([
+            {"post_id": post_id, "author_id": author_id, "content": item.content, "created_at": created_at}
+            for item, author_id in zip(batch.comments, author_ids)
+        ]).returning(Comment.id)
+        comment_ids = (await session.execute(stmt)).scalars().all()
+
+        # author를 포함해서 한 번에 재조회 (id는 VALUES 순서대로 늘어난다)
+        stmt = select(Comment).where(
+            Comment.id.in_(comment_ids)
+        ).options(selectinload(Comment.author)).order_by(Comment.id)
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    comments = await write_coordinator.submit(work)
+    front_page_cache.invalidate_post(post_id)
+    return comments
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """댓글 삭제 (본인 + admin)"""
     if not current_user:
@@ -108,23 +166,29 @@ async def delete_comment(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    
-    stmt = select(Comment).where(Comment.id == comment_id)
-    comment = await session.execute(stmt)
-    comment = comment.scalar_one_or_none()
-    
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Comment not found"
-        )
-    
-    # 본인/관리자만 삭제 가능
-    if comment.author_id != current_user.id and current_user.role != Role.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permission denied"
-        )
-    
-    await session.delete(comment)
-    await session.commit()
+
+    async def work(session: AsyncSession):
+        stmt = select(Comment).where(Comment.id == comment_id)
+        comment = await session.execute(stmt)
+        comment = comment.scalar_one_or_none()
+
+        if not comment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Comment not found"
+            )
+
+        # 본인/관리자만 삭제 가능
+        if comment.author_id != current_user.id and current_user.role != Role.ADMIN:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied"
+            )
+
+        await session.delete(comment)
+        await session.execute(bump_post_counters(comment.post_id, comments=-1, touch=False))
+        await session.flush()
+        return comment.post_id
+
+    post_id = await write_coordinator.submit(work)
+    front_page_cache.invalidate_post(post_id)
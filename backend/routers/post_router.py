@@ -1,72 +1,143 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy import select, and_, desc, tuple_
+from sqlalchemy.orm import defer, selectinload
+from typing import List, Optional, Union
+from datetime import date
 
-from database import get_session
-from models import Post, Board, User, Role, Comment, Attachment
-from schemas import PostCreate, PostUpdate, PostResponse, PostDetailResponse
-from auth import decode_token
+from config import FRONT_PAGE_SIZE
+from database import get_read_session
+from write_queue import write_coordinator
+from view_counter import view_counter
+from pagination import encode_cursor, decode_cursor
+from search import search_posts
+from models import Post, Board, Role, Comment, Attachment
+from schemas import (
+    PostCreate, PostUpdate, PostSummaryResponse, SideloadedPostsResponse, PostDetailResponse,
+    SearchResponse, SearchResultResponse,
+)
+from dependencies import get_current_user
+from front_page import FrontPage, front_page_cache
+from etags import (
+    POST_VERSION_COLUMNS, board_version, post_version, etag_matches, make_etag, not_modified,
+    set_validators, validator_headers,
+)
+from serialization import include_pattern, list_response, parse_include, post_summary_projection
+from user_cache import UserSnapshot
 
 router = APIRouter(prefix="/api", tags=["posts"])
 
 
-async def get_current_user(authorization: str = Header(None), session: AsyncSession = Depends(get_session)):
-    """Authorization 헤더에서 토큰 추출 후 사용자 조회"""
-    if not authorization:
-        return None
-    
-    try:
-        token = authorization.split(" ")[1]  # "Bearer <token>"
-    except IndexError:
-        return None
-    
-    payload = decode_token(token)
-    if not payload:
-        return None
-    
-    user_id = int(payload.get("sub"))
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
-
-
-@router.get("/boards/{board_id}/posts", response_model=List[PostResponse])
+@router.get("/boards/{board_id}/posts", response_model=Union[List[PostSummaryResponse], SideloadedPostsResponse])
 async def list_posts_by_board(
     board_id: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (주면 offset 무시)"),
+    sort: str = Query("latest", pattern="^(latest|activity)$"),
+    include: Optional[str] = Query(
+        None, pattern=include_pattern("authors", "boards"),
+        description="authors,boards — 주면 {posts, users, boards} 형태로 작성자/게시판을 한 번씩만 보낸다",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
 ):
-    """게시판 내 게시글 목록 (최신순, 공개)"""
-    # 게시판 존재 확인
-    stmt = select(Board).where(and_(Board.id == board_id, Board.is_active == True))
-    board = await session.execute(stmt)
-    if not board.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found"
-        )
+    """
+    게시판 내 게시글 목록 (latest: 최신 글순, activity: 최근 댓글/첨부순, 공개)
+
+    본문 대신 요약문(excerpt)을 준다 — content 컬럼은 읽지 않는다. 본문은 글 상세에서.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담아 준다.
+    offset은 프론트엔드 호환용으로 남겨 두었고, 깊은 페이지는 cursor를 쓴다.
+    If-None-Match가 현재 페이지의 ETag와 같으면 304 (etags.py)
+    첫 페이지(limit ≤ FRONT_PAGE_SIZE)는 front_page_cache에서 DB 조회 없이 준다 (압축도 캐시에 둔 것).
+    """
+    include = parse_include(include)
 
-    # 게시글 조회
-    stmt = select(Post).where(
-        Post.board_id == board_id
-    ).options(
+    async def load_board() -> Board:
+        # 게시판 존재 확인
+        stmt = select(Board).where(and_(Board.id == board_id, Board.is_active == True))
+        board = await session.execute(stmt)
+        board = board.scalar_one_or_none()
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found"
+            )
+        return board
+
+    # 게시글 조회 — (정렬 키, id) 순서는 (board_id, 정렬 키, id) 인덱스와 같다
+    sort_column = Post.last_activity_at if sort == "activity" else Post.created_at
+
+    def page(stmt, size: int = limit):
+        stmt = stmt.where(Post.board_id == board_id).order_by(desc(sort_column), desc(Post.id)).limit(size)
+        if cursor:
+            key, last_id = decode_cursor(cursor, sort)
+            return stmt.where(tuple_(sort_column, Post.id) < tuple_(key, last_id))
+        return stmt.offset(offset)
+
+    def page_headers(posts) -> dict:
+        if len(posts) < limit:
+            return {}
+        last = posts[-1]
+        last_key = last.last_activity_at if sort == "activity" else last.created_at
+        return {"X-Next-Cursor": encode_cursor(sort, last_key, last.id)}
+
+    # content는 읽지 않는다 (실수로 접근하면 지연 로드 대신 에러)
+    summary = select(Post).options(
+        defer(Post.content, raiseload=True),
         selectinload(Post.author),
         selectinload(Post.board),
-    ).order_by(desc(Post.created_at)).limit(limit).offset(offset)
+    )
+
+    if cursor is None and offset == 0 and limit <= FRONT_PAGE_SIZE:
+        async def build() -> FrontPage:
+            # 캐시를 채운다 — 요청한 limit과 상관없이 FRONT_PAGE_SIZE개
+            board = await load_board()
+            result = await session.execute(page(summary, FRONT_PAGE_SIZE))
+            return FrontPage(board, result.scalars().all(), sort)
+
+        cached = await front_page_cache.get_or_build(board_id, sort, build)
+        return cached.response(limit, include, if_none_match, accept_encoding)
+
+    board = await load_board()
+    if if_none_match:
+        # 버전 컬럼만 읽어 보고 같으면 본문·작성자·게시판을 불러오지 않는다
+        rows = (await session.execute(page(select(*POST_VERSION_COLUMNS)))).all()
+        etag = make_etag(board_version(board), *(post_version(row) for row in rows))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, headers=page_headers(rows))
+
+    result = await session.execute(page(summary))
+    posts = result.scalars().all()
 
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    etag = make_etag(board_version(board), *(post_version(post) for post in posts))
+    return list_response(
+        post_summary_projection, posts,
+        headers={**validator_headers(etag), **page_headers(posts)},
+        key="posts", include=include,
+    )
 
 
 @router.get("/posts/{post_id}", response_model=PostDetailResponse)
 async def get_post(
     post_id: int,
-    session: AsyncSession = Depends(get_session)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
 ):
-    """게시글 상세 조회 + 조회수 증가 (공개)"""
+    """게시글 상세 조회 + 조회수 증가 (공개, If-None-Match가 맞으면 304 — 조회수는 그래도 센다)"""
+    if if_none_match:
+        # 버전 컬럼 + 게시판만 읽어 보고 같으면 댓글·첨부를 불러오지 않는다
+        stmt = select(*POST_VERSION_COLUMNS, Board).join(Board, Board.id == Post.board_id).where(Post.id == post_id)
+        row = (await session.execute(stmt)).one_or_none()
+        if row is not None:
+            etag = make_etag(board_version(row.Board), post_version(row))
+            if etag_matches(if_none_match, etag):
+                view_counter.hit(post_id)
+                return not_modified(etag)
+
     stmt = select(Post).where(Post.id == post_id).options(
         selectinload(Post.author),
         selectinload(Post.board),
@@ -82,19 +153,20 @@ async def get_post(
             detail="Post not found"
         )
 
-    # 조회수 증가 (refresh 없이 — refresh하면 eager load 관계가 날아감)
-    post.view_count += 1
-    await session.commit()
+    # 조회수 증가 — 버퍼에 기록만 하고 DB 반영은 view_counter가 모아서 처리
+    pending_views = view_counter.hit(post_id)
+    result = PostDetailResponse.model_validate(post)
+    result.view_count = post.view_count + pending_views
 
-    return post
+    set_validators(response, make_etag(board_version(post.board), post_version(post)))
+    return result
 
 
 @router.post("/boards/{board_id}/posts", status_code=status.HTTP_201_CREATED)
 async def create_post(
     board_id: int,
     post_data: PostCreate,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """게시글 작성 (인증 필요)"""
     if not current_user:
@@ -102,27 +174,32 @@ async def create_post(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    
-    # 게시판 존재 확인
-    stmt = select(Board).where(and_(Board.id == board_id, Board.is_active == True))
-    result = await session.execute(stmt)
-    board_obj = result.scalar_one_or_none()
-    if not board_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found"
+
+    async def work(session: AsyncSession):
+        # 게시판 존재 확인
+        stmt = select(Board).where(and_(Board.id == board_id, Board.is_active == True))
+        result = await session.execute(stmt)
+        board_obj = result.scalar_one_or_none()
+        if not board_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found"
+            )
+
+        new_post = Post(
+            board_id=board_id,
+            author_id=current_user.id,
+            title=post_data.title,
+            content=post_data.content,
+            source=post_data.source,
         )
-    
-    new_post = Post(
-        board_id=board_id,
-        author_id=current_user.id,
-        title=post_data.title,
-        content=post_data.content,
-        source=post_data.source,
-    )
-    session.add(new_post)
-    await session.commit()
-    await session.refresh(new_post)
+        session.add(new_post)
+        await session.flush()
+        await session.refresh(new_post)
+        return new_post, board_obj
+
+    new_post, board_obj = await write_coordinator.submit(work)
+    front_page_cache.invalidate_board(board_id)
     
     # 응답 데이터 수동 구성 (SQLAlchemy 비동기 이슈 회피)
     return {
@@ -133,6 +210,9 @@ async def create_post(
         "content": new_post.content,
         "source": new_post.source,
         "view_count": new_post.view_count,
+        "comment_count": new_post.comment_count,
+        "attachment_count": new_post.attachment_count,
+        "last_activity_at": new_post.last_activity_at,
         "created_at": new_post.created_at,
         "updated_at": new_post.updated_at,
         "author": {
@@ -158,8 +238,7 @@ async def create_post(
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """게시글 수정 (본인만)"""
     if not current_user:
@@ -167,42 +246,45 @@ async def update_post(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    
-    stmt = select(Post).where(Post.id == post_id)
-    post = await session.execute(stmt)
-    post = post.scalar_one_or_none()
-    
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
-    
-    # 본인/관리자만 수정 가능
-    if post.author_id != current_user.id and current_user.role != Role.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permission denied"
-        )
-    
-    if post_data.title:
-        post.title = post_data.title
-    if post_data.content:
-        post.content = post_data.content
-    if post_data.source is not None:
-        post.source = post_data.source
-    
-    await session.commit()
-    await session.refresh(post)
-    
+
+    async def work(session: AsyncSession):
+        stmt = select(Post).where(Post.id == post_id)
+        post = await session.execute(stmt)
+        post = post.scalar_one_or_none()
+
+        if not post:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+        # 본인/관리자만 수정 가능
+        if post.author_id != current_user.id and current_user.role != Role.ADMIN:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied"
+            )
+
+        if post_data.title:
+            post.title = post_data.title
+        if post_data.content:
+            post.content = post_data.content
+        if post_data.source is not None:
+            post.source = post_data.source
+
+        await session.flush()
+        await session.refresh(post)
+        return post
+
+    post = await write_coordinator.submit(work)
+    front_page_cache.invalidate_board(post.board_id)
     return post
 
 
 @router.delete("/posts/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     """게시글 삭제 (본인 + admin)"""
     if not current_user:
@@ -210,45 +292,63 @@ async def delete_post(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    
-    stmt = select(Post).where(Post.id == post_id)
-    post = await session.execute(stmt)
-    post = post.scalar_one_or_none()
-    
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
-    
-    # 본인/관리자만 삭제 가능
-    if post.author_id != current_user.id and current_user.role != Role.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permission denied"
-        )
-    
-    await session.delete(post)
-    await session.commit()
 
+    async def work(session: AsyncSession):
+        stmt = select(Post).where(Post.id == post_id)
+        post = await session.execute(stmt)
+        post = post.scalar_one_or_none()
+
+        if not post:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+        # 본인/관리자만 삭제 가능
+        if post.author_id != current_user.id and current_user.role != Role.ADMIN:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied"
+            )
 
-@router.get("/search", response_model=List[PostResponse])
-async def search_posts(
+        await session.delete(post)
+        await session.flush()
+        return post.board_id
+
+    board_id = await write_coordinator.submit(work)
+    front_page_cache.invalidate_board(board_id)
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
     q: str = Query(..., min_length=1),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
+    board_id: Optional[int] = Query(None, description="이 게시판의 글만"),
+    date_from: Optional[date] = Query(None, description="작성일 시작 (포함)"),
+    date_to: Optional[date] = Query(None, description="작성일 끝 (포함)"),
+    sort: str = Query("relevance", pattern="^(relevance|latest)$"),
     limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
 ):
-    """게시글 검색 (제목 + 본문, LIKE 검색)"""
-    search_term = f"%{q}%"
-    stmt = select(Post).where(
-        or_(
-            Post.title.ilike(search_term),
-            Post.content.ilike(search_term)
-        )
-    ).options(
-        selectinload(Post.author),
-        selectinload(Post.board),
-    ).order_by(desc(Post.created_at)).limit(limit)
+    """
+    게시글 검색 (제목 + 본문, 공개)
 
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    relevance: 관련도순(SQLite FTS5 bm25), latest: 최신 글순.
+    본문 대신 검색어 주변 스니펫을 돌려주고, total은 조건에 맞는 전체 글 수다.
+    (SQLite에서 색인을 못 쓰는 짧은 검색어는 최신순으로만 정렬하고 개수는 상한까지만 센다 — search.py)
+    """
+    hits, total, total_exact = await search_posts(
+        session, q,
+        board_id=board_id, date_from=date_from, date_to=date_to,
+        sort=sort, limit=limit, offset=offset,
+    )
+    return SearchResponse(
+        posts=[
+            SearchResultResponse.model_validate(post).model_copy(
+                update={"title_highlight": title, "snippet": snippet}
+            )
+            for post, title, snippet in hits
+        ],
+        total=total,
+        total_exact=total_exact,
+    )
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
+from config import COMMENT_BATCH_MAX
 from models import Role
 
 
@@ -84,6 +85,9 @@ class PostResponse(PostBase):
     author: UserResponse
     board: BoardResponse
     view_count: int
+    comment_count: int = 0
+    attachment_count: int = 0
+    last_activity_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -91,6 +95,43 @@ class PostResponse(PostBase):
         from_attributes = True
 
 
+class PostSummaryRow(BaseModel):
+    """목록용 게시글 — 본문(content) 대신 저장해 둔 요약문(excerpt), 작성자/게시판은 id만"""
+    id: int
+    board_id: int
+    author_id: int
+    title: str
+    excerpt: str = ""
+    source: Optional[str] = None
+    view_count: int
+    comment_count: int = 0
+    attachment_count: int = 0
+    last_activity_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class PostSummaryResponse(PostSummaryRow):
+    author: UserResponse
+    board: BoardResponse
+
+
+class SideloadedPostRow(PostSummaryRow):
+    """include하지 않은 쪽(작성자 또는 게시판)은 행에 중첩된 채로 남는다"""
+    author: Optional[UserResponse] = None
+    board: Optional[BoardResponse] = None
+
+
+class SideloadedPostsResponse(BaseModel):
+    """?include= 목록 — include한 작성자/게시판은 행에 id만 두고 id → 객체 맵에 한 번씩"""
+    posts: List[SideloadedPostRow]
+    users: Dict[str, UserResponse] = {}
+    boards: Dict[str, BoardResponse] = {}
+
+
 class PostDetailResponse(PostResponse):
     comments: List["CommentResponse"] = []
     attachments: List["AttachmentResponse"] = []
@@ -105,17 +146,34 @@ class CommentCreate(CommentBase):
     pass
 
 
-class CommentResponse(CommentBase):
+class CommentBatchItem(CommentBase):
+    author_id: Optional[int] = None  # 다른 계정 이름으로 (admin/moderator만). 없으면 요청한 사용자
+
+
+class CommentBatchCreate(BaseModel):
+    comments: List[CommentBatchItem] = Field(..., min_length=1, max_length=COMMENT_BATCH_MAX)
+
+
+class CommentRow(CommentBase):
     id: int
     post_id: int
     author_id: int
-    author: UserResponse
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class CommentResponse(CommentRow):
+    author: UserResponse
+
+
+class SideloadedCommentsResponse(BaseModel):
+    """?include=authors 목록 — 행에는 author_id만, 작성자는 id → 객체 맵에 한 번씩"""
+    comments: List[CommentRow]
+    users: Dict[str, UserResponse] = {}
+
+
 # ==================== 첨부파일 스키마 ====================
 class AttachmentResponse(BaseModel):
     id: int
@@ -123,16 +181,60 @@ class AttachmentResponse(BaseModel):
     filename: str
     file_type: str
     file_size: int
+    sha256: Optional[str] = None  # 다운로드 URL에 ?v=로 붙이면 immutable 캐시
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class UploadSessionCreate(BaseModel):
+    """이어 올리기 세션 생성 (upload_sessions.py)"""
+    filename: str = Field(..., min_length=1, max_length=255)
+    file_type: str = Field("application/octet-stream", max_length=50)
+    file_size: int = Field(..., ge=0)
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-f]{64}$")  # 주면 완료할 때 내용과 비교
+
+
+class UploadSessionResponse(BaseModel):
+    upload_id: str
+    post_id: int
+    filename: str
+    file_size: int
+    chunk_size: int
+    chunk_count: int
+    received: List[int] = []  # 받은 조각 번호
+    offset: int = 0  # 앞에서부터 빠짐없이 받은 바이트 수
+    expires_at: datetime
+
+
 # ==================== 검색 스키마 ====================
+class SearchResultResponse(BaseModel):
+    """검색 결과 한 건 — 본문 대신 검색어 주변 스니펫만 담는다"""
+    id: int
+    board_id: int
+    author_id: int
+    title: str
+    title_highlight: str = ""  # HTML 이스케이프 + 검색어 <mark>
+    snippet: str = ""  # HTML 이스케이프 + 검색어 <mark>
+    source: Optional[str] = None
+    author: UserResponse
+    board: BoardResponse
+    view_count: int
+    comment_count: int = 0
+    attachment_count: int = 0
+    last_activity_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class SearchResponse(BaseModel):
-    posts: List[PostResponse] = []
+    posts: List[SearchResultResponse] = []
     total: int = 0
+    total_exact: bool = True  # False면 total은 하한값 (짧은 검색어는 상한까지만 센다)
 
 
 # 순환 참조 해결
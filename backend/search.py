@@ -0,0 +1,223 @@
+"""
+게시글 전문 검색
+
+SQLite: FTS5 가상 테이블 posts_fts (tokenize='trigram', v0006)
+    - 한국어는 공백 단위 토큰화가 맞지 않아 3글자 n-gram으로 색인한다.
+      "토론회" 검색이 "AI토론회에서"에도 걸리므로 기존 LIKE '%q%'와 결과가 같다.
+    - posts를 원본으로 쓰는 external content 테이블이라 본문을 두 번 저장하지 않는다.
+    - posts의 INSERT / DELETE / title·content UPDATE 트리거로 동기화된다.
+      (조회수·카운터 UPDATE는 트리거를 타지 않는다)
+    - 관련도(bm25), 제목 하이라이트, 본문 스니펫을 FTS5 안에서 계산한다.
+    - trigram은 3글자 미만 검색어를 색인으로 처리할 수 없어서 그때만 LIKE로 검색한다.
+
+PostgreSQL: ILIKE — v0002의 pg_trgm GIN 인덱스가 일치하는 글을 찾는다
+    - 관련도는 "제목에 있는 글 먼저, 그다음 최신순"
+
+SQLite 짧은 검색어: LIKE — 색인 없이 최신 글부터 훑는다
+    - 항상 최신순 — created_at 인덱스를 따라 읽다가 limit개에서 멈출 수 있다.
+      관련도순으로 정렬하려면 전체 본문을 읽어야 해서 쓰지 않는다.
+    - 같은 이유로 개수는 LIKE_COUNT_LIMIT까지만 센다 (넘으면 total_exact = False)
+
+LIKE 쪽 스니펫은 DB에서 검색어 주변만 잘라 온다 (본문 전체를 가져오지 않는다).
+
+하이라이트/스니펫은 HTML 이스케이프 후 검색어를 <mark>로 감싼 문자열이다.
+
+색인이 어긋났을 때: python manage.py rebuild-search
+"""
+import html
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy import Integer, case, column, desc, func, literal, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
+
+from models import Post
+
+# trigram 토크나이저가 색인으로 찾을 수 있는 최소 검색어 길이
+MIN_FTS_QUERY_LENGTH = 3
+
+# bm25 컬럼 가중치 (title, content) — 제목 일치를 본문보다 높게
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+# 스니펫 길이 — FTS는 토큰(trigram ≒ 글자) 수, LIKE는 글자 수
+SNIPPET_TOKENS = 48
+SNIPPET_CONTEXT = 30
+SNIPPET_LENGTH = 120
+
+# SQLite LIKE 검색의 개수 세기 상한 — 흔한 2글자 검색어로 전체 본문을 훑지 않게
+LIKE_COUNT_LIMIT = 1000
+
+# FTS5 highlight()/snippet() 표시용 — 이스케이프 후 <mark>로 바꾼다
+_OPEN, _CLOSE = "\x02", "\x03"
+
+posts_fts = table("posts_fts", column("rowid", Integer), column("posts_fts"))
+
+
+def _fts_phrase(q: str) -> str:
+    """검색어 전체를 하나의 구문으로 — FTS5 연산자(AND, *, : 등)로 해석되지 않게 한다"""
+    return '"' + q.replace('"', '""') + '"'
+
+
+def _use_fts(q: str, dialect: str) -> bool:
+    return dialect == "sqlite" and len(q) >= MIN_FTS_QUERY_LENGTH
+
+
+def _post_filters(board_id: Optional[int], date_from: Optional[date], date_to: Optional[date]) -> list:
+    """게시판 / 작성일 범위 조건 (date_to는 그날 끝까지 포함)"""
+    filters = []
+    if board_id is not None:
+        filters.append(Post.board_id == board_id)
+    if date_from is not None:
+        filters.append(Post.created_at >= datetime.combine(date_from, time.min))
+    if date_to is not None:
+        filters.append(Post.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+    return filters
+
+
+def _like_condition(q: str):
+    search_term = f"%{q}%"
+    return or_(
+        Post.title.ilike(search_term),
+        Post.content.ilike(search_term)
+    )
+
+
+def _markup(fragment: str) -> str:
+    """FTS5 표시 문자가 들어간 조각 → 이스케이프된 HTML"""
+    return html.escape(fragment).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def _highlight(fragment: str, q: str) -> str:
+    """검색어(대소문자 무시)를 <mark>로 감싼 이스케이프된 HTML"""
+    parts = re.split(f"({re.escape(q)})", fragment, flags=re.IGNORECASE)
+    return "".join(
+        f"<mark>{html.escape(part)}</mark>" if i % 2 else html.escape(part)
+        for i, part in enumerate(parts)
+    )
+
+
+def _fts_queries(q: str, filters: list, sort: str, limit: int, offset: int):
+    """FTS5 검색 — (결과 쿼리, 개수 쿼리)"""
+    match = posts_fts.c.posts_fts.op("MATCH")(_fts_phrase(q))
+    where = [match]
+    if filters:
+        # 상관 EXISTS로 걸어야 FTS가 바깥 루프가 된다.
+        # posts와 JOIN하면 플래너가 posts부터 읽고 행마다 MATCH를 돌리는 경우가 있다.
+        where.append(select(Post.id).where(Post.id == posts_fts.c.rowid, *filters).exists())
+
+    if sort == "latest":
+        order_by = [posts_fts.c.rowid.desc()]
+    else:
+        # bm25는 작을수록 관련도가 높다
+        order_by = [func.bm25(posts_fts.c.posts_fts, TITLE_WEIGHT, CONTENT_WEIGHT), posts_fts.c.rowid.desc()]
+
+    stmt = select(
+        posts_fts.c.rowid,
+        func.highlight(posts_fts.c.posts_fts, 0, _OPEN, _CLOSE),
+        func.snippet(posts_fts.c.posts_fts, 1, _OPEN, _CLOSE, "…", SNIPPET_TOKENS),
+    ).where(*where).order_by(*order_by).limit(limit).offset(offset)
+    count_stmt = select(func.count()).select_from(posts_fts).where(*where)
+    return stmt, count_stmt
+
+
+def _like_queries(q: str, filters: list, sort: str, limit: int, offset: int, dialect: str):
+    """LIKE 검색 — (결과 쿼리, 개수 쿼리). 스니펫은 검색어 주변만 잘라 온다"""
+    where = [_like_condition(q), *filters]
+    postgres = dialect == "postgresql"
+
+    find = func.strpos if postgres else func.instr
+    position = find(func.lower(Post.content), func.lower(literal(q)))
+    start = case((position > SNIPPET_CONTEXT, position - SNIPPET_CONTEXT), else_=1)
+
+    order_by = [desc(Post.created_at), desc(Post.id)]
+    if postgres and sort != "latest":
+        order_by.insert(0, desc(Post.title.ilike(f"%{q}%")))
+
+    stmt = select(
+        Post.id,
+        Post.title,
+        start,
+        func.substr(Post.content, start, SNIPPET_LENGTH),
+        func.length(Post.content),
+    ).where(*where).order_by(*order_by).limit(limit).offset(offset)
+
+    if postgres:
+        count_stmt = select(func.count()).select_from(Post).where(*where)
+    else:
+        capped = select(Post.id).where(*where).limit(LIKE_COUNT_LIMIT + 1).subquery()
+        count_stmt = select(func.count()).select_from(capped)
+    return stmt, count_stmt
+
+
+async def search_posts(
+    session: AsyncSession,
+    q: str,
+    board_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    sort: str = "relevance",
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple:
+    """
+    게시글 검색
+
+    Returns:
+        ([(Post, 제목 하이라이트, 본문 스니펫), ...], 전체 개수, 개수가 정확한지)
+        Post는 content를 불러오지 않은 상태(defer)이고 author/board는 로드되어 있다.
+    """
+    dialect = session.get_bind().dialect.name
+    filters = _post_filters(board_id, date_from, date_to)
+    use_fts = _use_fts(q, dialect)
+
+    if use_fts:
+        stmt, count_stmt = _fts_queries(q, filters, sort, limit, offset)
+        hits = [
+            (post_id, _markup(title), _markup(snippet))
+            for post_id, title, snippet in (await session.execute(stmt)).all()
+        ]
+    else:
+        stmt, count_stmt = _like_queries(q, filters, sort, limit, offset, dialect)
+        hits = []
+        for post_id, title, start, snippet, length in (await session.execute(stmt)).all():
+            prefix = "…" if start > 1 else ""
+            suffix = "…" if start - 1 + len(snippet) < length else ""
+            hits.append((post_id, _highlight(title, q), prefix + _highlight(snippet, q) + suffix))
+
+    exact = True
+    if len(hits) < limit and (hits or offset == 0):
+        # 마지막 페이지면 개수를 따로 셀 필요가 없다
+        total = offset + len(hits)
+    else:
+        total = (await session.execute(count_stmt)).scalar()
+        if dialect == "sqlite" and not use_fts and total > LIKE_COUNT_LIMIT:
+            total, exact = LIKE_COUNT_LIMIT, False
+    if not hits:
+        return [], total, exact
+
+    result = await session.execute(
+        select(Post).where(Post.id.in_([post_id for post_id, _, _ in hits])).options(
+            defer(Post.content, raiseload=True),
+            selectinload(Post.author),
+            selectinload(Post.board),
+        )
+    )
+    posts = {post.id: post for post in result.scalars()}
+    # 검색과 로드 사이에 지워진 글은 빠진다
+    return [(posts[post_id], title, snippet) for post_id, title, snippet in hits if post_id in posts], total, exact
+
+
+def rebuild_search_index(conn) -> int:
+    """
+    posts 전체로 검색 색인 재구성 (동기 커넥션 — run_sync로 호출)
+
+    Returns:
+        색인한 게시글 수 (PostgreSQL은 재구성할 것이 없어 -1)
+    """
+    if conn.dialect.name != "sqlite":
+        return -1
+    conn.execute(text("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
+    return conn.execute(select(func.count()).select_from(Post)).scalar()
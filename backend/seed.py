@@ -1,5 +1,6 @@
 import asyncio
 from database import AsyncSessionLocal, init_db
+from post_counters import backfill_post_counters
 from models import User, Board, Post, Comment, Role
 from auth import hash_password
 
@@ -98,6 +99,10 @@ async def seed_data():
         session.add_all([comment1, comment2])
         await session.commit()
         print(f"✅ Created 2 comments")
+
+        # 댓글을 직접 넣었으므로 게시글 카운터 재계산
+        await session.run_sync(lambda s: backfill_post_counters(s.connection()))
+        await session.commit()
         
         print("\n🎉 Seed data created successfully!")
         
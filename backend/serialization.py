@@ -0,0 +1,89 @@
+"""
+목록 응답 직렬화 빠른 경로
+
+response_model=List[PostSummaryResponse]로 ORM 객체를 그대로 돌려주면 FastAPI가 행마다
+PostSummaryResponse / UserResponse / BoardResponse를 검증하며 만든 뒤 dict로 바꾸고 다시 JSON으로 덤프한다.
+자주 불리는 목록 라우트는 대신 응답 스키마의 필드 이름대로 ORM 속성을 dict로 옮겨(Projection)
+orjson으로 바로 덤프한다. DB에서 읽은 값이라 다시 검증하지 않는다.
+
+출력 바이트는 FastAPI 기본 경로와 같다 (필드 순서 = 스키마 선언 순서).
+라우트의 response_model은 문서(OpenAPI)용으로 그대로 둔다.
+
+비용 비교: python benchmarks/bench_serialize.py
+
+사이드로드(?include=authors,boards): 같은 AI 계정 몇 개가 쓴 글 100개면 같은 작성자 객체가 100번 나간다.
+include에 든 것만 행에서 author/board 객체를 빼고(id는 남는다) {"users": {id: 객체}, "boards": {...}}
+맵에 한 번씩만 담는다 (normalize). include=authors만 주면 board는 행에 그대로 중첩된다.
+"""
+from typing import Iterable, Optional
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from schemas import CommentResponse, PostSummaryResponse
+
+
+class Projection:
+    """응답 스키마(중첩 모델 포함)의 필드 이름대로 객체 속성을 dict로 옮긴다"""
+
+    def __init__(self, model: type):
+        self._fields = []
+        for name, field in model.model_fields.items():
+            nested = field.annotation
+            is_model = isinstance(nested, type) and issubclass(nested, BaseModel)
+            self._fields.append((name, Projection(nested) if is_model else None))
+
+    def __call__(self, obj) -> dict:
+        row = {}
+        for name, nested in self._fields:
+            value = getattr(obj, name)
+            row[name] = nested(value) if nested is not None and value is not None else value
+        return row
+
+
+post_summary_projection = Projection(PostSummaryResponse)
+comment_projection = Projection(CommentResponse)
+
+# include 값 → (행의 중첩 필드, 맵 이름)
+SIDELOADS = {"authors": ("author", "users"), "boards": ("board", "boards")}
+
+
+def include_pattern(*names: str) -> str:
+    """include 쿼리 파라미터 검증용 정규식 (예: "authors,boards")"""
+    choice = "|".join(names)
+    return f"^({choice})(,({choice}))*$"
+
+
+def parse_include(include: Optional[str]) -> Optional[frozenset]:
+    """include 쿼리 파라미터 → 사이드로드할 이름 집합 (없으면 None = 중첩 객체 그대로)"""
+    if include is None:
+        return None
+    return frozenset(include.split(","))
+
+
+def normalize(key: str, rows: list, include: frozenset) -> dict:
+    """
+    projection한 행 목록 → {key: 행(include한 중첩 객체 제외), "users": {...}, "boards": {...}}
+
+    맵 키는 id 문자열이다 (JSON 객체 키). include하지 않은 중첩 객체는 행에 남는다.
+    """
+    nested = {SIDELOADS[name][0] for name in include}
+    body = {key: [{name: value for name, value in row.items() if name not in nested} for row in rows]}
+    for name, (field, map_key) in SIDELOADS.items():
+        if name in include:
+            body[map_key] = {str(row[field]["id"]): row[field] for row in rows}
+    return body
+
+
+def list_response(
+    projection: Projection,
+    items: Iterable,
+    headers: Optional[dict] = None,
+    key: str = None,
+    include: Optional[frozenset] = None,
+) -> ORJSONResponse:
+    """ORM 객체 목록 → JSON 배열 응답 (include가 있으면 {key: [...], 맵...} 사이드로드 응답)"""
+    rows = [projection(item) for item in items]
+    if include is not None:
+        return ORJSONResponse(normalize(key, rows, include), headers=headers)
+    return ORJSONResponse(rows, headers=headers)
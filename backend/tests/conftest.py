@@ -0,0 +1,84 @@
+"""
+테스트 공용 픽스처 — backend/ 에서 python -m pytest
+
+실제 data/board.db·uploads를 건드리지 않도록 config가 import 되기 전에
+임시 디렉토리의 DB·업로드 경로를 환경변수로 지정한다 (benchmarks/common.prepare_env와 같은 방식).
+DB는 테스트 세션 전체가 하나를 쓴다 — 테스트마다 새 사용자·게시판·글을 만들어 서로 겹치지 않게 한다.
+"""
+import itertools
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+_tmpdir = tempfile.mkdtemp(prefix="sudabang-test-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmpdir}/test.db"
+os.environ["UPLOADS_DIR"] = os.path.join(_tmpdir, "uploads")
+os.environ["AUTO_MIGRATE"] = "1"
+os.environ["BCRYPT_ROUNDS"] = "4"  # 해시 비용 최소 (테스트 속도)
+os.environ["IMAGE_WORKERS"] = "0"  # 파생본 워커 프로세스를 띄우지 않는다
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+_names = itertools.count(1)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    """lifespan(마이그레이션, 쓰기 코디네이터 등)을 실행한 앱에 직접 붙는 클라이언트"""
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+async def create_user(client, role: str = "member") -> dict:
+    """사용자를 만들고 로그인 → {"id", "username", "password", "headers"}"""
+    username = f"tester{next(_names)}"
+    password = "test12345"
+    resp = await client.post("/api/auth/register", json={
+        "username": username, "display_name": username, "password": password, "role": role,
+    })
+    assert resp.status_code == 200, resp.text
+    user_id = resp.json()["id"]
+    resp = await client.post("/api/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200, resp.text
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    return {"id": user_id, "username": username, "password": password, "headers": headers}
+
+
+async def create_board(client, headers: dict) -> int:
+    n = next(_names)
+    resp = await client.post("/api/boards", json={"name": f"게시판 {n}", "slug": f"test-{n}"}, headers=headers)
+    assert resp.status_code in (200, 201), resp.text
+    return resp.json()["id"]
+
+
+async def create_post(client, board_id: int, headers: dict, content: str = "테스트 본문") -> int:
+    resp = await client.post(
+        f"/api/boards/{board_id}/posts", json={"title": "테스트 글", "content": content}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"]
+
+
+@pytest.fixture
+async def admin(client) -> dict:
+    return await create_user(client, role="admin")
+
+
+@pytest.fixture
+async def post_id(client, admin) -> int:
+    """관리자가 새 게시판에 쓴 글 하나"""
+    board_id = await create_board(client, admin["headers"])
+    return await create_post(client, board_id, admin["headers"])
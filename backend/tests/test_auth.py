@@ -0,0 +1,85 @@
+"""인증 — 토큰 클레임 확인과 폐기 (dependencies.get_current_user, token_versions.py)"""
+import pytest
+from sqlalchemy import update
+
+from auth import create_access_token
+from conftest import create_user
+from database import AsyncSessionLocal
+from models import Role, User
+from token_versions import token_versions
+
+pytestmark = pytest.mark.anyio
+
+
+async def _change_user(user_id: int, **values):
+    """ORM으로 사용자 수정 (이 프로세스의 관리 도구·라우터와 같은 경로)"""
+    async with AsyncSessionLocal() as session:
+        user = await session.get(User, user_id)
+        for name, value in values.items():
+            setattr(user, name, value)
+        await session.commit()
+
+
+async def test_token_claims_authenticate(client):
+    user = await create_user(client)
+    resp = await client.get("/api/auth/me", headers=user["headers"])
+    assert resp.status_code == 200
+    assert resp.json()["username"] == user["username"]
+
+
+async def test_invalid_token_rejected(client):
+    resp = await client.get("/api/auth/me", headers={"Authorization": "Bearer not-a-token"})
+    assert resp.status_code == 401
+
+
+@pytest.mark.parametrize("change", [
+    {"is_active": False},
+    {"role": Role.ADMIN},
+    {"password_hash": "changed"},
+    {"display_name": "새 이름"},
+])
+async def test_change_revokes_issued_tokens(client, change):
+    user = await create_user(client)
+    assert (await client.get("/api/auth/me", headers=user["headers"])).status_code == 200
+
+    await _change_user(user["id"], **change)
+
+    # 커밋 직후 다음 요청부터 거부 (토큰 버전 표가 ORM 이벤트로 무효화된다)
+    assert (await client.get("/api/auth/me", headers=user["headers"])).status_code == 401
+
+
+async def test_relogin_after_role_change(client):
+    user = await create_user(client)
+    await _change_user(user["id"], role=Role.MODERATOR)
+
+    resp = await client.post("/api/auth/login", json={"username": user["username"], "password": user["password"]})
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    resp = await client.get("/api/auth/me", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["role"] == "moderator"
+
+
+async def test_change_outside_orm_applies_after_ttl(client):
+    """다른 프로세스(ORM 이벤트 없음)에서 올린 버전은 표 항목이 만료되면 반영된다"""
+    user = await create_user(client)
+    assert (await client.get("/api/auth/me", headers=user["headers"])).status_code == 200
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.id == user["id"]).values(token_version=User.token_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+    token_versions.invalidate(user["id"])  # TOKEN_VERSION_TTL이 지난 것과 같다
+    assert (await client.get("/api/auth/me", headers=user["headers"])).status_code == 401
+
+
+async def test_legacy_token_rejected_when_deactivated(client):
+    """sub만 있는 예전 토큰은 user_cache 경로 — 비활성화가 바로 반영된다"""
+    user = await create_user(client)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user['id'])})}"}
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+    await _change_user(user["id"], is_active=False)
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 401
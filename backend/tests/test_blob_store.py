@@ -0,0 +1,95 @@
+"""blob 저장소 — 같은 내용 공유와 GC (blob_store.py)"""
+import hashlib
+import os
+import time
+
+import pytest
+
+from blob_store import BlobStore
+
+OLD = time.time() - 7200  # BLOB_GC_GRACE(1시간)보다 오래전
+
+
+@pytest.fixture
+def store(tmp_path) -> BlobStore:
+    return BlobStore(tmp_path / "blobs")
+
+
+def _put(store: BlobStore, content: bytes, mtime: float = None) -> str:
+    tmp = store.temp_path()
+    tmp.write_bytes(content)
+    digest = hashlib.sha256(content).hexdigest()
+    key = store.put(tmp, digest)
+    if mtime is not None:
+        os.utime(store.resolve(key), (mtime, mtime))
+    return digest
+
+
+def _exists(store: BlobStore, digest: str) -> bool:
+    return store.resolve(store.key(digest)).exists()
+
+
+def test_put_same_content_once(store):
+    first = _put(store, b"same", mtime=OLD)
+    second = _put(store, b"same")
+    assert first == second
+    assert store.resolve(store.key(first)).read_bytes() == b"same"
+    assert store.resolve(store.key(first)).stat().st_mtime > OLD  # 유예 시간을 다시 센다
+    assert list(store.tmp_dir.iterdir()) == []
+
+
+def test_gc_removes_only_stale_unreferenced(store):
+    kept = _put(store, b"referenced", mtime=OLD)
+    stale = _put(store, b"stale", mtime=OLD)
+    fresh = _put(store, b"fresh")
+
+    stats = store.gc([kept], dry_run=True)
+    assert stats["removed"] == 1 and _exists(store, stale)
+
+    stats = store.gc([kept])
+    assert (stats["blobs"], stats["removed"], stats["freed"]) == (3, 1, len(b"stale"))
+    assert _exists(store, kept) and _exists(store, fresh)
+    assert not _exists(store, stale)
+
+
+def test_gc_keeps_blob_referenced_while_collecting(store):
+    digest = _put(store, b"late commit", mtime=OLD)
+    stats = store.gc([], still_referenced=lambda names: names & {digest})
+    assert stats["removed"] == 0
+    assert _exists(store, digest)
+
+
+def test_gc_keeps_blob_put_while_collecting(store):
+    """GC가 후보로 고른 뒤 같은 내용이 다시 올라오면 그 blob은 남는다"""
+    digest = _put(store, b"uploaded again", mtime=OLD)
+
+    def upload_during_gc(names):
+        _put(store, b"uploaded again")
+        return set()
+
+    store.gc([], still_referenced=upload_during_gc)
+    assert store.resolve(store.key(digest)).read_bytes() == b"uploaded again"
+    assert list(store.trash_dir.iterdir()) == []
+
+
+def test_gc_tolerates_vanishing_tmp_files(store):
+    os.makedirs(store.tmp_dir)
+    os.symlink(store.tmp_dir / "gone.part", store.tmp_dir / "renamed.part")  # stat() → FileNotFoundError
+    stale = store.tmp_dir / "stale.part"
+    stale.write_bytes(b"x")
+    os.utime(stale, (OLD, OLD))
+
+    stats = store.gc([])
+    assert stats["removed"] == 1
+    assert not stale.exists()
+
+
+def test_gc_restores_leftover_trash(store):
+    """지난 GC가 휴지통으로 옮긴 채 멈췄으면 되돌린 뒤 다시 판단한다"""
+    digest = _put(store, b"interrupted")
+    path = store.resolve(store.key(digest))
+    os.makedirs(store.trash_dir)
+    os.rename(path, store.trash_dir / f"{digest}.abcd")
+
+    store.gc([digest])
+    assert _exists(store, digest)
@@ -0,0 +1,51 @@
+"""댓글 — 일괄 작성과 목록 순서 (comment_router.py)"""
+import pytest
+
+from conftest import create_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_batch_keeps_order(client, admin, post_id):
+    member = await create_user(client)
+    headers = admin["headers"]
+    await client.post(f"/api/posts/{post_id}/comments", json={"content": "먼저"}, headers=headers)
+
+    items = [
+        {"content": f"일괄 {i}", **({"author_id": member["id"]} if i % 2 else {})} for i in range(12)
+    ]
+    resp = await client.post(f"/api/posts/{post_id}/comments:batch", json={"comments": items}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    created = resp.json()
+    assert [c["content"] for c in created] == [item["content"] for item in items]
+    assert len({c["created_at"] for c in created}) == 1  # 한 트랜잭션 — 같은 시각
+    assert [c["author"]["id"] for c in created[:2]] == [admin["id"], member["id"]]
+
+    expected = ["먼저"] + [item["content"] for item in items]
+    listed = (await client.get(f"/api/posts/{post_id}/comments")).json()
+    assert [c["content"] for c in listed] == expected
+    sideloaded = (await client.get(f"/api/posts/{post_id}/comments", params={"include": "authors"})).json()
+    assert [c["content"] for c in sideloaded["comments"]] == expected
+    detail = (await client.get(f"/api/posts/{post_id}")).json()
+    assert [c["content"] for c in detail["comments"]] == expected
+    assert detail["comment_count"] == len(expected)
+
+
+async def test_batch_other_author_needs_moderator(client, admin, post_id):
+    member = await create_user(client)
+    resp = await client.post(
+        f"/api/posts/{post_id}/comments:batch",
+        json={"comments": [{"content": "대신 쓰기", "author_id": admin["id"]}]},
+        headers=member["headers"],
+    )
+    assert resp.status_code == 403
+
+
+async def test_batch_is_all_or_nothing(client, admin, post_id):
+    resp = await client.post(
+        f"/api/posts/{post_id}/comments:batch",
+        json={"comments": [{"content": "정상"}, {"content": "없는 작성자", "author_id": 999999}]},
+        headers=admin["headers"],
+    )
+    assert resp.status_code == 422
+    assert (await client.get(f"/api/posts/{post_id}/comments")).json() == []
@@ -0,0 +1,64 @@
+"""조건부 조회 — ETag / If-None-Match → 304 (etags.py)"""
+import pytest
+
+from conftest import create_board, create_post
+
+pytestmark = pytest.mark.anyio
+
+
+async def _revalidate(client, url: str, etag: str, **kwargs):
+    return await client.get(url, headers={"If-None-Match": etag}, **kwargs)
+
+
+async def test_boards_not_modified_until_board_added(client, admin):
+    resp = await client.get("/api/boards")
+    etag = resp.headers["etag"]
+
+    resp = await _revalidate(client, "/api/boards", etag)
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    await create_board(client, admin["headers"])
+    resp = await _revalidate(client, "/api/boards", etag)
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+
+@pytest.mark.parametrize("params", [{}, {"sort": "activity"}], ids=["front-page", "activity"])
+async def test_post_list_not_modified_until_new_post(client, admin, params):
+    board_id = await create_board(client, admin["headers"])
+    await create_post(client, board_id, admin["headers"])
+    url = f"/api/boards/{board_id}/posts"
+
+    etag = (await client.get(url, params=params)).headers["etag"]
+    assert (await _revalidate(client, url, etag, params=params)).status_code == 304
+    assert (await _revalidate(client, url, '"stale"', params=params)).status_code == 200
+
+    await create_post(client, board_id, admin["headers"])
+    resp = await _revalidate(client, url, etag, params=params)
+    assert resp.status_code == 200
+    assert len(resp.json()) == 2
+
+
+async def test_post_detail_ignores_view_count_but_not_comments(client, admin, post_id):
+    url = f"/api/posts/{post_id}"
+    resp = await client.get(url)
+    etag, views = resp.headers["etag"], resp.json()["view_count"]
+
+    # 조회수만 바뀌면 304
+    await client.get(url)
+    assert (await _revalidate(client, url, etag)).status_code == 304
+
+    resp = await client.post(f"{url}/comments", json={"content": "새 댓글"}, headers=admin["headers"])
+    assert resp.status_code == 201
+    resp = await _revalidate(client, url, etag)
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert resp.json()["comment_count"] == 1
+    assert resp.json()["view_count"] > views
+
+
+async def test_missing_post_is_404_even_with_validator(client):
+    resp = await _revalidate(client, "/api/posts/999999", 'W/"anything"')
+    assert resp.status_code == 404
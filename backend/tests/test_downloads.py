@@ -0,0 +1,59 @@
+"""첨부 다운로드 — 강한 ETag·Range는 원본 바이트 그대로 (downloads.py, compression.py)"""
+import hashlib
+
+import pytest
+
+from conftest import create_board, create_post
+
+pytestmark = pytest.mark.anyio
+
+# 압축 최소 크기(COMPRESS_MIN_SIZE)보다 크고 잘 줄어드는 텍스트
+CONTENT = ("가나다라마바사 " * 400).encode()
+
+
+@pytest.fixture
+async def attachment(client, admin, post_id) -> dict:
+    resp = await client.post(
+        f"/api/posts/{post_id}/attachments",
+        files={"file": ("notes.txt", CONTENT, "text/plain")},
+        headers=admin["headers"],
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def test_small_text_download_not_compressed(client, attachment):
+    resp = await client.get(f"/api/attachments/{attachment['id']}", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["content-length"] == str(len(CONTENT))
+    assert resp.content == CONTENT
+    etag = resp.headers["etag"]
+    assert etag == f'"{hashlib.sha256(CONTENT).hexdigest()}"'  # 강한 검증자
+
+    resp = await client.get(
+        f"/api/attachments/{attachment['id']}", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+
+
+async def test_range_with_if_range(client, attachment):
+    url = f"/api/attachments/{attachment['id']}"
+    etag = (await client.get(url)).headers["etag"]
+
+    resp = await client.get(url, headers={"Range": "bytes=0-99", "If-Range": etag, "Accept-Encoding": "gzip"})
+    assert resp.status_code == 206
+    assert resp.content == CONTENT[:100]
+
+    # 다른 ETag면 전체
+    resp = await client.get(url, headers={"Range": "bytes=0-99", "If-Range": '"other"'})
+    assert resp.status_code == 200
+    assert resp.content == CONTENT
+
+
+async def test_json_api_still_compressed(client, admin):
+    board_id = await create_board(client, admin["headers"])
+    post_id = await create_post(client, board_id, admin["headers"], content=CONTENT.decode())
+    resp = await client.get(f"/api/posts/{post_id}", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["etag"].startswith("W/")
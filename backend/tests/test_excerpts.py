@@ -0,0 +1,26 @@
+"""목록 요약문 — 마크다운 표시 걷어내기 (excerpts.make_excerpt)"""
+import pytest
+
+from excerpts import make_excerpt
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("소개\n# 제목\n본문", "소개 제목 본문"),
+    ("소개\r\n## 제목 ##\r\n본문", "소개 제목 본문"),
+    ("> # 인용 안의 제목\n> 본문", "인용 안의 제목 본문"),
+    ("- ## 목록 안의 제목", "목록 안의 제목"),
+    ("> > 겹친 인용", "겹친 인용"),
+    ("**굵게** `코드` [링크](http://x) ![그림](a.png)", "굵게 코드 링크 그림"),
+    ("```\nprint(1)\n```\n본문", "본문"),
+])
+def test_markdown_marks_removed(content, expected):
+    assert make_excerpt(content) == expected
+
+
+@pytest.mark.parametrize("content", ["C# 언어", "#해시태그 글", "이슈 #"])
+def test_hash_in_text_kept(content):
+    assert make_excerpt(content) == content
+
+
+def test_truncated_to_length():
+    assert make_excerpt("가" * 20, length=10) == "가" * 10 + "…"
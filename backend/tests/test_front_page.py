@@ -0,0 +1,93 @@
+"""게시판 첫 페이지 캐시 — 쓰기 후 무효화, 동시 재구성 합치기 (front_page.py)"""
+import asyncio
+
+import pytest
+
+from conftest import create_board, create_post
+from front_page import FrontPage, front_page_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def board_id(client, admin) -> int:
+    return await create_board(client, admin["headers"])
+
+
+async def _front(client, board_id: int, **params) -> list:
+    resp = await client.get(f"/api/boards/{board_id}/posts", params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def test_new_post_and_edit_and_delete(client, admin, board_id):
+    headers = admin["headers"]
+    first = await create_post(client, board_id, headers)
+    assert [p["id"] for p in await _front(client, board_id)] == [first]
+
+    second = await create_post(client, board_id, headers)
+    assert [p["id"] for p in await _front(client, board_id)] == [second, first]
+
+    resp = await client.put(f"/api/posts/{first}", json={"content": "고친 본문"}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert (await _front(client, board_id))[1]["excerpt"] == "고친 본문"
+
+    resp = await client.delete(f"/api/posts/{second}", headers=headers)
+    assert resp.status_code == 204
+    assert [p["id"] for p in await _front(client, board_id)] == [first]
+
+
+async def test_comment_updates_counts_and_activity(client, admin, board_id):
+    headers = admin["headers"]
+    older = await create_post(client, board_id, headers)
+    newer = await create_post(client, board_id, headers)
+    await _front(client, board_id)
+    assert [p["id"] for p in await _front(client, board_id, sort="activity")] == [newer, older]
+
+    resp = await client.post(f"/api/posts/{older}/comments", json={"content": "댓글"}, headers=headers)
+    comment_id = resp.json()["id"]
+    latest = {p["id"]: p for p in await _front(client, board_id)}
+    assert latest[older]["comment_count"] == 1
+    assert [p["id"] for p in await _front(client, board_id, sort="activity")] == [older, newer]
+
+    await client.delete(f"/api/comments/{comment_id}", headers=headers)
+    latest = {p["id"]: p for p in await _front(client, board_id)}
+    assert latest[older]["comment_count"] == 0
+
+
+async def test_board_rename_updates_nested_board(client, admin, board_id):
+    await create_post(client, board_id, admin["headers"])
+    await _front(client, board_id)
+
+    resp = await client.put(f"/api/boards/{board_id}", json={"name": "새 이름"}, headers=admin["headers"])
+    assert resp.status_code == 200, resp.text
+    assert (await _front(client, board_id))[0]["board"]["name"] == "새 이름"
+    sideloaded = (await _front(client, board_id, include="boards"))
+    assert sideloaded["boards"][str(board_id)]["name"] == "새 이름"
+
+
+async def test_concurrent_misses_build_once(client, admin, board_id, monkeypatch):
+    await create_post(client, board_id, admin["headers"])
+    builds = 0
+
+    class CountingFrontPage(FrontPage):
+        def __init__(self, *args, **kwargs):
+            nonlocal builds
+            builds += 1
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr("routers.post_router.FrontPage", CountingFrontPage)
+    front_page_cache.invalidate_board(board_id)
+    coalesced = front_page_cache.coalesced
+
+    responses = await asyncio.gather(*(client.get(f"/api/boards/{board_id}/posts") for _ in range(10)))
+    assert {resp.status_code for resp in responses} == {200}
+    assert len({resp.content for resp in responses}) == 1
+    assert builds == 1
+    assert front_page_cache.coalesced - coalesced == 9
+    assert front_page_cache._building == {}
+
+
+async def test_concurrent_misses_share_not_found(client):
+    responses = await asyncio.gather(*(client.get("/api/boards/999999/posts") for _ in range(5)))
+    assert [resp.status_code for resp in responses] == [404] * 5
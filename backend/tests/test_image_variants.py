@@ -0,0 +1,35 @@
+"""이미지 파생본 파이프라인 — 종료가 이벤트 루프를 막지 않는다 (image_variants.py)"""
+import asyncio
+import time
+
+import pytest
+
+from image_variants import ImagePipeline
+
+pytest.importorskip("PIL")
+pytestmark = pytest.mark.anyio
+
+
+async def test_stop_waits_for_render_off_the_event_loop():
+    pipeline = ImagePipeline(workers=1)
+    await pipeline.start()
+    loop = asyncio.get_running_loop()
+    render = loop.run_in_executor(pipeline._executor, time.sleep, 1.0)  # 오래 걸리는 render() 대신
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    started = time.monotonic()
+    await pipeline.stop()
+    elapsed = time.monotonic() - started
+    ticking.cancel()
+
+    await render  # 돌던 작업은 취소되지 않고 끝난다
+    assert elapsed >= 1.0
+    assert ticks >= elapsed / 0.05 / 2  # 그동안 다른 코루틴이 돌았다
@@ -0,0 +1,94 @@
+"""키셋(커서) 페이지네이션 — 같은 정렬 키가 겹쳐도 빠짐·중복 없이, 잘못된 커서는 400 (pagination.py)"""
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from conftest import create_board, create_post
+from database import AsyncSessionLocal
+from front_page import front_page_cache
+from models import Post
+from pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+async def tied_board(client, admin):
+    """글 7개 — created_at·last_activity_at이 여러 글씩 같다 → (board_id, 글 id, 정렬 키 dict)"""
+    board_id = await create_board(client, admin["headers"])
+    post_ids = [await create_post(client, board_id, admin["headers"]) for _ in range(7)]
+    keys = {"latest": {}, "activity": {}}
+    async with AsyncSessionLocal() as session:
+        for i, post_id in enumerate(post_ids):
+            created = BASE + timedelta(minutes=i // 3)  # 3·3·1개씩 같은 시각
+            activity = BASE + timedelta(hours=1, minutes=(6 - i) // 2)  # 순서를 뒤집어 2개씩
+            await session.execute(
+                update(Post).where(Post.id == post_id).values(created_at=created, last_activity_at=activity)
+            )
+            keys["latest"][post_id] = created
+            keys["activity"][post_id] = activity
+        await session.commit()
+    front_page_cache.invalidate_board(board_id)  # DB를 직접 고쳤으므로
+    return board_id, post_ids, keys
+
+
+async def _walk(client, board_id: int, sort: str, limit: int) -> list:
+    url = f"/api/boards/{board_id}/posts"
+    params = {"sort": sort, "limit": limit}
+    seen = []
+    for _ in range(20):
+        resp = await client.get(url, params=params)
+        assert resp.status_code == 200, resp.text
+        page = [post["id"] for post in resp.json()]
+        assert len(page) <= limit
+        seen.extend(page)
+        if "x-next-cursor" not in resp.headers:
+            return seen
+        params = {"sort": sort, "limit": limit, "cursor": resp.headers["x-next-cursor"]}
+    pytest.fail("cursor pages never ended")
+
+
+@pytest.mark.parametrize("sort", ["latest", "activity"])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+async def test_walk_pages_without_gaps_or_duplicates(client, tied_board, sort, limit):
+    board_id, post_ids, keys = tied_board
+    expected = sorted(post_ids, key=lambda post_id: (keys[sort][post_id], post_id), reverse=True)
+
+    seen = await _walk(client, board_id, sort, limit)
+    assert seen == expected
+
+
+def _raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    "%%%",
+    _raw_cursor("latest"),
+    _raw_cursor(["latest", "2024-01-01T12:00:00"]),
+    _raw_cursor(["latest", "yesterday", 1]),
+    _raw_cursor(["latest", "2024-01-01T12:00:00", "one"]),
+    _raw_cursor(["latest", None, 1]),
+], ids=["garbage", "bad-base64", "not-a-list", "too-short", "bad-date", "bad-id", "null-key"])
+async def test_malformed_cursor_is_400(client, tied_board, cursor):
+    board_id, _, _ = tied_board
+    resp = await client.get(f"/api/boards/{board_id}/posts", params={"cursor": cursor})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid cursor"
+
+
+async def test_cursor_from_other_sort_is_400(client, tied_board):
+    board_id, post_ids, keys = tied_board
+    cursor = encode_cursor("latest", keys["latest"][post_ids[-1]], post_ids[-1])
+    resp = await client.get(f"/api/boards/{board_id}/posts", params={"sort": "activity", "cursor": cursor})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Cursor does not match sort order"
+
+    resp = await client.get(f"/api/boards/{board_id}/posts", params={"sort": "latest", "cursor": cursor})
+    assert resp.status_code == 200
@@ -0,0 +1,79 @@
+"""전문 검색 — FTS5 MATCH 이스케이프, 짧은 검색어 LIKE, 트리거 동기화 (search.py)"""
+import itertools
+
+import pytest
+from sqlalchemy import text
+
+from conftest import create_board, create_post
+from database import AsyncSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+_words = itertools.count(1)
+
+
+def _word() -> str:
+    """다른 테스트의 글과 겹치지 않는 검색어"""
+    return f"qzx{next(_words):04d}"
+
+
+async def _search(client, q: str, **params) -> dict:
+    resp = await client.get("/api/search", params={"q": q, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def _indexed(q: str) -> list:
+    """posts_fts 색인에서 직접 찾은 rowid (search_posts는 지워진 글을 걸러 내므로 색인을 직접 본다)"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            text("SELECT rowid FROM posts_fts WHERE posts_fts MATCH :q"), {"q": f'"{q}"'}
+        )
+        return sorted(result.scalars())
+
+
+@pytest.mark.parametrize("q", ['say "hi', "a*b", "NEAR(x", "cats AND", "col: x", "(x OR y)", "-x ^y"])
+async def test_fts_operators_are_matched_literally(client, admin, q):
+    headers = admin["headers"]
+    board_id = await create_board(client, headers)
+    hit = await create_post(client, board_id, headers, content=f"본문 {q} 끝")
+    await create_post(client, board_id, headers, content="연산자 없는 본문")
+
+    data = await _search(client, q, board_id=board_id)
+    assert [post["id"] for post in data["posts"]] == [hit]
+    assert data["total"] == 1
+    assert "<mark>" in data["posts"][0]["snippet"]
+
+
+@pytest.mark.parametrize("q", ["고양", "AB", "*", '"'])
+async def test_short_query_falls_back_to_like(client, admin, q):
+    headers = admin["headers"]
+    board_id = await create_board(client, headers)
+    hit = await create_post(client, board_id, headers, content=f"앞부분 x{q.lower()}y 뒷부분")
+    await create_post(client, board_id, headers, content="상관없는 본문")
+
+    # trigram 색인으로는 3글자 미만을 찾을 수 없다 — 찾았다면 LIKE로 찾은 것
+    data = await _search(client, q, board_id=board_id)
+    assert [post["id"] for post in data["posts"]] == [hit]
+    assert data["total"] == 1 and data["total_exact"]
+    assert "<mark>" in data["posts"][0]["snippet"]
+
+
+async def test_index_follows_update_and_delete(client, admin):
+    headers = admin["headers"]
+    board_id = await create_board(client, headers)
+    old, new = _word(), _word()
+    post_id = await create_post(client, board_id, headers, content=f"처음 본문 {old}")
+    assert await _indexed(old) == [post_id]
+
+    resp = await client.put(f"/api/posts/{post_id}", json={"content": f"고친 본문 {new}"}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert await _indexed(old) == []
+    assert await _indexed(new) == [post_id]
+    assert [post["id"] for post in (await _search(client, new))["posts"]] == [post_id]
+    assert (await _search(client, old))["posts"] == []
+
+    resp = await client.delete(f"/api/posts/{post_id}", headers=headers)
+    assert resp.status_code == 204
+    assert await _indexed(new) == []
+    assert (await _search(client, new))["posts"] == []
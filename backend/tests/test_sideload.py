@@ -0,0 +1,64 @@
+"""목록 사이드로드 — ?include= 응답 모양 (serialization.normalize)"""
+import pytest
+
+from conftest import create_board, create_post
+
+pytestmark = pytest.mark.anyio
+
+# front-page: 첫 페이지 캐시(front_page.py), activity: 일반 조회 경로
+PATHS = pytest.mark.parametrize("params", [{}, {"sort": "activity"}], ids=["front-page", "activity"])
+
+
+@pytest.fixture
+async def board_id(client, admin) -> int:
+    board_id = await create_board(client, admin["headers"])
+    for _ in range(3):
+        await create_post(client, board_id, admin["headers"])
+    return board_id
+
+
+async def _list(client, board_id: int, **params):
+    resp = await client.get(f"/api/boards/{board_id}/posts", params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+@PATHS
+async def test_include_both_moves_objects_to_maps(client, admin, board_id, params):
+    plain = await _list(client, board_id, **params)
+    body = await _list(client, board_id, include="authors,boards", **params)
+
+    assert set(body) == {"posts", "users", "boards"}
+    assert list(body["users"]) == [str(admin["id"])]
+    assert list(body["boards"]) == [str(board_id)]
+    assert body["users"][str(admin["id"])] == plain[0]["author"]
+    assert body["boards"][str(board_id)] == plain[0]["board"]
+    for row, full in zip(body["posts"], plain):
+        assert "author" not in row and "board" not in row
+        assert row == {k: v for k, v in full.items() if k not in ("author", "board")}
+
+
+@PATHS
+async def test_include_authors_keeps_board_nested(client, admin, board_id, params):
+    plain = await _list(client, board_id, **params)
+    body = await _list(client, board_id, include="authors", **params)
+
+    assert set(body) == {"posts", "users"}
+    for row, full in zip(body["posts"], plain):
+        assert "author" not in row
+        assert row["board"] == full["board"]
+        assert row["author_id"] == admin["id"]
+
+
+async def test_comments_include_authors(client, admin, post_id):
+    await client.post(f"/api/posts/{post_id}/comments", json={"content": "댓글"}, headers=admin["headers"])
+    resp = await client.get(f"/api/posts/{post_id}/comments", params={"include": "authors"})
+    body = resp.json()
+    assert set(body) == {"comments", "users"}
+    assert "author" not in body["comments"][0]
+    assert body["users"][str(admin["id"])]["username"] == admin["username"]
+
+
+async def test_unknown_include_rejected(client, board_id):
+    resp = await client.get(f"/api/boards/{board_id}/posts", params={"include": "comments"})
+    assert resp.status_code == 422
@@ -0,0 +1,208 @@
+"""이어 올리기 — 조각 업로드·재개·완료 (upload_sessions.py)"""
+import hashlib
+import os
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+import upload_sessions
+from conftest import create_user
+from database import AsyncSessionLocal
+from models import Attachment
+from routers.attachment_router import _create_attachment
+
+pytestmark = pytest.mark.anyio
+
+CHUNK_SIZE = 1024
+CONTENT = os.urandom(CHUNK_SIZE * 2 + 100)  # 조각 3개 (마지막은 100바이트)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(upload_sessions, "RESUMABLE_CHUNK_SIZE", CHUNK_SIZE)
+
+
+def _chunk(index: int, content: bytes = CONTENT) -> bytes:
+    return content[index * CHUNK_SIZE:(index + 1) * CHUNK_SIZE]
+
+
+async def _start(client, post_id: int, headers: dict, content: bytes = CONTENT, **extra) -> dict:
+    resp = await client.post(
+        f"/api/posts/{post_id}/uploads",
+        json={"filename": "data.bin", "file_size": len(content), **extra},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def _put(client, upload_id: str, index: int, data: bytes, headers: dict):
+    return await client.put(f"/api/uploads/{upload_id}/chunks/{index}", content=data, headers=headers)
+
+
+async def test_resume_after_missing_chunk(client, admin, post_id):
+    headers = admin["headers"]
+    upload = await _start(client, post_id, headers, sha256=hashlib.sha256(CONTENT).hexdigest())
+    upload_id = upload["upload_id"]
+    assert (upload["chunk_size"], upload["chunk_count"]) == (CHUNK_SIZE, 3)
+
+    # 가운데·마지막 조각만 보내고 "끊김"
+    assert (await _put(client, upload_id, 1, _chunk(1), headers)).status_code == 200
+    assert (await _put(client, upload_id, 2, _chunk(2), headers)).status_code == 200
+    status = (await client.get(f"/api/uploads/{upload_id}", headers=headers)).json()
+    assert status["received"] == [1, 2]
+    assert status["offset"] == 0
+
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 409
+
+    # 빠진 조각만 보내고 완료
+    resp = await _put(client, upload_id, 0, _chunk(0), headers)
+    assert resp.json()["offset"] == len(CONTENT)
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 201, resp.text
+    attachment = resp.json()
+    assert attachment["file_size"] == len(CONTENT)
+
+    resp = await client.get(f"/api/attachments/{attachment['id']}")
+    assert resp.content == CONTENT
+
+    # 완료된 세션은 없어진다
+    assert (await client.get(f"/api/uploads/{upload_id}", headers=headers)).status_code == 404
+
+
+async def test_hash_mismatch_keeps_chunks(client, admin, post_id):
+    """완료에 실패하면 세션이 되돌려져 틀린 조각만 다시 보낼 수 있다"""
+    headers = admin["headers"]
+    upload_id = (await _start(client, post_id, headers, sha256=hashlib.sha256(CONTENT).hexdigest()))["upload_id"]
+    await _put(client, upload_id, 0, _chunk(0), headers)
+    await _put(client, upload_id, 1, bytes(CHUNK_SIZE), headers)  # 틀린 내용
+    await _put(client, upload_id, 2, _chunk(2), headers)
+
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 422
+    status = (await client.get(f"/api/uploads/{upload_id}", headers=headers)).json()
+    assert status["received"] == [0, 1, 2]
+
+    await _put(client, upload_id, 1, _chunk(1), headers)
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 201, resp.text
+
+
+async def test_chunk_size_checked(client, admin, post_id):
+    headers = admin["headers"]
+    upload_id = (await _start(client, post_id, headers))["upload_id"]
+    assert (await _put(client, upload_id, 0, _chunk(0)[:-1], headers)).status_code == 400
+    assert (await _put(client, upload_id, 0, _chunk(0) + b"x", headers)).status_code == 413
+    assert (await _put(client, upload_id, 3, b"x", headers)).status_code == 422
+    status = (await client.get(f"/api/uploads/{upload_id}", headers=headers)).json()
+    assert status["received"] == []
+
+
+async def test_other_user_cannot_touch_session(client, admin, post_id):
+    upload_id = (await _start(client, post_id, admin["headers"]))["upload_id"]
+    other = await create_user(client)
+    assert (await client.get(f"/api/uploads/{upload_id}", headers=other["headers"])).status_code == 403
+    assert (await _put(client, upload_id, 0, _chunk(0), other["headers"])).status_code == 403
+    assert (await client.delete(f"/api/uploads/{upload_id}", headers=other["headers"])).status_code == 403
+
+
+async def test_same_content_shares_blob(client, admin, post_id):
+    """같은 내용은 blob 하나를 같이 쓴다 (blob_store.py)"""
+    headers = admin["headers"]
+    first = await client.post(
+        f"/api/posts/{post_id}/attachments", files={"file": ("a.bin", CONTENT)}, headers=headers
+    )
+    upload_id = (await _start(client, post_id, headers))["upload_id"]
+    for index in range(3):
+        await _put(client, upload_id, index, _chunk(index), headers)
+    second = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+
+    assert first.json()["sha256"] == second.json()["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+    assert first.json()["id"] != second.json()["id"]
+
+
+async def test_attachment_for_deleted_post_not_registered(client, admin, post_id):
+    """확인한 뒤 등록 전에 글이 지워졌으면 첨부 행을 남기지 않는다"""
+    resp = await client.post(f"/api/posts/{post_id}/attachments", files={"file": ("a.bin", CONTENT)},
+                             headers=admin["headers"])
+    attachment = resp.json()
+    await client.delete(f"/api/posts/{post_id}", headers=admin["headers"])
+
+    with pytest.raises(HTTPException) as exc:
+        await _create_attachment(
+            post_id, "a.bin", "application/octet-stream", attachment["sha256"], "x", len(CONTENT)
+        )
+    assert exc.value.status_code == 404
+    async with AsyncSessionLocal() as session:
+        count = await session.scalar(select(func.count()).select_from(Attachment).where(Attachment.post_id == post_id))
+    assert count == 0
+
+
+async def test_complete_retry_after_registration_failure(client, admin, post_id, monkeypatch):
+    """첨부 등록이 실패하면 조각이 남아 다시 완료할 수 있다"""
+    from routers import attachment_router
+
+    headers = admin["headers"]
+    upload_id = (await _start(client, post_id, headers))["upload_id"]
+    for index in range(3):
+        await _put(client, upload_id, index, _chunk(index), headers)
+
+    async def failing_create(*args):
+        raise HTTPException(status_code=503, detail="writer unavailable")
+
+    with monkeypatch.context() as m:
+        m.setattr(attachment_router, "_create_attachment", failing_create)
+        resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 503
+    status = (await client.get(f"/api/uploads/{upload_id}", headers=headers)).json()
+    assert status["received"] == [0, 1, 2]
+
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 201, resp.text
+
+
+async def test_chunk_for_vanished_session_leaves_no_tmp(client, admin, post_id, monkeypatch):
+    headers = admin["headers"]
+    upload_id = (await _start(client, post_id, headers))["upload_id"]
+
+    def vanished(src, dst):  # 조각을 쓰는 사이 다른 요청이 완료·취소했다
+        raise FileNotFoundError(dst)
+
+    with monkeypatch.context() as m:
+        m.setattr(upload_sessions.os, "replace", vanished)
+        resp = await _put(client, upload_id, 0, _chunk(0), headers)
+    assert resp.status_code == 404
+    assert list((upload_sessions.UPLOAD_SESSIONS_DIR / upload_id).glob("*.part")) == []
+
+
+async def test_read_connection_released_during_file_work(client, admin, post_id, monkeypatch):
+    """파일 복사/조립 동안에는 게시글 확인에 쓴 읽기 커넥션을 돌려놓는다"""
+    from database import read_engine
+    from routers import attachment_router
+
+    headers = admin["headers"]
+    checked_out = []
+
+    def recording(func):
+        async def wrapper(*args):
+            checked_out.append(read_engine.pool.checkedout())
+            return await func(*args)
+        return wrapper
+
+    monkeypatch.setattr(attachment_router, "save_upload", recording(attachment_router.save_upload))
+    monkeypatch.setattr(attachment_router, "assemble", recording(attachment_router.assemble))
+
+    resp = await client.post(
+        f"/api/posts/{post_id}/attachments", files={"file": ("a.txt", b"hello", "text/plain")}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+
+    upload_id = (await _start(client, post_id, headers))["upload_id"]
+    for index in range(3):
+        await _put(client, upload_id, index, _chunk(index), headers)
+    resp = await client.post(f"/api/uploads/{upload_id}/complete", headers=headers)
+    assert resp.status_code == 201, resp.text
+
+    assert checked_out == [0, 0]
@@ -0,0 +1,56 @@
+"""조회수 버퍼 — 종료할 때 증가분을 잃지 않는다 (view_counter.py)"""
+import asyncio
+
+import pytest
+
+from database import AsyncSessionLocal
+from models import Post
+from view_counter import ViewCounterBuffer
+from write_queue import write_coordinator
+
+pytestmark = pytest.mark.anyio
+
+
+async def _view_count(post_id: int) -> int:
+    async with AsyncSessionLocal() as session:
+        return (await session.get(Post, post_id)).view_count
+
+
+async def test_stop_during_periodic_flush_keeps_counts(client, post_id, monkeypatch):
+    submit = write_coordinator.submit
+    flushing = asyncio.Event()
+
+    async def slow_submit(work):
+        flushing.set()
+        await asyncio.sleep(0.2)  # 주기 반영이 진행 중일 때 stop()이 불린다
+        return await submit(work)
+
+    monkeypatch.setattr(write_coordinator, "submit", slow_submit)
+    before = await _view_count(post_id)
+    buffer = ViewCounterBuffer(interval=0.01, threshold=1000)
+    await buffer.start()
+    for _ in range(3):
+        buffer.hit(post_id)
+    await flushing.wait()
+    buffer.hit(post_id)  # 반영 중에 들어온 조회
+
+    await buffer.stop()
+    assert await _view_count(post_id) == before + 4
+    assert buffer.pending(post_id) == 0
+
+
+async def test_failed_flush_retried(client, post_id, monkeypatch):
+    async def failing_submit(work):
+        raise RuntimeError("writer down")
+
+    before = await _view_count(post_id)
+    buffer = ViewCounterBuffer(interval=60, threshold=1000)
+    buffer.hit(post_id)
+    buffer.hit(post_id)
+    with monkeypatch.context() as m:
+        m.setattr(write_coordinator, "submit", failing_submit)
+        await buffer.flush()
+    assert buffer.pending(post_id) == 2
+
+    await buffer.flush()
+    assert await _view_count(post_id) == before + 2
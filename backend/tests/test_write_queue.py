@@ -0,0 +1,86 @@
+"""쓰기 코디네이터 — 배치 안 SAVEPOINT 격리, writer가 없을 때 직접 실행 (write_queue.py)"""
+import asyncio
+import itertools
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from database import AsyncSessionLocal, WriterSessionLocal
+from models import Board
+from write_queue import WriteCoordinator
+
+pytestmark = pytest.mark.anyio
+
+_slugs = itertools.count(1)
+
+
+def _slug(prefix: str) -> str:
+    return f"wq-{prefix}-{next(_slugs)}"
+
+
+async def _existing(slugs: list) -> set:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Board.slug).where(Board.slug.in_(slugs)))
+        return set(result.scalars())
+
+
+@pytest.fixture
+async def coordinator(client):
+    """테스트 전용 writer (client로 마이그레이션을 마친 DB에 붙는다)"""
+    coordinator = WriteCoordinator(WriterSessionLocal, AsyncSessionLocal)
+    await coordinator.start()
+    yield coordinator
+    await coordinator.stop()
+
+
+def _insert(slug: str, sessions: list, fail: Exception = None):
+    async def work(session):
+        sessions.append(session)
+        session.add(Board(name=slug, slug=slug))
+        await session.flush()
+        if fail is not None:
+            raise fail
+        return slug
+    return work
+
+
+async def test_failing_unit_rolls_back_only_its_savepoint(coordinator):
+    taken = _slug("taken")
+    await coordinator.submit(_insert(taken, []))
+
+    sessions = []
+    ok = [_slug("ok") for _ in range(3)]
+    rejected = _slug("rejected")
+    units = [
+        _insert(ok[0], sessions),
+        _insert(rejected, sessions, fail=HTTPException(status_code=409, detail="conflict")),
+        _insert(ok[1], sessions),
+        _insert(taken, sessions),  # UNIQUE 위반 — DB 쪽 오류도 자기 SAVEPOINT만 되돌린다
+        _insert(ok[2], sessions),
+    ]
+    results = await asyncio.gather(*(coordinator.submit(u) for u in units), return_exceptions=True)
+
+    assert len(set(map(id, sessions))) == 1  # 모두 한 배치(한 트랜잭션)에서 실행됐다
+    assert [results[0], results[2], results[4]] == ok
+    assert isinstance(results[1], HTTPException) and results[1].status_code == 409
+    assert isinstance(results[3], IntegrityError)
+    assert await _existing([*ok, rejected, taken]) == {*ok, taken}
+
+
+async def test_submit_runs_directly_when_stopped(coordinator):
+    await coordinator.stop()
+    assert not coordinator.running
+
+    sessions = []
+    slug = _slug("direct")
+    assert await coordinator.submit(_insert(slug, sessions)) == slug
+    assert sessions[0].bind is AsyncSessionLocal.kw["bind"]  # writer 전용 엔진이 아닌 일반 쓰기 세션
+    assert await _existing([slug]) == {slug}
+
+    # 직접 실행에서 실패하면 커밋하지 않는다
+    failed = _slug("direct-failed")
+    with pytest.raises(HTTPException):
+        await coordinator.submit(_insert(failed, [], fail=HTTPException(status_code=400, detail="bad")))
+    assert await _existing([failed]) == set()
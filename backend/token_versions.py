@@ -0,0 +1,87 @@
+"""
+토큰 버전 표 (user id → users.token_version)
+
+액세스 토큰에는 sub 외에 username / display_name / role / created_at / ver(token_version)가 들어 있어
+서명만 확인하면 사용자를 DB나 user_cache 조회 없이 만들 수 있다 (dependencies.get_current_user).
+토큰이 아직 유효한지는 이 표의 버전과 토큰의 ver가 같은지로만 확인한다.
+
+    - 클레임에 들어가는 값(role, display_name 등)이나 비밀번호·활성 여부가 바뀌면
+      ORM 이벤트가 users.token_version을 올린다 → 이전에 발급한 토큰은 모두 거부된다
+      (권한 변경을 반영하려면 다시 로그인해야 한다)
+    - 이 프로세스에서 바꾸면 커밋 후 바로 표에서 지워져 다음 요청부터 거부된다
+    - TTL: TOKEN_VERSION_TTL초가 지난 항목은 DB에서 다시 읽는다
+      (다른 프로세스 — manage.py, seed.py 등 — 에서 올린 버전도 이 시간 안에 반영된다)
+
+(uvicorn 단일 프로세스 기준 — 표는 프로세스 메모리에 있다)
+"""
+import time
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from config import TOKEN_VERSION_TTL
+from models import User
+
+# 바뀌면 이전 토큰을 폐기해야 하는 컬럼 (토큰 클레임 + 보안 관련)
+_REVOKING_FIELDS = ("username", "display_name", "role", "created_at", "is_active", "password_hash")
+
+
+class TokenVersionTable:
+
+    def __init__(self, ttl: float = TOKEN_VERSION_TTL):
+        self._ttl = ttl
+        self._versions = {}  # user_id -> (만료 시각, token_version)
+
+    def get(self, user_id: int) -> Optional[int]:
+        entry = self._versions.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, user_id: int, version: int):
+        self._versions[user_id] = (time.monotonic() + self._ttl, version)
+
+    def invalidate(self, user_id: int):
+        self._versions.pop(user_id, None)
+
+    def clear(self):
+        self._versions.clear()
+
+
+token_versions = TokenVersionTable()
+
+
+def token_claims(user: User) -> dict:
+    """액세스 토큰에 넣을 사용자 클레임"""
+    return {
+        "sub": str(user.id),
+        "username": user.username,
+        "display_name": user.display_name,
+        "role": user.role.value,
+        "created_at": user.created_at.isoformat(),
+        "ver": user.token_version,
+    }
+
+
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper, connection, target):
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _REVOKING_FIELDS):
+        target.token_version = (target.token_version or 0) + 1
+
+
+# user_cache와 같은 방식 — flush 시점과 커밋 후에 지운다 (다음 요청이 DB에서 새 버전을 읽는다)
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_version(mapper, connection, target):
+    token_versions.invalidate(target.id)
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("revoked_users", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop("revoked_users", ()):
+        token_versions.invalidate(user_id)
@@ -0,0 +1,257 @@
+"""
+이어 올리기(resumable) 업로드 — 큰 첨부파일을 번호 붙은 조각으로 나눠 올린다
+
+    1. POST   /api/posts/{post_id}/uploads            세션 생성 (파일 이름·크기, 선택: sha256)
+    2. PUT    /api/uploads/{upload_id}/chunks/{n}     n번째 조각 (본문 = 바이트 그대로, 병렬 가능)
+    3. GET    /api/uploads/{upload_id}                받은 조각 번호와 offset(앞에서부터 이어진 바이트 수)
+    4. POST   /api/uploads/{upload_id}/complete       조각을 이어 붙여 blob 저장소에 넣고 Attachment 생성
+       DELETE /api/uploads/{upload_id}                취소
+
+조각 크기는 세션마다 RESUMABLE_CHUNK_SIZE로 정해지고 마지막 조각만 짧다.
+49MB에서 끊겨도 받지 못한 조각만 다시 보내면 되고, 요청 하나가 워커를 붙잡는 시간은 조각 하나 분량이다.
+
+세션은 UPLOAD_SESSIONS_DIR/<upload_id>/ 디렉토리 하나다 (DB 테이블 없음 — 다 올리기 전에는 첨부가 아니다).
+    session.json  세션 정보 (올린 사용자, 글, 파일 이름·크기, 만료 시각)
+    <n>.chunk     받은 조각 — 요청 본문을 스트리밍으로 <n>.<임의>.part에 쓴 뒤 rename (같은 조각을 다시
+                  보내도 반쯤 쓴 조각이 보이지 않는다)
+완료는 디렉토리를 먼저 <upload_id>.complete로 rename 해서 잡는다 — 동시에 두 번 완료해도 한 번만 된다.
+첨부 행이 커밋된 뒤에 지우고, 이어 붙이기나 등록이 실패하면 원래 이름으로 되돌려 다시 완료할 수 있게 한다.
+만료된 세션은 python manage.py gc-blobs가 지운다.
+"""
+import hashlib
+import json
+import os
+import secrets
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+import anyio
+from fastapi import HTTPException, status
+
+from blob_store import blob_store
+from config import MAX_FILE_SIZE, RESUMABLE_CHUNK_SIZE, UPLOAD_SESSION_TTL, UPLOAD_SESSIONS_DIR
+from uploads import too_large
+
+UPLOAD_ID_PATTERN = "^[0-9a-f]{32}$"
+
+
+@dataclass(frozen=True)
+class UploadSession:
+    upload_id: str
+    post_id: int
+    user_id: int
+    filename: str
+    file_type: str
+    file_size: int
+    chunk_size: int
+    sha256: Optional[str]
+    expires_at: float
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.file_size // self.chunk_size))
+
+    def chunk_length(self, index: int) -> int:
+        """index번째 조각의 크기 (마지막만 짧다)"""
+        return min(self.chunk_size, self.file_size - index * self.chunk_size)
+
+    @property
+    def directory(self) -> Path:
+        return UPLOAD_SESSIONS_DIR / self.upload_id
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Upload not found"
+    )
+
+
+def _create(session: UploadSession):
+    os.makedirs(session.directory)
+    (session.directory / "session.json").write_text(json.dumps(asdict(session)))
+
+
+async def create_session(
+    post_id: int, user_id: int, filename: str, file_type: str, file_size: int, sha256: Optional[str]
+) -> UploadSession:
+    if file_size > MAX_FILE_SIZE:
+        raise too_large()
+    session = UploadSession(
+        upload_id=secrets.token_hex(16),
+        post_id=post_id,
+        user_id=user_id,
+        filename=filename,
+        file_type=file_type,
+        file_size=file_size,
+        chunk_size=RESUMABLE_CHUNK_SIZE,
+        sha256=sha256,
+        expires_at=time.time() + UPLOAD_SESSION_TTL,
+    )
+    await anyio.to_thread.run_sync(_create, session)
+    return session
+
+
+def _load(upload_id: str) -> Optional[UploadSession]:
+    try:
+        data = json.loads((UPLOAD_SESSIONS_DIR / upload_id / "session.json").read_text())
+    except FileNotFoundError:
+        return None
+    return UploadSession(**data)
+
+
+async def load_session(upload_id: str, user_id: int) -> UploadSession:
+    """세션을 읽는다 (없거나 만료되면 404, 다른 사용자의 세션이면 403)"""
+    session = await anyio.to_thread.run_sync(_load, upload_id)
+    if session is None or session.expires_at < time.time():
+        raise _not_found()
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not your upload"
+        )
+    return session
+
+
+def received_chunks(session: UploadSession) -> list:
+    """받은 조각 번호 (정렬)"""
+    try:
+        names = os.listdir(session.directory)
+    except FileNotFoundError:
+        return []
+    return sorted(int(name.split(".")[0]) for name in names if name.endswith(".chunk"))
+
+
+def contiguous_offset(session: UploadSession, received: list) -> int:
+    """앞에서부터 빠짐없이 받은 바이트 수"""
+    count = 0
+    for expected, index in enumerate(received):
+        if index != expected:
+            break
+        count += 1
+    return min(count * session.chunk_size, session.file_size)
+
+
+async def write_chunk(session: UploadSession, index: int, body: AsyncIterator[bytes]):
+    """요청 본문을 index번째 조각으로 저장 (크기가 정확히 맞아야 한다)"""
+    if not 0 <= index < session.chunk_count:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Chunk index must be between 0 and {session.chunk_count - 1}"
+        )
+    expected = session.chunk_length(index)
+    tmp_path = session.directory / f"{index}.{secrets.token_hex(4)}.part"
+    size = 0
+    try:
+        async with await anyio.open_file(tmp_path, "wb") as out:
+            async for data in body:
+                size += len(data)
+                if size > expected:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Chunk {index} must be {expected} bytes"
+                    )
+                await out.write(data)
+        if size != expected:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Chunk {index} must be {expected} bytes, got {size}"
+            )
+        await anyio.to_thread.run_sync(os.replace, tmp_path, session.directory / f"{index}.chunk")
+    except FileNotFoundError:  # 그사이 완료·취소됨
+        tmp_path.unlink(missing_ok=True)
+        raise _not_found()
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _assemble(session: UploadSession, directory: Path) -> tuple:
+    """조각을 순서대로 이어 blob 저장소에 넣는다 → (sha256, stored_path)"""
+    digest = hashlib.sha256()
+    tmp_path = blob_store.temp_path()
+    try:
+        with open(tmp_path, "wb") as out:
+            for index in range(session.chunk_count):
+                with open(directory / f"{index}.chunk", "rb") as chunk:
+                    while data := chunk.read(1024 * 1024):
+                        digest.update(data)
+                        out.write(data)
+        sha256 = digest.hexdigest()
+        if session.sha256 and session.sha256 != sha256:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="sha256 does not match the uploaded content"
+            )
+        return sha256, blob_store.put(tmp_path, sha256)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _claimed(session: UploadSession) -> Path:
+    return UPLOAD_SESSIONS_DIR / f"{session.upload_id}.complete"
+
+
+async def assemble(session: UploadSession) -> tuple:
+    """
+    완료 — 세션 디렉토리를 잡고(rename) 조각을 이어 붙인다 → (sha256, stored_path)
+
+    빠진 조각이 있으면 409 (받은 조각은 그대로 두므로 이어서 보낼 수 있다).
+    잡은 디렉토리는 첨부 행이 커밋된 뒤 finish()로 지운다 — 등록이 실패하면 release()로 되돌린다.
+    """
+    received = await anyio.to_thread.run_sync(received_chunks, session)
+    missing = sorted(set(range(session.chunk_count)) - set(received))
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Missing chunks: {missing[:20]}"
+        )
+    claimed = _claimed(session)
+    try:
+        await anyio.to_thread.run_sync(os.rename, session.directory, claimed)
+    except FileNotFoundError:  # 다른 요청이 먼저 완료했다
+        raise _not_found()
+    try:
+        return await anyio.to_thread.run_sync(_assemble, session, claimed)
+    except BaseException:
+        # 실패하면(해시 불일치 등) 되돌려 둔다 — 조각을 다시 보내고 다시 완료할 수 있다
+        await release(session)
+        raise
+
+
+async def release(session: UploadSession):
+    """잡은 세션 디렉토리를 되돌린다 (요청이 취소된 경우에도 되돌리도록 취소를 막는다)"""
+    with anyio.CancelScope(shield=True):
+        await anyio.to_thread.run_sync(os.rename, _claimed(session), session.directory)
+
+
+async def finish(session: UploadSession):
+    """첨부 등록이 끝난 세션의 조각을 지운다"""
+    await anyio.to_thread.run_sync(shutil.rmtree, _claimed(session), True)
+
+
+async def discard(session: UploadSession):
+    """세션 취소 — 받은 조각과 함께 지운다"""
+    await anyio.to_thread.run_sync(shutil.rmtree, session.directory, True)
+
+
+def cleanup_expired(now: Optional[float] = None) -> int:
+    """만료된 세션 디렉토리를 지우고 개수 반환 (manage.py gc-blobs)"""
+    now = now or time.time()
+    removed = 0
+    if not UPLOAD_SESSIONS_DIR.exists():
+        return 0
+    for path in UPLOAD_SESSIONS_DIR.iterdir():
+        session = _load(path.name) if path.is_dir() else None
+        if session is None:
+            # 정보 파일이 없는 것은 만든 지 TTL이 지나면
+            if path.stat().st_mtime > now - UPLOAD_SESSION_TTL:
+                continue
+        elif session.expires_at > now:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
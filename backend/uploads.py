@@ -0,0 +1,51 @@
+"""
+첨부파일 저장 — 업로드 본문을 UPLOAD_CHUNK_SIZE씩 옮기며 SHA-256을 계산해 blob 저장소에 넣는다
+
+multipart 본문은 Starlette가 SpooledTemporaryFile(1MB 넘으면 디스크)에 받아 둔다.
+예전에는 그것을 file.read()로 통째로 메모리에 올리고 이벤트 루프에서 open().write() 했다.
+지금은 한 조각씩 읽고(UploadFile.read — 디스크면 스레드) 해시 갱신과 쓰기를 스레드에서 한다.
+메모리는 업로드당 조각 몇 개 크기를 넘지 않고 루프는 디스크 I/O·해시 계산을 기다리지 않는다.
+
+크기 제한은 옮기는 동안 센 바이트로 확인한다 — 넘으면 바로 멈추고 임시 파일을 지운다.
+임시 파일은 저장소 안(BLOBS_DIR/tmp)에 두고 다 쓴 뒤 blob_store.put()이 sha256 자리로
+rename 한다 (같은 파일 시스템이라 원자적 — 반쯤 쓴 파일이 blob 자리에 보이지 않는다).
+"""
+import hashlib
+
+import anyio
+from fastapi import HTTPException, UploadFile, status
+
+from blob_store import blob_store
+from config import MAX_FILE_SIZE, UPLOAD_CHUNK_SIZE
+
+
+def too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File size exceeds {MAX_FILE_SIZE / 1024 / 1024}MB limit"
+    )
+
+
+def _hash_and_write(digest, out, chunk: bytes):
+    digest.update(chunk)  # hashlib은 큰 입력에서 GIL을 놓는다
+    out.write(chunk)
+
+
+async def save_upload(file: UploadFile, max_size: int = MAX_FILE_SIZE) -> tuple:
+    """업로드 파일을 blob 저장소에 넣고 (sha256, stored_path, 크기) 반환 (max_size를 넘으면 413)"""
+    tmp_path = await anyio.to_thread.run_sync(blob_store.temp_path)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with await anyio.open_file(tmp_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise too_large()
+                await anyio.to_thread.run_sync(_hash_and_write, digest, out.wrapped, chunk)
+        sha256 = digest.hexdigest()
+        stored_path = await anyio.to_thread.run_sync(blob_store.put, tmp_path, sha256)
+    except BaseException:  # 413, 디스크 오류, 연결 끊김(취소) 모두
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return sha256, stored_path, size
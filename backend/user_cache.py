@@ -0,0 +1,109 @@
+"""
+인증 사용자 캐시 (user id → UserSnapshot)
+
+인증이 필요한 요청마다 users를 SELECT 하지 않도록 최근 사용자를 프로세스 메모리에 둔다.
+    - LRU: USER_CACHE_SIZE개를 넘으면 가장 오래 안 쓴 항목부터 버린다
+    - TTL: USER_CACHE_TTL초가 지난 항목은 다시 조회한다
+      (다른 프로세스 — manage.py, seed.py 등 — 에서 바꾼 내용도 이 시간 안에 반영된다)
+    - 이 프로세스에서 User를 수정/삭제하면 ORM 이벤트로 바로 무효화된다
+      (비활성화, 권한 변경 등)
+
+캐시에는 ORM 객체 대신 변경할 수 없는 스냅샷을 넣는다 — 요청 간에 공유되기 때문이다.
+(uvicorn 단일 프로세스 기준 — 캐시는 프로세스 메모리에 있다)
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import USER_CACHE_SIZE, USER_CACHE_TTL
+from models import User, Role
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """요청 처리에 필요한 사용자 정보 (비밀번호 해시 제외)"""
+    id: int
+    username: str
+    display_name: str
+    role: Role
+    is_active: bool
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            username=user.username,
+            display_name=user.display_name,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "UserSnapshot":
+        """검증된 토큰 클레임으로 만든다 (token_versions.token_claims 참고)"""
+        return cls(
+            id=int(payload["sub"]),
+            username=payload["username"],
+            display_name=payload["display_name"],
+            role=Role(payload["role"]),
+            is_active=True,  # 비활성화하면 token_version이 올라 토큰이 거부된다
+            created_at=datetime.fromisoformat(payload["created_at"]),
+        )
+
+
+class UserCache:
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()  # user_id -> (만료 시각, UserSnapshot)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[UserSnapshot]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, snapshot: UserSnapshot):
+        self._entries[snapshot.id] = (time.monotonic() + self._ttl, snapshot)
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+user_cache = UserCache()
+
+
+# ORM으로 User를 바꾸면 flush 시점과 커밋 후에 무효화한다.
+# (flush와 커밋 사이에 다른 요청이 옛 값을 다시 캐시할 수 있어서 커밋 후에 한 번 더)
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    user_cache.invalidate(target.id)
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("invalidated_users", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop("invalidated_users", ()):
+        user_cache.invalidate(user_id)
@@ -0,0 +1,107 @@
+"""
+조회수 write-behind 버퍼
+
+get_post가 읽을 때마다 커밋하지 않도록 조회수 증가분을 메모리에 모아 두었다가
+주기적으로(또는 일정 개수가 쌓이면) 한 번의 UPDATE ... CASE 문으로 반영한다.
+
+    UPDATE posts SET view_count = view_count + CASE id WHEN 3 THEN 5 WHEN 7 THEN 1 END
+    WHERE id IN (3, 7)
+
+반영은 쓰기 코디네이터를 통하므로 다른 쓰기와 잠금을 다투지 않는다.
+서버 종료 시 lifespan에서 stop()을 불러 남은 증가분을 모두 반영한다.
+(uvicorn 단일 프로세스 기준 — 버퍼는 프로세스 메모리에 있다)
+"""
+import asyncio
+import logging
+
+from sqlalchemy import update, case
+
+from config import VIEW_FLUSH_INTERVAL, VIEW_FLUSH_THRESHOLD
+from models import Post
+from write_queue import write_coordinator
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounterBuffer:
+
+    def __init__(self, interval: float = VIEW_FLUSH_INTERVAL, threshold: int = VIEW_FLUSH_THRESHOLD):
+        self._interval = interval
+        self._threshold = threshold
+        self._pending = {}  # post_id -> 아직 반영 안 된 조회수
+        self._total = 0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task = None
+        self._flush_task: asyncio.Task = None
+        self._stopping: asyncio.Event = None
+
+    def hit(self, post_id: int) -> int:
+        """조회 1회 기록 후 해당 글의 미반영 조회수 반환"""
+        count = self._pending.get(post_id, 0) + 1
+        self._pending[post_id] = count
+        self._total += 1
+        if self._total >= self._threshold and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+        return count
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self):
+        """쌓인 증가분을 한 번의 UPDATE로 반영"""
+        async with self._lock:
+            if not self._pending:
+                return
+            counts = self._pending
+            self._pending = {}
+            self._total = 0
+
+            stmt = (
+                update(Post)
+                .where(Post.id.in_(list(counts)))
+                .values(
+                    view_count=Post.view_count + case(counts, value=Post.id, else_=0),
+                    updated_at=Post.updated_at,  # 조회는 글 수정이 아니다
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+            async def work(session):
+                await session.execute(stmt)
+
+            try:
+                await write_coordinator.submit(work)
+            except Exception:
+                # 실패한 증가분은 버리지 않고 다음 반영 때 다시 시도
+                logger.exception("view count flush failed")
+                for post_id, count in counts.items():
+                    self._pending[post_id] = self._pending.get(post_id, 0) + count
+                    self._total += count
+
+    async def start(self):
+        """주기적 반영 태스크 시작 (lifespan에서 호출)"""
+        if self._task is None:
+            self._stopping = asyncio.Event()  # 이벤트 루프마다 새로 (테스트는 루프를 여러 번 띄운다)
+            self._task = asyncio.create_task(self._run(), name="view-counter-flush")
+
+    async def stop(self):
+        """주기 태스크 종료 후 남은 증가분 반영"""
+        if self._task is not None:
+            # cancel()하지 않는다 — 반영 도중에 취소되면 _pending에서 꺼낸 증가분을 잃는다
+            self._stopping.set()
+            await self._task
+            self._task = None
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self._interval)
+            except asyncio.TimeoutError:
+                await self.flush()
+
+
+view_counter = ViewCounterBuffer()
@@ -0,0 +1,140 @@
+"""
+쓰기 코디네이터 — SQLite 쓰기를 하나의 writer 태스크로 모은다
+
+라우터는 "작업 단위"(session을 받아 결과를 돌려주는 async 함수)를 submit()하고,
+writer 태스크가 큐에 쌓인 작업들을 한 트랜잭션에서 처리한 뒤 한 번에 커밋한다.
+(group commit — 동시 쓰기가 잠금을 두고 경쟁하지 않고, 커밋/fsync 횟수도 줄어든다)
+
+작업 단위마다 SAVEPOINT를 잡으므로 한 작업이 실패(HTTPException 등)해도
+같은 배치의 다른 작업에는 영향이 없고, 예외는 해당 요청에 그대로 전달된다.
+
+사용법:
+    async def work(session):
+        session.add(obj)
+        await session.flush()
+        return obj
+
+    result = await write_coordinator.submit(work)
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import WRITE_QUEUE_ENABLED, WRITE_BATCH_SIZE
+from database import AsyncSessionLocal, WriterSessionLocal
+
+logger = logging.getLogger(__name__)
+
+WorkUnit = Callable[[AsyncSession], Awaitable[Any]]
+
+_STOP = object()
+
+
+class WriteCoordinator:
+
+    def __init__(self, batch_session_factory, direct_session_factory, max_batch: int = WRITE_BATCH_SIZE):
+        self._batch_session_factory = batch_session_factory
+        self._direct_session_factory = direct_session_factory
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue = None
+        self._task: asyncio.Task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """writer 태스크 시작 (lifespan에서 호출)"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="write-coordinator")
+
+    async def stop(self):
+        """큐에 남은 작업을 모두 처리한 뒤 writer 종료"""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(self, work: WorkUnit) -> Any:
+        """작업 단위를 writer에 넘기고 커밋된 결과를 기다린다"""
+        if not self.running:
+            # writer가 없으면 (비활성화, 스크립트/테스트) 바로 실행 후 커밋
+            async with self._direct_session_factory() as session:
+                result = await work(session)
+                await session.commit()
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((work, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            # 대기 중인 작업을 최대 max_batch개까지 한 배치로 묶는다
+            batch = [item]
+            stop_after = False
+            while len(batch) < self._max_batch and not self._queue.empty():
+                nxt = self._queue.get_nowait()
+                if nxt is _STOP:
+                    stop_after = True
+                    break
+                batch.append(nxt)
+
+            try:
+                await self._run_batch(batch)
+            except Exception as e:  # writer 태스크는 죽으면 안 된다
+                logger.exception("write batch failed")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+            if stop_after:
+                return
+
+    async def _run_batch(self, batch: list):
+        outcomes = []
+        async with self._batch_session_factory() as session:
+            for work, future in batch:
+                if future.done():  # 요청이 이미 취소됨
+                    continue
+                try:
+                    async with session.begin_nested():
+                        result = await work(session)
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+
+            try:
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                for future, _, _ in outcomes:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+write_coordinator = WriteCoordinator(WriterSessionLocal, AsyncSessionLocal)
+
+
+async def start_write_coordinator():
+    """설정에 따라 writer 시작 (PostgreSQL 등 다중 writer DB에서는 끌 수 있다)"""
+    if WRITE_QUEUE_ENABLED:
+        await write_coordinator.start()
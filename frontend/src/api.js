@@ -17,4 +17,16 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// ?include=authors,boards 응답({posts, users, boards})을 중첩 객체가 있는 행 목록으로 되돌린다
+// 예) denormalize(response.data, 'posts') → [{ ...post, author: {...}, board: {...} }, ...]
+export function denormalize(data, key) {
+  const users = data.users || {};
+  const boards = data.boards || {};
+  return data[key].map((row) => ({
+    ...row,
+    ...(users[row.author_id] && { author: users[row.author_id] }),
+    ...(boards[row.board_id] && { board: boards[row.board_id] }),
+  }));
+}
+
 export default api;
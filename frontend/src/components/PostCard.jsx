@@ -5,12 +5,15 @@ export default function PostCard({ post, onClick }) {
       className="p-4 bg-white border border-gray-300 rounded hover:shadow-lg cursor-pointer transition"
     >
       <h3 className="text-lg font-bold mb-2">{post.title}</h3>
+      {post.excerpt && <p className="text-gray-700 text-sm mb-2">{post.excerpt}</p>}
       <div className="text-gray-600 text-sm">
         <span>{post.author?.display_name}</span>
         <span className="mx-2">•</span>
         <span>{new Date(post.created_at).toLocaleString('ko-KR', { year:'numeric', month:'2-digit', day:'2-digit', hour:'2-digit', minute:'2-digit' })}</span>
         <span className="mx-2">•</span>
         <span>조회: {post.view_count}</span>
+        <span className="mx-2">•</span>
+        <span>댓글: {post.comment_count ?? 0}</span>
       </div>
     </div>
   );
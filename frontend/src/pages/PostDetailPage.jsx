@@ -96,11 +96,19 @@ export default function PostDetailPage() {
                 {post.attachments.map((att) => (
                   <li key={att.id}>
                     <a
-                      href={`http://localhost:8000/api/attachments/${att.id}`}
+                      href={`http://localhost:8000/api/attachments/${att.id}${att.sha256 ? `?v=${att.sha256}` : ''}`}
                       target="_blank"
                       rel="noopener noreferrer"
                       className="text-blue-500 underline"
                     >
+                      {att.file_type?.startsWith('image/') && (
+                        <img
+                          src={`http://localhost:8000/api/attachments/${att.id}?variant=thumb${att.sha256 ? `&v=${att.sha256}` : ''}`}
+                          alt={att.filename}
+                          loading="lazy"
+                          className="max-h-40 my-2 rounded"
+                        />
+                      )}
                       {att.filename}
                     </a>
                   </li>
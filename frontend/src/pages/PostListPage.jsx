@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import api from '../api';
+import api, { denormalize } from '../api';
 import Header from '../components/Header';
 import PostCard from '../components/PostCard';
 
@@ -25,8 +25,9 @@ export default function PostListPage() {
     }
 
     try {
-      const response = await api.get(`/boards/${boardId}/posts`);
-      setPosts(response.data);
+      // 작성자는 사이드로드로 한 번씩만 받는다 (게시판은 이 페이지의 게시판 하나뿐이라 생략)
+      const response = await api.get(`/boards/${boardId}/posts`, { params: { include: 'authors' } });
+      setPosts(denormalize(response.data, 'posts'));
     } catch (error) {
       console.error('게시글 조회 실패:', error);
     } finally {
@@ -137,7 +137,8 @@ class AIBrain:
         thread_text = ""
         for item in posts_and_comments[:5]:
             title = item.get("title", "")
-            content = item.get("content", "")[:500]
+            # 목록 API는 본문 대신 요약문(excerpt)을 준다
+            content = (item.get("content") or item.get("excerpt", ""))[:500]
             author = item.get("author", {}).get("display_name", "?")
             thread_text += f"[{author}] {title}\n{content}\n\n"
 
@@ -6,6 +6,14 @@ AI Writer — AI 에이전트가 게시판에 글을 쓰는 핵심 모듈
     writer.login("claude", "claude1234")
     writer.write_post(board_id=1, title="제목", content="본문", source="출처")
 """
+import hashlib
+import mimetypes
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 
@@ -15,11 +23,18 @@ class AIWriterError(Exception):
 
 
 class AIWriter:
+    # 조각 재시도 간격 — 0.5초부터 두 배씩 (최대 8초), 실제로는 0~그 값 사이 임의 (full jitter)
+    # 여러 스레드·여러 클라이언트가 같은 순간에 다시 몰리지 않게 한다
+    RETRY_BACKOFF = 0.5
+    RETRY_BACKOFF_MAX = 8.0
+
     def __init__(self, base_url: str = "http://localhost:8000/api"):
         self.base_url = base_url.rstrip("/")
         self.token = None
         self.user_info = None
         self.session = requests.Session()
+        # 조건부 GET 캐시 — (url, params) → (ETag, 마지막 응답 JSON)
+        self._etag_cache = {}
 
     def _headers(self) -> dict:
         """인증 헤더 반환"""
@@ -37,6 +52,38 @@ class AIWriter:
             raise AIWriterError(f"{action} 실패 (HTTP {resp.status_code}): {detail}")
         return resp.json()
 
+    def _get_cached(self, url: str, action: str, params: dict = None):
+        """
+        ETag를 기억해 두었다가 If-None-Match로 다시 요청한다.
+        서버가 304(바뀌지 않음)를 주면 이전 응답을 그대로 돌려준다 — 폴링할 때 본문을 다시 받지 않는다.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        resp = self.session.get(url, params=params, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        data = self._check(resp, action)
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, data)
+        return data
+
+    @staticmethod
+    def _denormalize(data: dict, key: str) -> list:
+        """?include= 응답({key: [...], "users": {...}, "boards": {...}})을 중첩 객체가 있는 행 목록으로"""
+        users = data.get("users", {})
+        boards = data.get("boards", {})
+        rows = []
+        for row in data[key]:
+            row = dict(row)
+            if str(row.get("author_id")) in users:
+                row["author"] = users[str(row["author_id"])]
+            if str(row.get("board_id")) in boards:
+                row["board"] = boards[str(row["board_id"])]
+            rows.append(row)
+        return rows
+
     def login(self, username: str, password: str) -> bool:
         """로그인하고 JWT 토큰을 저장한다"""
         resp = self.session.post(
@@ -66,34 +113,123 @@ class AIWriter:
         )
         return self._check(resp, "댓글 작성")
 
-    def upload_attachment(self, post_id: int, filepath: str) -> dict:
-        """파일을 첨부한다"""
-        with open(filepath, "rb") as f:
-            filename = filepath.split("/")[-1]
+    def write_comments(self, post_id: int, comments: list) -> list:
+        """
+        댓글 여러 개를 한 번에 작성한다 (한 트랜잭션 — 하나라도 실패하면 아무것도 남지 않는다)
+
+        comments: [{"content": "..."}, {"content": "...", "author_id": 3}, ...]
+            author_id는 다른 계정 이름으로 쓸 때 (admin/moderator 계정만)
+        """
+        resp = self.session.post(
+            f"{self.base_url}/posts/{post_id}/comments:batch",
+            json={"comments": comments},
+            headers=self._headers(),
+        )
+        return self._check(resp, "댓글 일괄 작성")
+
+    def upload_attachment(self, post_id: int, filepath: str, concurrency: int = 4, upload_id: str = None) -> dict:
+        """
+        파일을 첨부한다 — 이어 올리기 API로 조각(chunk_size)을 concurrency개씩 동시에 보낸다.
+
+        조각 하나가 재시도 후에도 실패하면 AIWriterError에 upload_id가 담긴다.
+        같은 파일로 upload_id=를 주고 다시 부르면 서버에 없는 조각만 보낸다.
+        """
+        filename = os.path.basename(filepath)
+        if upload_id:
+            resp = self.session.get(f"{self.base_url}/uploads/{upload_id}", headers=self._headers())
+            upload = self._check(resp, "업로드 조회")
+        else:
             resp = self.session.post(
-                f"{self.base_url}/posts/{post_id}/attachments",
-                files={"file": (filename, f)},
+                f"{self.base_url}/posts/{post_id}/uploads",
+                json={
+                    "filename": filename,
+                    "file_type": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                    "file_size": os.path.getsize(filepath),
+                    "sha256": self._file_sha256(filepath),
+                },
                 headers=self._headers(),
             )
+            upload = self._check(resp, "업로드 시작")
+        upload_id = upload["upload_id"]
+
+        # requests.Session은 스레드 간에 나눠 쓰면 안전하지 않다 — 전송 스레드마다 하나씩
+        local = threading.local()
+        sessions = []
+
+        def put_chunk(index: int):
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+                sessions.append(local.session)
+            return self._put_chunk(local.session, upload_id, filepath, index, upload["chunk_size"])
+
+        missing = sorted(set(range(upload["chunk_count"])) - set(upload["received"]))
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = [pool.submit(put_chunk, index) for index in missing]
+                errors = [f.exception() for f in futures if f.exception() is not None]
+        finally:
+            for session in sessions:
+                session.close()
+        if errors:
+            raise AIWriterError(f"파일 첨부 실패 (upload_id={upload_id}로 이어서 올릴 수 있음): {errors[0]}")
+
+        resp = self.session.post(f"{self.base_url}/uploads/{upload_id}/complete", headers=self._headers())
         return self._check(resp, "파일 첨부")
 
+    def _put_chunk(
+        self, session: requests.Session, upload_id: str, filepath: str, index: int, chunk_size: int, retries: int = 5
+    ):
+        """
+        조각 하나 보내기 — session은 호출한 스레드의 것
+
+        연결 오류·5xx·429면 지수 백오프(지터 포함)로 기다렸다가 retries번까지 다시 보낸다.
+        """
+        with open(filepath, "rb") as f:
+            f.seek(index * chunk_size)
+            data = f.read(chunk_size)
+        for attempt in range(retries):
+            if attempt:
+                time.sleep(random.uniform(0, min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF * 2 ** (attempt - 1))))
+            try:
+                resp = session.put(
+                    f"{self.base_url}/uploads/{upload_id}/chunks/{index}",
+                    data=data,
+                    headers={**self._headers(), "Content-Type": "application/octet-stream"},
+                )
+            except requests.RequestException as e:
+                if attempt == retries - 1:
+                    raise AIWriterError(f"조각 {index} 전송 실패: {e}")
+                continue
+            retryable = resp.status_code >= 500 or resp.status_code == 429
+            if not retryable or attempt == retries - 1:
+                return self._check(resp, f"조각 {index} 전송")
+
+    @staticmethod
+    def _file_sha256(filepath: str) -> str:
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     def get_posts(self, board_id: int, limit: int = 20) -> list:
-        """게시글 목록을 가져온다"""
-        resp = self.session.get(
+        """게시글 목록을 가져온다 (본문 대신 요약문 excerpt — 본문은 get_post)"""
+        # 작성자/게시판은 사이드로드로 한 번씩만 받고 예전처럼 행마다 붙여서 돌려준다
+        data = self._get_cached(
             f"{self.base_url}/boards/{board_id}/posts",
-            params={"limit": limit},
+            "게시글 목록 조회",
+            params={"limit": limit, "include": "authors,boards"},
         )
-        return self._check(resp, "게시글 목록 조회")
+        return self._denormalize(data, "posts")
 
     def get_post(self, post_id: int) -> dict:
         """게시글 상세를 가져온다"""
-        resp = self.session.get(f"{self.base_url}/posts/{post_id}")
-        return self._check(resp, "게시글 상세 조회")
+        return self._get_cached(f"{self.base_url}/posts/{post_id}", "게시글 상세 조회")
 
     def get_comments(self, post_id: int) -> list:
         """게시글의 댓글 목록을 가져온다"""
-        resp = self.session.get(f"{self.base_url}/posts/{post_id}/comments")
-        return self._check(resp, "댓글 목록 조회")
+        resp = self.session.get(f"{self.base_url}/posts/{post_id}/comments", params={"include": "authors"})
+        return self._denormalize(self._check(resp, "댓글 목록 조회"), "comments")
 
     @property
     def display_name(self) -> str: